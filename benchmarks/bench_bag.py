@@ -0,0 +1,50 @@
+"""
+Compares totalling a stream of mixed-currency Money instances with a MoneyBag
+against grouping them by currency and calling sum() on each group.
+
+Run with: python benchmarks/bench_bag.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from workloads import make_moneys
+
+from moneyed import Money
+from moneyed.bag import MoneyBag
+
+
+def main(count: int = 100_000) -> None:
+    moneys = make_moneys(count)
+
+    def with_grouping() -> None:
+        groups: dict[str, list[Money]] = {}
+        for money in moneys:
+            groups.setdefault(money.currency.code, []).append(money)
+        for values in groups.values():
+            sum(values)
+
+    def with_bag_iadd() -> None:
+        bag = MoneyBag()
+        for money in moneys:
+            bag += money
+
+    def with_bag_update() -> None:
+        MoneyBag(moneys)
+
+    print(f"Totalling {count:,} values")  # noqa: T201
+    for label, func in [
+        ("group and sum()", with_grouping),
+        ("MoneyBag +=", with_bag_iadd),
+        ("MoneyBag(values)", with_bag_update),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(  # noqa: T201
+            f"{label:<26}{seconds:>8.3f} s{seconds / count * 1e6:>10.2f} µs/value"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
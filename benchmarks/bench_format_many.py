@@ -0,0 +1,49 @@
+"""
+Compares formatting a list of Money instances with format_many() against calling
+format_money(), and babel's format_currency(), for each of them.
+
+Run with: python benchmarks/bench_format_many.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from babel.numbers import format_currency
+from workloads import make_moneys
+
+from moneyed.l10n import format_many, format_money
+
+LOCALE = "de_DE"
+
+
+def main(count: int = 100_000) -> None:
+    moneys = make_moneys(count)
+
+    def with_babel() -> None:
+        for money in moneys:
+            format_currency(money.amount, money.currency.code, locale=LOCALE)
+
+    def with_format_money() -> None:
+        for money in moneys:
+            format_money(money, locale=LOCALE)
+
+    def with_format_many() -> None:
+        for _ in format_many(moneys, locale=LOCALE):
+            pass
+
+    print(f"Formatting {count:,} values in {LOCALE}")  # noqa: T201
+    for label, func in [
+        ("babel format_currency()", with_babel),
+        ("format_money()", with_format_money),
+        ("format_many()", with_format_many),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(  # noqa: T201
+            f"{label:<26}{seconds:>8.3f} s{seconds / count * 1e6:>10.2f} µs/value"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Measures the time it takes to import moneyed in a fresh interpreter, as reported by
+python -X importtime.
+
+Run with: python benchmarks/bench_import.py [runs]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+
+def import_time(statement: str, module: str) -> int:
+    """
+    Runs the statement in a fresh interpreter and returns the cumulative time in
+    microseconds it took to import the module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and cumulative.strip().isdigit():
+            return int(cumulative)
+    raise RuntimeError(f"{module} was not imported by {statement!r}")
+
+
+def main(runs: int = 20) -> None:
+    print(f"Median import time over {runs} runs")  # noqa: T201
+    for label, statement, module in [
+        ("import moneyed", "import moneyed", "moneyed"),
+        ("import moneyed.l10n", "import moneyed.l10n", "moneyed"),
+        ("import babel.numbers", "import babel.numbers", "babel.numbers"),
+    ]:
+        times = [import_time(statement, module) for _ in range(runs)]
+        print(f"{label:<24}{statistics.median(times) / 1000:>8.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
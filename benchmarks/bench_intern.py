@@ -0,0 +1,85 @@
+"""
+Measures the memory used by a product catalog whose prices are built with Money()
+and with Money.intern(), and the time it takes to build them.
+
+Catalog prices repeat heavily: a few thousand retail price points, like 9.99 or
+24.50, with the cheaper ones the most common, in a handful of currencies.
+
+Run with: python benchmarks/bench_intern.py [count]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from moneyed import Money
+from moneyed.classes import _interned
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CURRENCY_CODES = ["EUR", "EUR", "EUR", "USD", "USD", "GBP", "CHF", "SEK"]
+ENDINGS = [".99", ".99", ".99", ".95", ".49", ".00"]
+
+
+def make_catalog(count: int) -> list[tuple[str, str]]:
+    """
+    Returns the price and currency of every item, with whole prices from 1 to 1000
+    following a Zipf-like distribution.
+    """
+    rng = random.Random(0)
+    wholes = range(1, 1001)
+    weights = [1 / whole for whole in wholes]
+    prices = [
+        f"{whole}{rng.choice(ENDINGS)}"
+        for whole in rng.choices(wholes, weights, k=count)
+    ]
+    return [(price, rng.choice(CURRENCY_CODES)) for price in prices]
+
+
+def measure(func: Callable[[], list[Money]]) -> tuple[float, float]:
+    """
+    Returns the time taken by the function in seconds, and the memory it allocates in
+    bytes, not counting the list it returns.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    # Tracing allocations slows everything down, so measure memory apart.
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    moneys = func()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, after - before - sys.getsizeof(moneys)
+
+
+def main(count: int = 1_000_000) -> None:
+    catalog = make_catalog(count)
+    distinct = len(set(catalog))
+    print(  # noqa: T201
+        f"Building {count:,} catalog prices, {distinct:,} distinct values"
+    )
+
+    def build() -> list[Money]:
+        return [Money(price, code) for price, code in catalog]
+
+    def build_interned() -> list[Money]:
+        # Start from an empty cache, so that the shared instances are counted.
+        _interned.cache_clear()
+        return [Money.intern(price, code) for price, code in catalog]
+
+    for label, func in [("Money()", build), ("Money.intern()", build_interned)]:
+        seconds, size = measure(func)
+        print(  # noqa: T201
+            f"{label:<18}{seconds:>8.3f} s{size / 2**20:>10.1f} MiB"
+            f"{size / count:>8.1f} bytes/price"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
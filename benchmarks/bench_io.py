@@ -0,0 +1,94 @@
+"""
+Compares reading a CSV ledger with read_money_csv(), as Money instances and as
+MoneyArray chunks, against loading it with csv.DictReader and building Money from
+every row, measuring the time and peak memory it takes to total the amounts.
+
+Run with: python benchmarks/bench_io.py [rows]
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+
+from moneyed import Money
+from moneyed.bag import MoneyBag
+from moneyed.io import read_money_csv
+from moneyed.parallel import parallel_totals
+
+
+def write_ledger(path: str, rows: int) -> None:
+    rng = random.Random(0)
+    currencies = ["EUR", "EUR", "EUR", "USD", "GBP", "JPY"]
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["date", "amount", "currency", "memo"])
+        for i in range(rows):
+            currency = rng.choice(currencies)
+            amount = rng.randint(-(10**6), 10**6)
+            writer.writerow(
+                [
+                    f"2024-01-{i % 28 + 1:02d}",
+                    amount if currency == "JPY" else f"{amount / 100:.2f}",
+                    currency,
+                    f"Payment {i}",
+                ]
+            )
+
+
+def main(rows: int = 1_000_000) -> None:
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    try:
+        write_ledger(path, rows)
+
+        def with_dict_reader() -> None:
+            with open(path, newline="") as file:
+                moneys = [
+                    Money(Decimal(str(row["amount"])), row["currency"])
+                    for row in csv.DictReader(file)
+                ]
+            MoneyBag(moneys)
+
+        def with_money() -> None:
+            MoneyBag(read_money_csv(path, "amount", "currency"))
+
+        def with_mmap() -> None:
+            MoneyBag(read_money_csv(path, "amount", "currency", mmap=True))
+
+        def with_chunks() -> None:
+            bag = MoneyBag()
+            for chunk in read_money_csv(path, "amount", "currency", 100_000):
+                bag.merge(parallel_totals(chunk, workers=1))
+
+        size = os.path.getsize(path)
+        print(f"Totalling {rows:,} rows, {size / 2**20:.0f} MiB")  # noqa: T201
+        for label, func in [
+            ("DictReader + list", with_dict_reader),
+            ("read_money_csv()", with_money),
+            ("read_money_csv(mmap)", with_mmap),
+            ("read_money_csv(chunks)", with_chunks),
+        ]:
+            start = time.perf_counter()
+            func()
+            seconds = time.perf_counter() - start
+            # Tracing allocations slows everything down, so measure memory apart.
+            tracemalloc.start()
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(  # noqa: T201
+                f"{label:<26}{seconds:>8.3f} s{peak / 2**20:>10.1f} MiB peak"
+            )
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
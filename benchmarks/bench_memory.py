@@ -0,0 +1,66 @@
+"""
+Measures the memory used per Money and Currency instance.
+
+The slotted classes are compared against subclasses that have an instance
+__dict__, which is how Money and Currency were laid out before they declared
+__slots__.
+
+Run with: python benchmarks/bench_memory.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from decimal import Decimal
+
+from moneyed import Currency, Money, get_currency
+
+
+class DictMoney(Money):
+    pass
+
+
+class DictCurrency(Currency):
+    pass
+
+
+def bytes_per_instance(factory: type[Money], count: int) -> float:
+    currency = get_currency("USD")
+    # Share the Decimal amounts so that only the Money instances are measured.
+    amounts = [Decimal(i) for i in range(count)]
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory(amount, currency) for amount in amounts]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Don't count the list holding the instances.
+    return (end - start - sys.getsizeof(instances)) / count
+
+
+def currency_bytes_per_instance(factory: type[Currency], count: int) -> float:
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [factory("XTS", "963", 100) for _ in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start - sys.getsizeof(instances)) / count
+
+
+def main(count: int = 1_000_000) -> None:
+    print(f"Bytes per instance, averaged over {count:,} instances")  # noqa: T201
+    rows = [
+        ("Money (with __dict__)", bytes_per_instance(DictMoney, count)),
+        ("Money (slotted)", bytes_per_instance(Money, count)),
+        (
+            "Currency (with __dict__)",
+            currency_bytes_per_instance(DictCurrency, count // 10),
+        ),
+        ("Currency (slotted)", currency_bytes_per_instance(Currency, count // 10)),
+    ]
+    for label, size in rows:
+        print(f"{label:<28}{size:>8.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Reports how totalling Money by currency with moneyed.parallel scales with the
+number of worker processes, for a list of Money instances and for a MoneyArray,
+next to the builtin sum() over every currency.
+
+Run with: python benchmarks/bench_parallel.py [count] [max workers]
+
+The number of workers defaults to the number of processors.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+from workloads import make_moneys
+
+from moneyed import Money
+from moneyed.arrays import MoneyArray
+from moneyed.parallel import parallel_totals
+
+
+def main(count: int = 2_000_000, max_workers: int = 0) -> None:
+    max_workers = max_workers or os.cpu_count() or 1
+    # A MoneyArray holds whole minor units, which JPY amounts must be rounded to.
+    moneys = [money.round_to_currency() for money in make_moneys(count)]
+    array = MoneyArray(moneys)
+
+    def with_sum() -> None:
+        groups: dict[str, list[Money]] = {}
+        for money in moneys:
+            groups.setdefault(money.currency.code, []).append(money)
+        for values in groups.values():
+            sum(values)
+
+    def report(label: str, func: object) -> None:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))  # type: ignore[arg-type]
+        print(  # noqa: T201
+            f"{label:<26}{seconds:>8.3f} s{seconds / count * 1e6:>10.3f} µs/value"
+        )
+
+    print(f"Totalling {count:,} values")  # noqa: T201
+    report("group and sum()", with_sum)
+    workers = 1
+    while True:
+        report(
+            f"list, {workers} worker(s)",
+            lambda: parallel_totals(moneys, workers),  # noqa: B023
+        )
+        report(
+            f"MoneyArray, {workers} worker(s)",
+            lambda: parallel_totals(array, workers),  # noqa: B023
+        )
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,44 @@
+"""
+Measures pickling and unpickling a list of Money instances, and the size of the
+pickle, with the highest pickle protocol.
+
+Run with: python benchmarks/bench_pickle.py [count]
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import timeit
+
+from workloads import make_moneys
+
+
+def main(count: int = 1_000_000) -> None:
+    moneys = make_moneys(count)
+    # Populate the cached properties of the currencies, which used to be pickled
+    # along with them.
+    for money in moneys[:100]:
+        money.currency.name
+        money.currency.country_codes
+    data = pickle.dumps(moneys, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def dumps() -> None:
+        pickle.dumps(moneys, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads() -> None:
+        pickle.loads(data)
+
+    print(  # noqa: T201
+        f"Pickling {count:,} values: {len(data):,} bytes, "
+        f"{len(data) / count:.1f} bytes/value"
+    )
+    for label, func in [("pickle.dumps()", dumps), ("pickle.loads()", loads)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(  # noqa: T201
+            f"{label:<26}{seconds:>8.3f} s{seconds / count * 1e6:>10.2f} µs/value"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
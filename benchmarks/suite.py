@@ -0,0 +1,287 @@
+"""
+Times the core operations of py-moneyed on realistic workloads: constructing Money
+from str, int, float and Decimal amounts, adding, comparing, sorting, deduplicating,
+looking up currencies and formatting in several locales.
+
+Run the suite and print the results:
+
+    python benchmarks/suite.py run
+
+Save the results as the new baseline, or to another file:
+
+    python benchmarks/suite.py run --save benchmarks/baseline.json
+
+Run the suite and compare the results against the saved baseline, or against
+results saved earlier, exiting with status 1 if any benchmark got slower by more
+than the threshold:
+
+    python benchmarks/suite.py compare
+    python benchmarks/suite.py compare --baseline before.json --results after.json
+
+Timings depend on the machine, so only compare results taken on the same one. Use
+--scale to run smaller workloads, and --filter to run only the benchmarks whose
+name contains the given text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import operator
+import platform
+import random
+import sys
+import timeit
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from workloads import CURRENCY_CODES, make_amounts, make_moneys
+
+from moneyed import Money, force_decimal, get_currency, money_sort_key
+from moneyed.l10n import format_money
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    # A benchmark takes the number of operations to run, and returns a function
+    # that runs them.
+    Benchmark = Callable[[int], Callable[[], object]]
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+# Slowdowns below this fraction are considered noise by the compare command.
+THRESHOLD = 0.1
+
+LOCALES = ["en_US", "de_DE", "fr_CH", "ja_JP"]
+
+BENCHMARKS: dict[str, tuple[Benchmark, int]] = {}
+
+
+def benchmark(name: str, count: int) -> Callable[[Benchmark], Benchmark]:
+    """
+    Registers a benchmark running the given number of operations.
+    """
+
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = (func, count)
+        return func
+
+    return register
+
+
+def construct(amounts: Sequence[object]) -> Callable[[], object]:
+    def run() -> None:
+        for amount in amounts:
+            Money(amount, "USD")
+
+    return run
+
+
+@benchmark("construct[str]", 1_000_000)
+def construct_str(count: int) -> Callable[[], object]:
+    return construct(make_amounts(count))
+
+
+@benchmark("construct[int]", 1_000_000)
+def construct_int(count: int) -> Callable[[], object]:
+    return construct([int(float(amount)) for amount in make_amounts(count)])
+
+
+@benchmark("construct[float]", 1_000_000)
+def construct_float(count: int) -> Callable[[], object]:
+    return construct([float(amount) for amount in make_amounts(count)])
+
+
+@benchmark("construct[Decimal]", 1_000_000)
+def construct_decimal(count: int) -> Callable[[], object]:
+    return construct([Decimal(amount) for amount in make_amounts(count)])
+
+
+@benchmark("force_decimal", 1_000_000)
+def bench_force_decimal(count: int) -> Callable[[], object]:
+    amounts: list[object] = []
+    for i, amount in enumerate(make_amounts(count)):
+        amounts.append((amount, Decimal(amount), int(float(amount)))[i % 3])
+
+    def run() -> None:
+        for amount in amounts:
+            force_decimal(amount)
+
+    return run
+
+
+@benchmark("sum", 1_000_000)
+def bench_sum(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count, "EUR")
+    return lambda: sum(moneys)
+
+
+@benchmark("add", 1_000_000)
+def bench_add(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count, "EUR")
+    others = moneys[::-1]
+    return lambda: list(map(operator.add, moneys, others))
+
+
+@benchmark("lt", 1_000_000)
+def bench_lt(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count, "EUR")
+    others = moneys[::-1]
+    return lambda: list(map(operator.lt, moneys, others))
+
+
+@benchmark("le", 1_000_000)
+def bench_le(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count, "EUR")
+    others = moneys[::-1]
+    return lambda: list(map(operator.le, moneys, others))
+
+
+@benchmark("sort", 100_000)
+def bench_sort(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count, "EUR")
+    return lambda: sorted(moneys)
+
+
+@benchmark("sort[mixed]", 100_000)
+def bench_sort_mixed(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count)
+    return lambda: sorted(moneys, key=money_sort_key)
+
+
+@benchmark("dedupe", 1_000_000)
+def bench_dedupe(count: int) -> Callable[[], object]:
+    moneys = make_moneys(count)
+    return lambda: (set(moneys), set(moneys))
+
+
+@benchmark("get_currency", 1_000_000)
+def bench_get_currency(count: int) -> Callable[[], object]:
+    rng = random.Random(2)
+    codes = [rng.choice(CURRENCY_CODES) for _ in range(count)]
+
+    def run() -> None:
+        for code in codes:
+            get_currency(code)
+
+    return run
+
+
+def bench_format_money(locale: str) -> Benchmark:
+    def setup(count: int) -> Callable[[], object]:
+        moneys = make_moneys(count)
+
+        def run() -> None:
+            for money in moneys:
+                format_money(money, locale=locale)
+
+        return run
+
+    return setup
+
+
+for _locale in LOCALES:
+    benchmark(f"format_money[{_locale}]", 100_000)(bench_format_money(_locale))
+
+
+def run_benchmarks(
+    scale: float = 1, pattern: str = "", repeat: int = 3
+) -> dict[str, float]:
+    """
+    Runs the registered benchmarks whose name contains the pattern, and returns the
+    best time of every one of them, in nanoseconds per operation.
+    """
+    results = {}
+    for name, (setup, count) in BENCHMARKS.items():
+        if pattern not in name:
+            continue
+        count = max(1, int(count * scale))
+        func = setup(count)
+        seconds = min(timeit.repeat(func, number=1, repeat=repeat))
+        results[name] = seconds / count * 1e9
+        print(f"{name:<24}{results[name]:>10.1f} ns/op", flush=True)  # noqa: T201
+    return results
+
+
+def save(results: dict[str, float], path: Path) -> None:
+    data = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": {name: round(value, 1) for name, value in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load(path: Path) -> dict[str, float]:
+    results: dict[str, float] = json.loads(path.read_text())["results"]
+    return results
+
+
+def compare(
+    baseline: dict[str, float], results: dict[str, float], threshold: float
+) -> bool:
+    """
+    Prints the change of every benchmark against the baseline, and returns whether
+    none of them got slower by more than the threshold.
+    """
+    ok = True
+    print(  # noqa: T201
+        f"\n{'benchmark':<24}{'baseline':>12}{'current':>12}{'change':>10}"
+    )
+    for name, value in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<24}{'-':>12}{value:>12.1f}{'new':>10}")  # noqa: T201
+            continue
+        change = value / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  slower"
+            ok = False
+        elif change < -threshold:
+            flag = "  faster"
+        print(  # noqa: T201
+            f"{name:<24}{before:>12.1f}{value:>12.1f}{change:>+10.1%}{flag}"
+        )
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "compare"):
+        subparser = subparsers.add_parser(command)
+        subparser.add_argument(
+            "--scale",
+            type=float,
+            default=1,
+            help="multiply the number of operations of every benchmark by this",
+        )
+        subparser.add_argument(
+            "--filter", default="", help="only run benchmarks containing this"
+        )
+        subparser.add_argument("--repeat", type=int, default=3)
+    run_parser, compare_parser = subparsers.choices.values()
+    run_parser.add_argument("--save", type=Path, help="save the results to this file")
+    compare_parser.add_argument("--baseline", type=Path, default=BASELINE)
+    compare_parser.add_argument(
+        "--results", type=Path, help="compare these saved results instead of running"
+    )
+    compare_parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and args.results is not None:
+        results = load(args.results)
+    else:
+        results = run_benchmarks(args.scale, args.filter, args.repeat)
+    if args.command == "run":
+        if args.save is not None:
+            save(results, args.save)
+        return 0
+    return 0 if compare(load(args.baseline), results, args.threshold) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Builds the values the benchmarks run on. They are drawn from seeded random number
+generators, so that every run measures the same workload.
+"""
+
+from __future__ import annotations
+
+import random
+
+from moneyed import Money
+
+CURRENCY_CODES = ["EUR", "EUR", "EUR", "USD", "GBP", "JPY", "CHF", "SEK"]
+
+
+def make_amounts(count: int) -> list[str]:
+    """
+    Returns amounts between -10,000 and 10,000 with two decimal places.
+    """
+    rng = random.Random(0)
+    return [f"{rng.randint(-(10**6), 10**6) / 100:.2f}" for _ in range(count)]
+
+
+def make_moneys(count: int, code: str | None = None) -> list[Money]:
+    """
+    Returns Money instances with the amounts of make_amounts(), in the given
+    currency, or else in currencies drawn from CURRENCY_CODES.
+    """
+    rng = random.Random(1)
+    return [
+        Money(amount, code or rng.choice(CURRENCY_CODES))
+        for amount in make_amounts(count)
+    ]
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import operator
+import warnings
+from array import array
+from decimal import Decimal
+from typing import TYPE_CHECKING, overload
+
+from .classes import (
+    Currency,
+    Money,
+    MoneyComparisonError,
+    _minor_units_from_decimal,
+    _to_currency,
+    force_decimal,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any, Union
+
+    import numpy
+    import pyarrow
+
+    ArrowData = Union[pyarrow.RecordBatch, pyarrow.Table]
+
+
+# Typecodes of the two columns backing a MoneyArray: signed 64 bit integers for
+# the amounts in minor units, and unsigned 16 bit indices into the per-array
+# table of currencies.
+UNITS_TYPECODE = "q"
+INDEX_TYPECODE = "H"
+
+
+def to_minor_units(money: Money) -> int:
+    """
+    Returns the amount of money as an exact integer number of minor units of its
+    currency. Raises ValueError if the amount has more precision than the currency
+    sub unit can represent.
+    """
+    return _minor_units_from_decimal(money.amount, money.currency)
+
+
+def _column_from_arrow(typecode: str, values: pyarrow.Array) -> array[int]:
+    """
+    Returns a copy of the values of a fixed size Arrow array without nulls, whose
+    type must match the typecode.
+    """
+    column = array(typecode)
+    if len(values):
+        start = values.offset * column.itemsize
+        end = start + len(values) * column.itemsize
+        column.frombytes(memoryview(values.buffers()[1])[start:end])
+    return column
+
+
+class MoneyArray:
+    """
+    A columnar sequence of Money values.
+
+    Amounts are stored as a contiguous buffer of integers in the minor units of
+    their currency (see ``Currency.sub_unit``), next to a column of indices into a
+    small table of the currencies used by the array. This avoids creating one
+    ``Money`` and one ``Decimal`` object per value, and lets arithmetic run over
+    the whole column at once.
+
+    Arithmetic follows the semantics of ``Money``: values are added elementwise and
+    a ``TypeError`` is raised when currencies differ. The ordering operators
+    ``<``, ``<=``, ``>`` and ``>=`` are elementwise as well and return a list of
+    booleans, while ``==`` compares whole arrays like ``list`` does.
+    """
+
+    __slots__ = ("_units", "_index", "_currencies")
+
+    def __init__(self, values: Iterable[Money] = ()) -> None:
+        units = array(UNITS_TYPECODE)
+        index = array(INDEX_TYPECODE)
+        currencies: list[Currency] = []
+        positions: dict[Currency, int] = {}
+        for money in values:
+            if not isinstance(money, Money):
+                raise TypeError(
+                    f"MoneyArray can only hold Money instances, not {type(money).__name__}."
+                )
+            currency = money.currency
+            position = positions.get(currency)
+            if position is None:
+                position = positions[currency] = len(currencies)
+                currencies.append(currency)
+            units.append(to_minor_units(money))
+            index.append(position)
+        self._units = units
+        self._index = index
+        self._currencies: tuple[Currency, ...] = tuple(currencies)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        units: array[int],
+        index: array[int],
+        currencies: tuple[Currency, ...],
+    ) -> MoneyArray:
+        self = cls.__new__(cls)
+        self._units = units
+        self._index = index
+        self._currencies = currencies
+        return self
+
+    @classmethod
+    def from_minor_units(
+        cls, units: Iterable[int], currency: Currency | str
+    ) -> MoneyArray:
+        """
+        Builds an array of a single currency from integer amounts in minor units.
+        """
+        currency = _to_currency(currency)
+        column = array(UNITS_TYPECODE, units)
+        return cls._from_columns(
+            column, array(INDEX_TYPECODE, [0]) * len(column), (currency,)
+        )
+
+    @property
+    def minor_units(self) -> memoryview:
+        """
+        A read-only view of the amounts, in minor units of their currencies.
+        """
+        return memoryview(self._units).toreadonly()
+
+    @property
+    def currencies(self) -> list[Currency]:
+        """
+        The currency of every value in the array.
+        """
+        currencies = self._currencies
+        return [currencies[i] for i in self._index]
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        for units, i in zip(self._units, self._index):
+            yield Money.from_minor_units(units, currencies[i])
+
+    @overload
+    def __getitem__(self, item: int) -> Money: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> MoneyArray: ...
+
+    def __getitem__(self, item: int | slice) -> Money | MoneyArray:
+        if isinstance(item, slice):
+            return self._from_columns(
+                self._units[item], self._index[item], self._currencies
+            )
+        return Money.from_minor_units(
+            self._units[item], self._currencies[self._index[item]]
+        )
+
+    def to_list(self) -> list[Money]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"MoneyArray({self.to_list()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoneyArray):
+            return NotImplemented
+        return self._units == other._units and self.currencies == other.currencies
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, MoneyArray):
+            return NotImplemented
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # _______________________________________
+    # Interchange with NumPy and Arrow
+    #
+    # These are optional dependencies, imported when first needed.
+
+    def to_numpy(self) -> numpy.ndarray[Any, Any]:
+        """
+        Returns a NumPy structured array with an int64 ``units`` field holding the
+        amounts in minor units, and a ``currency`` field holding currency codes.
+        """
+        import numpy as np
+
+        codes = np.array([currency.code for currency in self._currencies], dtype=str)
+        width = max((len(currency.code) for currency in self._currencies), default=3)
+        result = np.empty(
+            len(self), dtype=[("units", np.int64), ("currency", f"U{width}")]
+        )
+        result["units"] = np.frombuffer(self._units, dtype=np.int64)
+        result["currency"] = codes[np.frombuffer(self._index, dtype=np.uint16)]
+        return result
+
+    @classmethod
+    def from_numpy(cls, values: numpy.ndarray[Any, Any]) -> MoneyArray:
+        """
+        Builds an array from a NumPy structured array with ``units`` and
+        ``currency`` fields, like the ones returned by ``to_numpy()``.
+        """
+        import numpy as np
+
+        codes, index = np.unique(values["currency"], return_inverse=True)
+        return cls._from_columns(
+            array(UNITS_TYPECODE, values["units"].astype(np.int64).tobytes()),
+            array(INDEX_TYPECODE, index.astype(np.uint16).tobytes()),
+            tuple(_to_currency(str(code)) for code in codes),
+        )
+
+    def to_arrow(self) -> pyarrow.RecordBatch:
+        """
+        Returns an Arrow record batch with an int64 ``units`` column holding the
+        amounts in minor units, and a dictionary encoded ``currency`` column of
+        currency codes. The ``units`` column and the indices of the ``currency``
+        column share memory with this array rather than being copied.
+        """
+        import pyarrow as pa
+
+        length = len(self)
+        units = pa.Array.from_buffers(
+            pa.int64(), length, [None, pa.py_buffer(self._units)]
+        )
+        index = pa.Array.from_buffers(
+            pa.uint16(), length, [None, pa.py_buffer(self._index)]
+        )
+        currency = pa.DictionaryArray.from_arrays(
+            index,
+            pa.array([currency.code for currency in self._currencies], pa.string()),
+        )
+        return pa.RecordBatch.from_arrays([units, currency], ["units", "currency"])
+
+    @classmethod
+    def from_arrow(cls, data: ArrowData) -> MoneyArray:
+        """
+        Builds an array from an Arrow record batch or table with an integer
+        ``units`` column and a ``currency`` column of currency codes, which may be
+        dictionary encoded, like the ones returned by ``to_arrow()``.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        def column(name: str) -> pyarrow.Array:
+            values = data.column(name)
+            if isinstance(values, pa.ChunkedArray):
+                values = values.combine_chunks()
+            if values.null_count:
+                raise ValueError(f"Column {name!r} must not contain nulls.")
+            return values
+
+        units = column("units").cast(pa.int64())
+        currency = column("currency")
+        if not pa.types.is_dictionary(currency.type):
+            currency = pc.dictionary_encode(currency)
+        index = currency.indices.cast(pa.uint16())
+        return cls._from_columns(
+            _column_from_arrow(UNITS_TYPECODE, units),
+            _column_from_arrow(INDEX_TYPECODE, index),
+            tuple(_to_currency(str(code)) for code in currency.dictionary.to_pylist()),
+        )
+
+    # _______________________________________
+    # Column helpers
+
+    def _single_currency(self) -> Currency | None:
+        """
+        Returns the currency of the array if all values share one, else None.
+        """
+        currencies = self._currencies
+        if len(currencies) == 1:
+            return currencies[0]
+        if not self._units:
+            return None
+        first = self._index[0]
+        if self._index.count(first) == len(self._index):
+            return currencies[first]
+        return None
+
+    def _check_currencies(self, other: MoneyArray | Money, message: str) -> None:
+        """
+        Raises TypeError with the given message unless every value of this array
+        has the same currency as the corresponding value of other.
+        """
+        if isinstance(other, Money):
+            if self._units and self._single_currency() != other.currency:
+                raise TypeError(message)
+            return
+        if len(self) != len(other):
+            raise ValueError(
+                "Cannot operate on MoneyArrays of different lengths "
+                f"({len(self)} and {len(other)})."
+            )
+        if self._currencies == other._currencies and self._index == other._index:
+            return
+        if self.currencies != other.currencies:
+            raise TypeError(message)
+
+    def _other_units(self, other: MoneyArray | Money) -> Iterable[int]:
+        if isinstance(other, Money):
+            units = to_minor_units(other)
+            return (units for _ in range(len(self)))
+        return other._units
+
+    def _with_units(self, units: Iterable[int]) -> MoneyArray:
+        return self._from_columns(
+            array(UNITS_TYPECODE, units), self._index, self._currencies
+        )
+
+    # _______________________________________
+    # Arithmetic
+
+    def __pos__(self) -> MoneyArray:
+        return self
+
+    def __neg__(self) -> MoneyArray:
+        return self._with_units(map(operator.neg, self._units))
+
+    def __abs__(self) -> MoneyArray:
+        return self._with_units(map(abs, self._units))
+
+    def __add__(self, other: object) -> MoneyArray:
+        if other == 0:
+            # Allow the builtin sum() to work on lists of MoneyArrays, just like
+            # Money.
+            return self
+        if not isinstance(other, (MoneyArray, Money)):
+            return NotImplemented
+        self._check_currencies(
+            other,
+            "Cannot add or subtract two Money instances with different currencies.",
+        )
+        return self._with_units(
+            map(operator.add, self._units, self._other_units(other))
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other: object) -> MoneyArray:
+        if not isinstance(other, (MoneyArray, Money)):
+            return NotImplemented
+        return self.__add__(-other)
+
+    def __rsub__(self, other: object) -> MoneyArray:
+        return (-self).__add__(other)
+
+    def __mul__(self, other: object) -> MoneyArray:
+        if isinstance(other, (MoneyArray, Money)):
+            raise TypeError("Cannot multiply two Money instances.")
+        if isinstance(other, int) and not isinstance(other, bool):
+            return self._with_units(u * other for u in self._units)
+        if isinstance(other, float):
+            warnings.warn(
+                "Multiplying Money instances with floats is deprecated",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        factor = force_decimal(other)
+        # Products are rounded to whole minor units using the rounding of the
+        # current decimal context.
+        return self._with_units(
+            int((Decimal(u) * factor).to_integral_value()) for u in self._units
+        )
+
+    __rmul__ = __mul__
+
+    def sum(self) -> Money:
+        """
+        Returns the sum of all values as a single Money instance.
+        """
+        if not self._units:
+            raise ValueError("Cannot sum an empty MoneyArray.")
+        currency = self._single_currency()
+        if currency is None:
+            raise TypeError(
+                "Cannot add or subtract two Money instances with different currencies."
+            )
+        return Money.from_minor_units(sum(self._units), currency)
+
+    # _______________________________________
+    # Elementwise comparisons
+
+    def _compare(self, other: object, op: Callable[[Any, Any], bool]) -> list[bool]:
+        if not isinstance(other, (MoneyArray, Money)):
+            raise MoneyComparisonError(other)
+        self._check_currencies(other, "Cannot compare Money with different currencies.")
+        return list(map(op, self._units, self._other_units(other)))
+
+    def __lt__(self, other: object) -> list[bool]:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: object) -> list[bool]:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: object) -> list[bool]:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: object) -> list[bool]:
+        return self._compare(other, operator.ge)
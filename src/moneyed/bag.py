@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from .classes import Currency, Money, _to_currency, get_currency_or_none
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class MoneyBag:
+    """
+    A mutable running total of Money in any number of currencies.
+
+    Adding ``Money`` to a bag adds its amount to the total of its currency, so values
+    in different currencies can be accumulated without grouping them first, and
+    without creating a new ``Money`` instance for every addition. Bags can be merged
+    with each other, for example to combine totals computed in parallel.
+
+    >>> bag = MoneyBag()
+    >>> bag += Money('1.50', 'USD')
+    >>> bag += Money('2', 'EUR')
+    >>> bag += Money('0.25', 'USD')
+    >>> bag['USD']
+    Money('1.75', 'USD')
+    """
+
+    __slots__ = ("_totals",)
+
+    def __init__(self, values: Iterable[Money | MoneyBag] = ()) -> None:
+        self._totals: dict[Currency, Decimal] = {}
+        self.update(values)
+
+    def add(self, money: Money) -> None:
+        """
+        Adds the amount of the given Money to the total of its currency.
+        """
+        if not isinstance(money, Money):
+            raise TypeError(f"Cannot add {type(money).__name__} to a MoneyBag.")
+        totals = self._totals
+        currency = money.currency
+        totals[currency] = totals.get(currency, 0) + money.amount
+
+    def merge(self, other: MoneyBag) -> None:
+        """
+        Adds the totals of another bag to the totals of this one.
+        """
+        totals = self._totals
+        for currency, amount in other._totals.items():
+            totals[currency] = totals.get(currency, 0) + amount
+
+    def update(self, values: Iterable[Money | MoneyBag]) -> None:
+        """
+        Adds every Money instance, or merges every bag, of the given iterable.
+        """
+        totals = self._totals
+        get = totals.get
+        for value in values:
+            if isinstance(value, Money):
+                currency = value.currency
+                totals[currency] = get(currency, 0) + value.amount
+            elif isinstance(value, MoneyBag):
+                self.merge(value)
+            else:
+                raise TypeError(f"Cannot add {type(value).__name__} to a MoneyBag.")
+
+    def copy(self) -> MoneyBag:
+        bag = MoneyBag()
+        bag._totals = self._totals.copy()
+        return bag
+
+    def __iadd__(self, other: object) -> MoneyBag:
+        if isinstance(other, Money):
+            self.add(other)
+        elif isinstance(other, MoneyBag):
+            self.merge(other)
+        else:
+            return NotImplemented
+        return self
+
+    def __add__(self, other: object) -> MoneyBag:
+        if other == 0:
+            # Allow the builtin sum() to work on lists of bags, just like Money.
+            return self.copy()
+        if not isinstance(other, (Money, MoneyBag)):
+            return NotImplemented
+        bag = self.copy()
+        bag += other
+        return bag
+
+    __radd__ = __add__
+
+    def __getitem__(self, currency: Currency | str) -> Money:
+        """
+        Returns the total of the given currency, which is zero if no Money of that
+        currency has been added.
+        """
+        currency = _to_currency(currency)
+        amount = self._totals.get(currency)
+        if amount is None:
+            return currency.zero
+        return Money._from_decimal(amount, currency)
+
+    def __contains__(self, currency: object) -> bool:
+        if isinstance(currency, str):
+            currency = get_currency_or_none(currency)
+        return currency in self._totals
+
+    def __iter__(self) -> Iterator[Currency]:
+        return iter(self._totals)
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoneyBag):
+            return NotImplemented
+        return self._totals == other._totals
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MoneyBag({list(self.to_dict().values())!r})"
+
+    @property
+    def currencies(self) -> list[Currency]:
+        """
+        The currencies of which Money has been added, in order of first addition.
+        """
+        return list(self._totals)
+
+    def to_dict(self) -> dict[Currency, Money]:
+        """
+        Returns the total of every currency as a Money instance.
+        """
+        return {
+            currency: Money._from_decimal(amount, currency)
+            for currency, amount in self._totals.items()
+        }
@@ -1,24 +1,31 @@
 from __future__ import annotations
 
+import copyreg
 import warnings
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Protocol, TypeVar, cast, overload
 
-from babel import Locale
-from babel.core import get_global
-
 from .l10n import format_money
-from .utils import cached_property
+from .utils import cached_slot_property
 
 if TYPE_CHECKING:
-    from typing import Any, Final, NoReturn
+    from collections.abc import Iterable, Iterator, Mapping
+    from fractions import Fraction
+    from typing import Any, Final, NoReturn, Union
+
+    Ratio = Union[int, float, Decimal, Fraction, str]
 
 
 def force_decimal(amount: object) -> Decimal:
     """Given an amount of unknown type, type cast it to be a Decimal."""
-    if not isinstance(amount, Decimal):
-        return Decimal(str(amount))
-    return amount
+    if isinstance(amount, Decimal):
+        return amount
+    if type(amount) is int or type(amount) is str:
+        # Decimal converts these exactly, without a round trip through str().
+        return Decimal(amount)
+    return Decimal(str(amount))
 
 
 class Currency:
@@ -27,8 +34,30 @@ class Currency:
     used in one or more states/countries.  A Currency instance
     encapsulates the related data of: the ISO currency/numeric code, a
     canonical name, and countries the currency is used in.
+
+    Registered currencies also have an integer ``ordinal``, unique to their code,
+    which is used by ``money_sort_key()``. Currencies whose code was never
+    registered get one when they are first sorted by it.
     """
 
+    __slots__ = (
+        "code",
+        "numeric",
+        "sub_unit",
+        "_name",
+        "_countries",
+        "ordinal",
+        "_hash",
+        # Storage of the cached_slot_property values below.
+        "_cached_name",
+        "_cached_zero",
+        "_cached_countries",
+        "_cached_country_codes",
+        "_cached_quantizer",
+        "_cached_cash_increment",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         code: str = "",
@@ -42,12 +71,15 @@ class Currency:
         self.sub_unit: Final = sub_unit
         self._name: Final = name
         self._countries: Final = countries
+        # Currencies with the same code share an ordinal, see add_currency().
+        self.ordinal: int | None = _ordinals.get(code)
+        self._hash: Final = hash(code)
 
     def __hash__(self) -> int:
-        return hash(self.code)
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        return (
+        return self is other or (
             type(self) is type(other)
             and self.code == other.code  # type: ignore[attr-defined]
         )
@@ -58,13 +90,40 @@ class Currency:
     def __repr__(self) -> str:
         return self.code
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Registered currencies are pickled as their code, and unpickled to the
+        # registered instance. Cached properties are never pickled.
+        if CURRENCIES.get(self.code) is self:
+            return (get_currency, (self.code,))
+        return (
+            Currency,
+            (self.code, self.numeric, self.sub_unit, self._name, self._countries),
+        )
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Only called for pickles written before Currency declared __slots__, which
+        # hold the instance __dict__. Values of cached properties are dropped.
+        self.__init__(  # type: ignore[misc]
+            state["code"],
+            state["numeric"],
+            state["sub_unit"],
+            state["_name"],
+            state["_countries"],
+        )
+
+    def __copy__(self) -> Currency:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Currency:
+        return self
+
     def __lt__(self, other: Currency) -> bool:
         return self.code < other.code
 
     def __le__(self, other: Currency) -> bool:
         return self.code <= other.code
 
-    @cached_property
+    @cached_slot_property
     def name(self) -> str:
         """
         Name of the currency in US locale. For backwards compat.
@@ -87,11 +146,11 @@ class Currency:
             ),
         )
 
-    @cached_property
+    @cached_slot_property
     def zero(self) -> Money:
         return Money(0, self)
 
-    @cached_property
+    @cached_slot_property
     def countries(self) -> list[str]:
         """
         List of country names, uppercased and in US locale, where the currency is
@@ -108,20 +167,62 @@ class Currency:
             for country_code in self.country_codes
         ]
 
-    @cached_property
+    @cached_slot_property
     def country_codes(self) -> list[str]:
         """
         List of current country codes for the currency.
         """
-        return [
-            territory.upper()
-            for territory, currencies in get_global("territory_currencies").items()
-            for currency_code, start, end, is_tender in currencies
-            if end is None and currency_code == self.code
-        ]
+        return list(_territories_by_currency().get(self.code, ()))
+
+    @cached_slot_property
+    def quantizer(self) -> Decimal:
+        """
+        The minor unit of the currency as a Decimal, for example ``Decimal('0.01')``
+        for USD, to quantize amounts with. For sub units that aren't a power of ten,
+        the number of digits of the currency in CLDR is used.
+        """
+        exponent = _sub_unit_exponent(self.sub_unit)
+        if exponent is None:
+            from babel.numbers import get_currency_precision
+
+            exponent = get_currency_precision(self.code)
+        return _quantizer(exponent)
+
+    @cached_slot_property
+    def cash_increment(self) -> Decimal:
+        """
+        The smallest amount of the currency used in cash payments according to CLDR,
+        for example ``Decimal('0.05')`` for CHF. The same as ``quantizer`` for
+        currencies without separate cash rounding.
+        """
+        from babel.core import get_global
+
+        fractions = get_global("currency_fractions")
+        if self.code not in fractions:
+            return self.quantizer
+        _digits, _rounding, cash_digits, cash_rounding = fractions[self.code]
+        return Decimal(cash_rounding or 1).scaleb(-cash_digits)
+
+
+@lru_cache(maxsize=None)
+def _territories_by_currency() -> dict[str, list[str]]:
+    """
+    Maps currency codes to the codes of the countries that currently use them,
+    built in a single pass over Babel's territory data.
+    """
+    from babel.core import get_global
+
+    territories: dict[str, list[str]] = {}
+    for territory, currencies in get_global("territory_currencies").items():
+        for currency_code, _start, end, _is_tender in currencies:
+            if end is None:
+                territories.setdefault(currency_code, []).append(territory.upper())
+    return territories
 
 
 def get_country_name(country_code: str, locale: str) -> str:
+    from babel import Locale
+
     return Locale.parse(locale).territories[country_code]  # type: ignore[no-any-return]
 
 
@@ -145,6 +246,7 @@ class CurrencyDoesNotExist(Exception):
 # This TypeVar is used for methods on Money that return self, so that subclasses become
 # accurately typed as returning instances of the subclass, not Money itself.
 M = TypeVar("M", bound="Money")
+MU = TypeVar("MU", bound="MinorUnitMoney")
 
 
 class SupportsNeg(Protocol):
@@ -154,6 +256,116 @@ class SupportsNeg(Protocol):
 zero = Decimal("0.0")
 
 
+@lru_cache(maxsize=None)
+def _quantizer(ndigits: int) -> Decimal:
+    """
+    Returns the Decimal to quantize amounts to the given number of decimal places.
+    """
+    return Decimal(1).scaleb(-ndigits)
+
+
+# Maximum number of instances shared by Money.intern(). The least recently used ones
+# are dropped first.
+INTERN_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _interned(cls: type[Money], amount: object, currency: Currency, key: object) -> Any:
+    """
+    Creates the instance shared by Money.intern(). The key tells apart Decimal amounts
+    that are equal but print differently, like Decimal('1.5') and Decimal('1.50').
+    """
+    return cls(amount, currency)
+
+
+@lru_cache(maxsize=None)
+def _sub_unit_exponent(sub_unit: int) -> int | None:
+    """
+    Returns the number of decimal places of a currency sub unit, or None if the
+    sub unit is not a power of ten.
+    """
+    exponent = len(str(sub_unit)) - 1
+    return exponent if 10**exponent == sub_unit else None
+
+
+def _decimal_from_minor_units(units: int, currency: Currency) -> Decimal:
+    exponent = _sub_unit_exponent(currency.sub_unit)
+    if exponent is None:
+        return Decimal(units) / currency.sub_unit
+    return Decimal(units).scaleb(-exponent)
+
+
+def _minor_units_from_decimal(amount: Decimal, currency: Currency) -> int:
+    units = amount * currency.sub_unit
+    integral = units.to_integral_value()
+    if units != integral:
+        raise ValueError(
+            f"{amount} cannot be represented in minor units of {currency}."
+        )
+    return int(integral)
+
+
+def _round_to_currency(
+    amount: Decimal, currency: Currency, rounding: str | None, cash: bool
+) -> Decimal:
+    if not cash:
+        return amount.quantize(currency.quantizer, rounding)
+    increment = currency.cash_increment
+    return ((amount / increment).to_integral_value(rounding) * increment).quantize(
+        increment
+    )
+
+
+def _allocation_weights(ratios: Iterable[Ratio]) -> tuple[list[int], int]:
+    """
+    Returns the given ratios scaled to integers with the same proportions, and
+    their sum.
+    """
+    from fractions import Fraction
+    from math import gcd
+
+    fractions = [Fraction(ratio) for ratio in ratios]
+    if any(fraction < 0 for fraction in fractions):
+        raise ValueError("Cannot allocate money to negative ratios.")
+    denominator = 1
+    for fraction in fractions:
+        denominator *= fraction.denominator // gcd(denominator, fraction.denominator)
+    weights = [
+        fraction.numerator * (denominator // fraction.denominator)
+        for fraction in fractions
+    ]
+    total = sum(weights)
+    if not total:
+        raise ValueError("Cannot allocate money to ratios that sum to zero.")
+    return weights, total
+
+
+def _allocate_units(units: int, weights: list[int], total: int) -> list[int]:
+    """
+    Splits an integer number of units in proportion to the weights, giving the
+    units left over after rounding down to the shares with the largest remainders,
+    and to the first of those on ties.
+    """
+    sign = -1 if units < 0 else 1
+    units *= sign
+    shares = []
+    remainders = []
+    for weight in weights:
+        share, remainder = divmod(units * weight, total)
+        shares.append(share)
+        remainders.append(remainder)
+    left = units - sum(shares)
+    if left:
+        by_remainder = sorted(
+            range(len(weights)), key=remainders.__getitem__, reverse=True
+        )
+        for i in by_remainder[:left]:
+            shares[i] += 1
+    if sign < 0:
+        return [-share for share in shares]
+    return shares
+
+
 class Money:
     """
     A Money instance is a combination of data - an amount and a
@@ -162,6 +374,12 @@ class Money:
     ($DEITY forbid) floats.
     """
 
+    # Money instances are immutable and frequently created in large numbers, so
+    # they don't carry an instance __dict__. Subclasses that don't declare
+    # __slots__ themselves get one as usual.
+    __slots__ = ("amount", "currency", "_hash")
+    _hash: int
+
     # Overload __init__ to make omitting currency an error that is discoverable through
     # static type checking. To explain the two signatures: the first one allows omitting
     # the amount if currency is given as a key-word argument. The second signature
@@ -185,13 +403,86 @@ class Money:
                 "__init__() missing 1 required positional argument: 'currency'"
             )
         self.amount: Final = (
-            amount if isinstance(amount, Decimal) else Decimal(str(amount))
-        )
-        self.currency: Final = (
-            currency
-            if isinstance(currency, Currency)
-            else get_currency(str(currency).upper())
+            amount if isinstance(amount, Decimal) else force_decimal(amount)
         )
+        if type(currency) is str:
+            currency = _currency_lookup.get(currency) or _to_currency(currency)
+        elif not isinstance(currency, Currency):
+            currency = _to_currency(currency)
+        self.currency: Final = currency
+
+    @classmethod
+    def _from_decimal(cls: type[M], amount: Decimal, currency: Currency) -> M:
+        """
+        Trusted constructor for callers that already hold a Decimal amount and a
+        Currency instance. Skips the conversions done by __init__, unless a subclass
+        overrides __init__, in which case it is called as usual.
+        """
+        if cls.__init__ is not Money.__init__:
+            return cls(amount=amount, currency=currency)
+        money = cls.__new__(cls)
+        money.amount = amount  # type: ignore[misc]
+        money.currency = currency  # type: ignore[misc]
+        return money
+
+    @classmethod
+    def intern(cls: type[M], amount: object, currency: str | Currency) -> M:
+        """
+        Returns an instance equal to ``cls(amount, currency)``, shared with earlier
+        calls given the same amount and currency, which saves memory when the same
+        values occur many times. Up to ``INTERN_CACHE_SIZE`` of the most recently
+        used instances are shared.
+
+        >>> Money.intern('9.99', 'USD') is Money.intern('9.99', 'usd')
+        True
+        """
+        if type(currency) is str:
+            currency = _currency_lookup.get(currency) or _to_currency(currency)
+        elif not isinstance(currency, Currency):
+            currency = _to_currency(currency)
+        # Amounts given as str or int are keyed as given, others as Decimal.
+        if type(amount) is str or type(amount) is int:
+            key = None
+        else:
+            amount = force_decimal(amount)
+            key = amount.as_tuple()
+        money: M = _interned(cls, amount, currency, key)  # type: ignore[arg-type]
+        return money
+
+    @classmethod
+    def from_minor_units(cls: type[M], units: int, currency: str | Currency) -> M:
+        """
+        Creates an instance from an integer amount in minor units of the currency,
+        for example cents for USD.
+
+        >>> Money.from_minor_units(1950, 'USD')
+        Money('19.50', 'USD')
+        """
+        currency = _to_currency(currency)
+        return cls._from_decimal(_decimal_from_minor_units(units, currency), currency)
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the amount and currency in a compact binary format, see
+        ``moneyed.wire``. Raises ValueError if the currency has no numeric code of
+        its own, or the amount isn't finite.
+        """
+        from .wire import _to_bytes
+
+        return _to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls: type[M], data: bytes | bytearray | memoryview) -> M:
+        """
+        Decodes an instance encoded by ``to_bytes()``.
+
+        >>> Money.from_bytes(Money('19.50', 'USD').to_bytes())
+        Money('19.50', 'USD')
+        """
+        from .wire import _from_bytes
+
+        amount, currency = _from_bytes(data)
+        return cls._from_decimal(amount, currency)
 
     def __repr__(self) -> str:
         return f"Money('{self.amount}', '{self.currency}')"
@@ -200,36 +491,74 @@ class Money:
         return format_money(self)
 
     def __hash__(self) -> int:
-        return hash((self.amount, self.currency))
+        # Hashing a Decimal is comparatively slow, so the hash is computed once.
+        try:
+            return self._hash
+        except AttributeError:
+            result = self._hash = hash((self.amount, self.currency))
+            return result
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles only the amount and currency, plus the instance __dict__ of
+        # subclasses that have one, and restores them without calling __init__.
+        return (
+            copyreg.__newobj__,  # type: ignore[attr-defined]
+            (type(self),),
+            (
+                getattr(self, "__dict__", None),
+                {"amount": self.amount, "currency": self.currency},
+            ),
+        )
+
+    def __setstate__(
+        self, state: tuple[dict[str, Any] | None, dict[str, Any]] | dict[str, Any]
+    ) -> None:
+        # Pickles written before Money declared __slots__ hold the instance
+        # __dict__ instead of the pair returned by __reduce__().
+        if isinstance(state, tuple):
+            instance_dict, slots = state
+            if instance_dict:
+                slots = {**instance_dict, **slots}
+            state = slots
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __copy__(self: M) -> M:
+        # Money is immutable, so copies can be shared, unless a subclass adds
+        # attributes of its own.
+        if not getattr(self, "__dict__", None):
+            return self
+        money = self._from_decimal(self.amount, self.currency)
+        money.__dict__.update(self.__dict__)
+        return money
+
+    def __deepcopy__(self: M, memo: dict[int, object]) -> M:
+        if not getattr(self, "__dict__", None):
+            return self
+        from copy import deepcopy
+
+        money = self._from_decimal(self.amount, self.currency)
+        money.__dict__.update(deepcopy(self.__dict__, memo))
+        return money
 
     def __pos__(self: M) -> M:
-        return self.__class__(
-            amount=self.amount,
-            currency=self.currency,
-        )
+        return self._from_decimal(self.amount, self.currency)
 
     def __neg__(self: M) -> M:
-        return self.__class__(
-            amount=-self.amount,
-            currency=self.currency,
-        )
+        return self._from_decimal(-self.amount, self.currency)
 
     def __add__(self: M, other: object) -> M:
+        if isinstance(other, Money):
+            if self.currency == other.currency:
+                return self._from_decimal(self.amount + other.amount, self.currency)
+            raise TypeError(
+                "Cannot add or subtract two Money instances with different currencies."
+            )
         if other == 0:
             # This allows things like 'sum' to work on list of Money instances,
             # just like list of Decimal.
             return self
-        if not isinstance(other, Money):
-            return NotImplemented
-        if self.currency == other.currency:
-            return self.__class__(
-                amount=self.amount + other.amount,
-                currency=self.currency,
-            )
-
-        raise TypeError(
-            "Cannot add or subtract two Money instances with different currencies."
-        )
+        return NotImplemented
 
     def __sub__(self: M, other: SupportsNeg) -> M:
         return self.__add__(-other)
@@ -247,10 +576,7 @@ class Money:
                     DeprecationWarning,
                     stacklevel=2,
                 )
-            return self.__class__(
-                amount=(self.amount * force_decimal(other)),
-                currency=self.currency,
-            )
+            return self._from_decimal(self.amount * force_decimal(other), self.currency)
 
     @overload
     def __truediv__(self: M, other: int | float | Decimal) -> M: ...
@@ -270,10 +596,7 @@ class Money:
                     DeprecationWarning,
                     stacklevel=2,
                 )
-            return self.__class__(
-                amount=(self.amount / force_decimal(other)),
-                currency=self.currency,
-            )
+            return self._from_decimal(self.amount / force_decimal(other), self.currency)
 
     def __rtruediv__(self, other: object) -> NoReturn:
         raise TypeError("Cannot divide non-Money by a Money instance.")
@@ -284,17 +607,54 @@ class Money:
         """
         if ndigits is None:
             ndigits = 0
-        return self.__class__(
-            amount=self.amount.quantize(Decimal("1e" + str(-ndigits))),
-            currency=self.currency,
+        return self._from_decimal(
+            self.amount.quantize(_quantizer(ndigits)), self.currency
         )
 
-    def __abs__(self: M) -> M:
-        return self.__class__(
-            amount=abs(self.amount),
-            currency=self.currency,
+    def round_to_currency(
+        self: M, rounding: str | None = None, cash: bool = False
+    ) -> M:
+        """
+        Rounds the amount to the minor unit of the currency, or to the smallest
+        amount used in cash payments if ``cash`` is true, for example 0.05 for CHF.
+
+        ``rounding`` is one of the rounding modes of the ``decimal`` module, like
+        ``ROUND_HALF_UP``, and defaults to the rounding of the current context.
+
+        >>> Money('1.125', 'USD').round_to_currency()
+        Money('1.12', 'USD')
+        >>> Money('1.13', 'CHF').round_to_currency(cash=True)
+        Money('1.15', 'CHF')
+        """
+        return self._from_decimal(
+            _round_to_currency(self.amount, self.currency, rounding, cash),
+            self.currency,
         )
 
+    def allocate(self: M, ratios: Iterable[Ratio]) -> list[M]:
+        """
+        Splits the amount in proportion to the given ratios, without losing or
+        creating any minor units of the currency. Minor units left over after
+        rounding down each share go to the shares with the largest remainders.
+
+        >>> Money('10.00', 'USD').allocate([1, 1, 1])
+        [Money('3.34', 'USD'), Money('3.33', 'USD'), Money('3.33', 'USD')]
+
+        Ratios may be integers, Decimals, Fractions or strings. Raises ValueError if
+        the amount can't be represented in minor units of the currency.
+        """
+        weights, total = _allocation_weights(ratios)
+        currency = self.currency
+        return [
+            self.from_minor_units(units, currency)
+            for units in _allocate_units(
+                _minor_units_from_decimal(self.amount, currency), weights, total
+            )
+        ]
+
+    def __abs__(self: M) -> M:
+        return self._from_decimal(abs(self.amount), self.currency)
+
     def __bool__(self) -> bool:
         return bool(self.amount)
 
@@ -317,9 +677,8 @@ class Money:
                     DeprecationWarning,
                     stacklevel=2,
                 )
-            return self.__class__(
-                amount=(Decimal(str(other)) * self.amount / 100),
-                currency=self.currency,
+            return self._from_decimal(
+                force_decimal(other) * self.amount / 100, self.currency
             )
 
     __radd__ = __add__
@@ -341,35 +700,243 @@ class Money:
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Money):
             raise MoneyComparisonError(other)
-        if self.currency == other.currency:
+        currency = self.currency
+        if currency is other.currency or currency == other.currency:
             return self.amount < other.amount
-        else:
-            raise TypeError("Cannot compare Money with different currencies.")
+        raise TypeError("Cannot compare Money with different currencies.")
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, Money):
             raise MoneyComparisonError(other)
-        if self.currency == other.currency:
+        currency = self.currency
+        if currency is other.currency or currency == other.currency:
             return self.amount > other.amount
-        else:
-            raise TypeError("Cannot compare Money with different currencies.")
+        raise TypeError("Cannot compare Money with different currencies.")
 
     def __le__(self, other: object) -> bool:
-        return self < other or self == other
+        if not isinstance(other, Money):
+            raise MoneyComparisonError(other)
+        currency = self.currency
+        if currency is other.currency or currency == other.currency:
+            return self.amount <= other.amount
+        raise TypeError("Cannot compare Money with different currencies.")
 
     def __ge__(self, other: object) -> bool:
-        return self > other or self == other
+        if not isinstance(other, Money):
+            raise MoneyComparisonError(other)
+        currency = self.currency
+        if currency is other.currency or currency == other.currency:
+            return self.amount >= other.amount
+        raise TypeError("Cannot compare Money with different currencies.")
 
     def get_amount_in_sub_unit(self) -> int:
         return int(self.currency.sub_unit * self.amount)
 
 
+class MinorUnitMoney(Money):
+    """
+    A Money instance that keeps its amount as an integer number of minor units of
+    its currency (see ``Currency.sub_unit``), and does arithmetic on that integer
+    instead of on a Decimal. The Decimal ``amount`` is only computed when accessed.
+
+    The amount must be representable in minor units. Operations that produce a
+    fraction of a minor unit, like multiplying by a Decimal, round the result
+    using the rounding of the current decimal context. Adding or subtracting a
+    Decimal based Money raises ValueError if its amount isn't whole minor units.
+    """
+
+    __slots__ = ("units", "_amount")
+    _amount: Decimal
+
+    @overload
+    def __init__(self, amount: object = ..., *, currency: str | Currency) -> None: ...
+
+    @overload
+    def __init__(self, amount: object, currency: str | Currency) -> None: ...
+
+    def __init__(
+        self,
+        amount: object = zero,
+        currency: str | Currency | None = None,
+    ) -> None:
+        if currency is None:
+            raise TypeError(
+                "__init__() missing 1 required positional argument: 'currency'"
+            )
+        currency = _to_currency(currency)
+        self.currency = currency  # type: ignore[misc]
+        self.units: Final = _minor_units_from_decimal(force_decimal(amount), currency)
+
+    @classmethod
+    def _from_units(cls: type[MU], units: int, currency: Currency) -> MU:
+        money = cls.__new__(cls)
+        money.units = units  # type: ignore[misc]
+        money.currency = currency  # type: ignore[misc]
+        return money
+
+    @classmethod
+    def _from_decimal(cls: type[MU], amount: Decimal, currency: Currency) -> MU:
+        units = (amount * currency.sub_unit).to_integral_value()
+        return cls._from_units(int(units), currency)
+
+    @classmethod
+    def from_minor_units(cls: type[MU], units: int, currency: str | Currency) -> MU:
+        currency = _to_currency(currency)
+        return cls._from_units(int(units), currency)
+
+    @property  # type: ignore[misc]
+    def amount(self) -> Decimal:
+        try:
+            return self._amount
+        except AttributeError:
+            amount = self._amount = _decimal_from_minor_units(self.units, self.currency)
+            return amount
+
+    def get_amount_in_sub_unit(self) -> int:
+        return self.units
+
+    def __bool__(self) -> bool:
+        return bool(self.units)
+
+    def __pos__(self: MU) -> MU:
+        return self._from_units(self.units, self.currency)
+
+    def __neg__(self: MU) -> MU:
+        return self._from_units(-self.units, self.currency)
+
+    def __abs__(self: MU) -> MU:
+        return self._from_units(abs(self.units), self.currency)
+
+    def __add__(self: MU, other: object) -> MU:
+        if isinstance(other, Money):
+            currency = self.currency
+            if currency != other.currency:
+                raise TypeError(
+                    "Cannot add or subtract two Money instances with different "
+                    "currencies."
+                )
+            if isinstance(other, MinorUnitMoney):
+                units = other.units
+            else:
+                # Raises ValueError for amounts that aren't whole minor units, like
+                # __init__ does.
+                units = _minor_units_from_decimal(other.amount, currency)
+            return self._from_units(self.units + units, currency)
+        return super().__add__(other)
+
+    __radd__ = __add__
+
+    def __rsub__(self: MU, other: object) -> MU:
+        # Overridden, so that Money - MinorUnitMoney is handled by this class as
+        # well, like Money + MinorUnitMoney is through __radd__.
+        return (-self).__add__(other)
+
+    def __mul__(self: MU, other: object) -> MU:
+        if type(other) is int:
+            return self._from_units(self.units * other, self.currency)
+        return super().__mul__(other)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney):
+            return self.units == other.units and self.currency == other.currency
+        return super().__eq__(other)
+
+    __hash__ = Money.__hash__
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            copyreg.__newobj__,  # type: ignore[attr-defined]
+            (type(self),),
+            (
+                getattr(self, "__dict__", None),
+                {"units": self.units, "currency": self.currency},
+            ),
+        )
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney) and self.currency == other.currency:
+            return self.units < other.units
+        return super().__lt__(other)
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney) and self.currency == other.currency:
+            return self.units > other.units
+        return super().__gt__(other)
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney) and self.currency == other.currency:
+            return self.units <= other.units
+        return super().__le__(other)
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney) and self.currency == other.currency:
+            return self.units >= other.units
+        return super().__ge__(other)
+
+
+def round_many(
+    moneys: Iterable[M], rounding: str | None = None, cash: bool = False
+) -> Iterator[M]:
+    """
+    Rounds each of the given Money instances to the minor unit of its currency, like
+    ``Money.round_to_currency()`` does, and yields the results in the same order.
+    """
+    for money in moneys:
+        currency = money.currency
+        yield money._from_decimal(
+            _round_to_currency(money.amount, currency, rounding, cash), currency
+        )
+
+
+def allocate_many(moneys: Iterable[M], ratios: Iterable[Ratio]) -> Iterator[list[M]]:
+    """
+    Splits each of the given Money instances in proportion to the same ratios, like
+    ``Money.allocate()`` does, and yields the shares of each in the same order. The
+    ratios are converted once for the whole iterable.
+    """
+    weights, total = _allocation_weights(ratios)
+    for money in moneys:
+        currency = money.currency
+        yield [
+            money.from_minor_units(units, currency)
+            for units in _allocate_units(
+                _minor_units_from_decimal(money.amount, currency), weights, total
+            )
+        ]
+
+
+def money_sort_key(money: Money) -> tuple[int, Decimal]:
+    """
+    Key function that sorts Money instances by currency, and by amount within each
+    currency, unlike the comparison operators which raise TypeError for different
+    currencies. Currencies are ordered by their ordinal, which is the order in which
+    they were registered.
+
+    >>> sorted([Money(2, 'USD'), Money(3, 'EUR'), Money(1, 'USD')], key=money_sort_key)
+    [Money('3', 'EUR'), Money('1', 'USD'), Money('2', 'USD')]
+    """
+    currency = money.currency
+    ordinal = currency.ordinal
+    if ordinal is None:
+        # Codes that were never registered get the next ordinal on first use.
+        ordinal = currency.ordinal = _ordinals.setdefault(currency.code, len(_ordinals))
+    return ordinal, money.amount
+
+
 # ____________________________________________________________________
 # Definitions of ISO 4217 Currencies
 # Source: http://www.iso.org/iso/support/faqs/faqs_widely_used_standards/widely_used_standards_other/currency_codes/currency_codes_list-1.htm  # noqa
 
 CURRENCIES: dict[str, Currency] = {}
 CURRENCIES_BY_ISO: dict[str, Currency] = {}
+# Every accepted spelling of a registered currency: its code in upper and lower
+# case, and its numeric code. Kept in sync by add_currency().
+_currency_lookup: dict[str, Currency] = {}
+# Ordinal of every currency code, in the order the codes were registered. Registering
+# a code again keeps its ordinal.
+_ordinals: dict[str, int] = {}
 
 
 def add_currency(
@@ -379,13 +946,19 @@ def add_currency(
     name: str | None = None,
     countries: list[str] | None = None,
 ) -> Currency:
+    _ordinals.setdefault(code, len(_ordinals))
     currency = Currency(
         code=code, numeric=numeric, sub_unit=sub_unit, name=name, countries=countries
     )
     CURRENCIES[code] = currency
+    _currency_lookup[code] = _currency_lookup[code.lower()] = currency
     # No lookup by numeric code for currencies without numeric codes
     if numeric is not None:
         CURRENCIES_BY_ISO[numeric] = currency
+        _currency_lookup[numeric] = currency
+    # The country index is rebuilt with the new currency on next use.
+    global _currencies_by_country
+    _currencies_by_country = None
     return currency
 
 
@@ -406,6 +979,62 @@ def get_currency(code: str | None = None, iso: int | str | None = None) -> Curre
         raise CurrencyDoesNotExist(code)
 
 
+def get_currency_or_none(code: str | int) -> Currency | None:
+    """
+    Returns the registered currency with the given alphabetic code, in any case, or
+    numeric code. Returns None instead of raising if there is no such currency.
+    """
+    code = str(code)
+    currency = _currency_lookup.get(code)
+    if currency is None:
+        currency = CURRENCIES.get(code.upper())
+    return currency
+
+
+def _to_currency(currency: object) -> Currency:
+    """
+    Returns the currency itself, or the registered currency with the given code.
+    Raises CurrencyDoesNotExist if there is no such currency.
+    """
+    if isinstance(currency, Currency):
+        return currency
+    # Codes are looked up as str, so that numeric codes may be given as int and
+    # unhashable values are reported as unknown currencies.
+    code = str(currency)
+    resolved = _currency_lookup.get(code)
+    if resolved is None:
+        return get_currency(code.upper())
+    return resolved
+
+
+_currencies_by_country: Mapping[str, tuple[Currency, ...]] | None = None
+
+
+def get_currencies_by_country() -> Mapping[str, tuple[Currency, ...]]:
+    """
+    Returns a read-only mapping of ISO-2 country codes to the currencies currently
+    used in each country, sorted by code. Only countries using at least one
+    registered currency are included.
+
+    The mapping is built on first use, and rebuilt after a currency is added.
+    """
+    global _currencies_by_country
+    if _currencies_by_country is None:
+        index: dict[str, set[Currency]] = {}
+        for code, territories in _territories_by_currency().items():
+            currency = CURRENCIES.get(code)
+            if currency is not None:
+                for territory in territories:
+                    index.setdefault(territory, set()).add(currency)
+        _currencies_by_country = MappingProxyType(
+            {
+                territory: tuple(sorted(currencies))
+                for territory, currencies in index.items()
+            }
+        )
+    return _currencies_by_country
+
+
 def get_currencies_of_country(country_code: str) -> list[Currency]:
     """
     Returns list with currency object(s) given the country's ISO-2 code.
@@ -414,12 +1043,7 @@ def get_currencies_of_country(country_code: str) -> list[Currency]:
     country : str
     The full name of the country to be searched for.
     """
-    country_code = country_code.upper()
-    return sorted(
-        currency
-        for currency in CURRENCIES.values()
-        if country_code in currency.country_codes
-    )
+    return list(get_currencies_by_country().get(country_code.upper(), ()))
 
 
 def list_all_currencies() -> list[Currency]:
@@ -0,0 +1,511 @@
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import AsyncIterable
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Protocol, cast, overload
+
+from .arrays import INDEX_TYPECODE, UNITS_TYPECODE, MoneyArray
+from .classes import Currency, Money, _to_currency, force_decimal
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+    from os import PathLike
+
+    from .classes import M
+
+
+# Maximum number of exchange rates, direct or computed, cached by an ExchangeRates
+# instance.
+RATE_CACHE_SIZE = 1024
+
+# Number of seconds for which AsyncExchangeRates caches the rates of its source.
+RATE_TTL = 60.0
+
+_one = Decimal(1)
+
+
+class ExchangeRateNotFound(Exception):
+    def __init__(self, base: Currency, target: Currency) -> None:
+        super().__init__(base, target)
+        self.base = base
+        self.target = target
+
+    def __str__(self) -> str:
+        return f"No exchange rate from {self.base} to {self.target} is available."
+
+
+class RateSource(Protocol):
+    """
+    A source of exchange rates, as used by ExchangeRates.
+    """
+
+    def get_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        """
+        Returns the amount of target currency one unit of base currency buys, or
+        None if the source has no such rate.
+        """
+
+
+class DictRateSource:
+    """
+    Exchange rates held in a mapping of ``(base, target)`` pairs of currencies or
+    currency codes to rates.
+    """
+
+    def __init__(
+        self, rates: Mapping[tuple[Currency | str, Currency | str], object]
+    ) -> None:
+        self._rates: dict[tuple[Currency, Currency], Decimal] = {
+            (_to_currency(base), _to_currency(target)): force_decimal(rate)
+            for (base, target), rate in rates.items()
+        }
+
+    def get_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        return self._rates.get((base, target))
+
+
+class HistoricalRateSource(Protocol):
+    """
+    A source of exchange rates that change over time, as used by ExchangeRates when
+    converting at a given time.
+    """
+
+    def get_rate(
+        self, base: Currency, target: Currency, at: datetime | None = None
+    ) -> Decimal | None:
+        """
+        Returns the amount of target currency one unit of base currency bought at
+        the given time, or the latest rate if it is None. Returns None if the source
+        has no such rate.
+        """
+
+
+def _read_csv(
+    path_or_file: str | PathLike[str] | IO[str], delimiter: str
+) -> list[list[str]]:
+    """
+    Returns the rows of a CSV file, without the header row if there is one, that is
+    if its last column is named "rate". Files given by path are memory-mapped
+    rather than read through a buffered file object.
+    """
+    import csv
+    import mmap
+    import os
+
+    if isinstance(path_or_file, (str, os.PathLike)):
+        with open(path_or_file, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                lines = (line.decode() for line in iter(mapped.readline, b""))
+                rows = list(csv.reader(lines, delimiter=delimiter))
+    else:
+        rows = list(csv.reader(path_or_file, delimiter=delimiter))
+    if rows and rows[0] and rows[0][-1].strip().lower() == "rate":
+        del rows[0]
+    return [row for row in rows if row]
+
+
+class CSVRateSource(DictRateSource):
+    """
+    Exchange rates read from a CSV file with one ``base,target,rate`` row per rate,
+    for example ``EUR,USD,1.0842``. A header row is skipped if present.
+    """
+
+    def __init__(
+        self, path_or_file: str | PathLike[str] | IO[str], delimiter: str = ","
+    ) -> None:
+        super().__init__(
+            {
+                (base.strip(), target.strip()): rate.strip()
+                for base, target, rate in _read_csv(path_or_file, delimiter)
+            }
+        )
+
+
+class RateHistory:
+    """
+    Exchange rates over time, held as a sorted series of timestamps and rates for
+    every pair of currencies. The rate in effect at a given time is the latest one
+    at or before it, found by binary search.
+
+    Timestamps must be either all naive or all timezone aware.
+    """
+
+    def __init__(
+        self,
+        rates: Iterable[tuple[Currency | str, Currency | str, datetime, object]] = (),
+    ) -> None:
+        self._series: dict[
+            tuple[Currency, Currency], tuple[list[datetime], list[Decimal]]
+        ] = {}
+        self.add_rates(rates)
+
+    @classmethod
+    def from_csv(
+        cls, path_or_file: str | PathLike[str] | IO[str], delimiter: str = ","
+    ) -> RateHistory:
+        """
+        Reads rates from a CSV file with one ``timestamp,base,target,rate`` row per
+        rate, for example ``2024-01-31,EUR,USD,1.0842``. Timestamps are in ISO 8601
+        format. A header row is skipped if present.
+        """
+        return cls(
+            (base.strip(), target.strip(), datetime.fromisoformat(at.strip()), rate)
+            for at, base, target, rate in _read_csv(path_or_file, delimiter)
+        )
+
+    def add_rate(
+        self, base: Currency | str, target: Currency | str, at: datetime, rate: object
+    ) -> None:
+        """
+        Adds the rate from base to target currency in effect from the given time.
+        """
+        self.add_rates([(base, target, at, rate)])
+
+    def add_rates(
+        self, rates: Iterable[tuple[Currency | str, Currency | str, datetime, object]]
+    ) -> None:
+        """
+        Adds many ``(base, target, timestamp, rate)`` rates at once, sorting the
+        series of every pair once. A rate replaces any previous rate of the same pair
+        and timestamp.
+        """
+        added: dict[tuple[Currency, Currency], dict[datetime, Decimal]] = {}
+        for base, target, at, rate in rates:
+            pair = (_to_currency(base), _to_currency(target))
+            added.setdefault(pair, {})[at] = force_decimal(rate)
+        for pair, new in added.items():
+            series = self._series.get(pair)
+            if series is not None:
+                new = {**dict(zip(series[0], series[1])), **new}
+            times = sorted(new)
+            self._series[pair] = (times, [new[at] for at in times])
+
+    def get_rate(
+        self, base: Currency, target: Currency, at: datetime | None = None
+    ) -> Decimal | None:
+        series = self._series.get((base, target))
+        if series is None:
+            return None
+        times, rates = series
+        if at is None:
+            return rates[-1]
+        i = bisect_right(times, at)
+        return rates[i - 1] if i else None
+
+
+class ExchangeRates:
+    """
+    Converts Money between currencies, using the rates of a RateSource.
+
+    A rate that the source doesn't have is derived from the inverse rate, or from
+    the rates to and from the ``base`` currency, if given. Rates are cached once
+    found, up to ``cache_size`` of them, evicting the least recently used ones.
+    """
+
+    def __init__(
+        self,
+        source: RateSource | HistoricalRateSource,
+        base: Currency | str | None = None,
+        cache_size: int = RATE_CACHE_SIZE,
+    ) -> None:
+        self.source = source
+        self.base = None if base is None else _to_currency(base)
+        self._cached_rate = lru_cache(maxsize=cache_size)(self._find_rate)
+
+    def _direct_rate(
+        self, base: Currency, target: Currency, at: datetime | None = None
+    ) -> Decimal | None:
+        if at is None:
+            rate = self.source.get_rate(base, target)
+            inverse = None if rate is not None else self.source.get_rate(target, base)
+        else:
+            # Only historical rate sources accept a timestamp.
+            source = cast("HistoricalRateSource", self.source)
+            rate = source.get_rate(base, target, at=at)
+            inverse = None if rate is not None else source.get_rate(target, base, at=at)
+        if rate is not None:
+            return rate
+        if inverse:
+            return _one / inverse
+        return None
+
+    def _find_rate(
+        self, base: Currency, target: Currency, at: datetime | None = None
+    ) -> Decimal | None:
+        if base == target:
+            return _one
+        rate = self._direct_rate(base, target, at)
+        if rate is not None or self.base is None or self.base in (base, target):
+            return rate
+        # Triangulate through the base currency.
+        to_base = self._direct_rate(base, self.base, at)
+        from_base = self._direct_rate(self.base, target, at)
+        if to_base is None or from_base is None:
+            return None
+        return to_base * from_base
+
+    def get_rate(
+        self,
+        base: Currency | str,
+        target: Currency | str,
+        at: datetime | None = None,
+    ) -> Decimal:
+        """
+        Returns the amount of target currency one unit of base currency buys. Raises
+        ExchangeRateNotFound if there is no such rate.
+
+        If ``at`` is given, the source must be a HistoricalRateSource, and the rates
+        in effect at that time are used. These are not cached, as looking them up
+        in a RateHistory is cheap already.
+        """
+        base = _to_currency(base)
+        target = _to_currency(target)
+        if at is None:
+            rate = self._cached_rate(base, target)
+        else:
+            rate = self._find_rate(base, target, at)
+        if rate is None:
+            raise ExchangeRateNotFound(base, target)
+        return rate
+
+    def clear_cache(self) -> None:
+        """
+        Forgets all cached rates, for example after the rates of the source changed.
+        """
+        self._cached_rate.cache_clear()
+
+    def convert(self, money: M, to: Currency | str, at: datetime | None = None) -> M:
+        """
+        Converts the given Money to another currency, at the rate in effect at the
+        given time if ``at`` is given. The amount is not rounded.
+        """
+        to = _to_currency(to)
+        return money._from_decimal(
+            money.amount * self.get_rate(money.currency, to, at), to
+        )
+
+    @overload
+    def convert_many(  # type: ignore[overload-overlap]
+        self, values: MoneyArray, to: Currency | str, at: datetime | None = None
+    ) -> MoneyArray: ...
+
+    @overload
+    def convert_many(
+        self, values: Iterable[Money], to: Currency | str, at: datetime | None = None
+    ) -> Iterator[Money]: ...
+
+    def convert_many(
+        self,
+        values: MoneyArray | Iterable[Money],
+        to: Currency | str,
+        at: datetime | None = None,
+    ) -> MoneyArray | Iterator[Money]:
+        """
+        Converts every Money of the given iterable to another currency, and yields
+        the results in the same order.
+
+        For a MoneyArray, a new MoneyArray is returned instead, with amounts rounded
+        to minor units of the target currency using the rounding of the current
+        decimal context.
+        """
+        to = _to_currency(to)
+        if isinstance(values, MoneyArray):
+            return self._convert_array(values, to, at)
+        return self._convert_iterable(values, to, at)
+
+    def _convert_iterable(
+        self, values: Iterable[Money], to: Currency, at: datetime | None
+    ) -> Iterator[Money]:
+        rates: dict[Currency, Decimal] = {}
+        for money in values:
+            currency = money.currency
+            rate = rates.get(currency)
+            if rate is None:
+                rate = rates[currency] = self.get_rate(currency, to, at)
+            yield money._from_decimal(money.amount * rate, to)
+
+    def _convert_array(
+        self, values: MoneyArray, to: Currency, at: datetime | None
+    ) -> MoneyArray:
+        # One factor per currency of the array, converting minor units of that
+        # currency into minor units of the target currency. A slice keeps the
+        # currency table of the whole array, so only currencies it has values of are
+        # looked up.
+        factors: dict[int, Decimal] = {}
+        for i in set(values._index):
+            currency = values._currencies[i]
+            factors[i] = (
+                self.get_rate(currency, to, at) * to.sub_unit / currency.sub_unit
+            )
+        units = array(
+            UNITS_TYPECODE,
+            (
+                int((units * factors[i]).to_integral_value())
+                for units, i in zip(values._units, values._index)
+            ),
+        )
+        return MoneyArray._from_columns(
+            units, array(INDEX_TYPECODE, [0]) * len(units), (to,)
+        )
+
+
+class AsyncRateSource(Protocol):
+    """
+    A source of exchange rates fetched asynchronously, as used by
+    AsyncExchangeRates.
+    """
+
+    async def get_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        """
+        Returns the amount of target currency one unit of base currency buys, or
+        None if the source has no such rate.
+        """
+
+
+class LocalRateSource:
+    """
+    Makes a RateSource that doesn't block, such as a DictRateSource, usable as an
+    AsyncRateSource.
+    """
+
+    def __init__(self, source: RateSource) -> None:
+        self.source = source
+
+    async def get_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        return self.source.get_rate(base, target)
+
+
+class AsyncExchangeRates:
+    """
+    Converts Money between currencies like ExchangeRates, using the rates of an
+    AsyncRateSource, without blocking the event loop.
+
+    Rates fetched from the source, including the absence of a rate, are cached for
+    ``ttl`` seconds, up to ``cache_size`` of them. Concurrent requests for a rate
+    that isn't cached share a single fetch from the source.
+    """
+
+    def __init__(
+        self,
+        source: AsyncRateSource,
+        base: Currency | str | None = None,
+        ttl: float = RATE_TTL,
+        cache_size: int = RATE_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.source = source
+        self.base = None if base is None else _to_currency(base)
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self._clock = clock
+        # Pairs of currencies to the time their rate expires and the rate.
+        self._cache: dict[tuple[Currency, Currency], tuple[float, Decimal | None]] = {}
+        # Pairs of currencies to the fetch of their rate in progress.
+        self._pending: dict[
+            tuple[Currency, Currency], asyncio.Future[Decimal | None]
+        ] = {}
+
+    async def _fetch(self, base: Currency, target: Currency) -> Decimal | None:
+        # Imported here, as importing asyncio takes longer than importing moneyed.
+        import asyncio
+
+        pair = (base, target)
+        cached = self._cache.get(pair)
+        if cached is not None and cached[0] > self._clock():
+            return cached[1]
+        future = self._pending.get(pair)
+        if future is None:
+            future = self._pending[pair] = asyncio.ensure_future(self._load(pair))
+        # Shielded, so that a cancelled caller doesn't cancel the fetch for others.
+        return await asyncio.shield(future)
+
+    async def _load(self, pair: tuple[Currency, Currency]) -> Decimal | None:
+        try:
+            rate = await self.source.get_rate(*pair)
+        finally:
+            del self._pending[pair]
+        cache = self._cache
+        cache.pop(pair, None)
+        if len(cache) >= self.cache_size:
+            # Evict the rate fetched the longest time ago.
+            del cache[next(iter(cache))]
+        cache[pair] = (self._clock() + self.ttl, rate)
+        return rate
+
+    async def _direct_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        rate = await self._fetch(base, target)
+        if rate is not None:
+            return rate
+        inverse = await self._fetch(target, base)
+        if inverse:
+            return _one / inverse
+        return None
+
+    async def _find_rate(self, base: Currency, target: Currency) -> Decimal | None:
+        if base == target:
+            return _one
+        rate = await self._direct_rate(base, target)
+        if rate is not None or self.base is None or self.base in (base, target):
+            return rate
+        import asyncio
+
+        # Triangulate through the base currency, fetching both rates concurrently.
+        to_base, from_base = await asyncio.gather(
+            self._direct_rate(base, self.base), self._direct_rate(self.base, target)
+        )
+        if to_base is None or from_base is None:
+            return None
+        return to_base * from_base
+
+    async def get_rate(self, base: Currency | str, target: Currency | str) -> Decimal:
+        """
+        Returns the amount of target currency one unit of base currency buys. Raises
+        ExchangeRateNotFound if there is no such rate.
+        """
+        base = _to_currency(base)
+        target = _to_currency(target)
+        rate = await self._find_rate(base, target)
+        if rate is None:
+            raise ExchangeRateNotFound(base, target)
+        return rate
+
+    def clear_cache(self) -> None:
+        """
+        Forgets all cached rates, for example after the rates of the source changed.
+        """
+        self._cache.clear()
+
+    async def convert(self, money: M, to: Currency | str) -> M:
+        """
+        Converts the given Money to another currency. The amount is not rounded.
+        """
+        to = _to_currency(to)
+        rate = await self.get_rate(money.currency, to)
+        return money._from_decimal(money.amount * rate, to)
+
+    async def convert_many(
+        self, values: Iterable[M] | AsyncIterable[M], to: Currency | str
+    ) -> AsyncIterator[M]:
+        """
+        Converts every Money of the given iterable, or asynchronous iterable, to
+        another currency, and yields the results in the same order.
+        """
+        to = _to_currency(to)
+        if not isinstance(values, AsyncIterable):
+            values = _aiter(values)
+        async for money in values:
+            rate = await self.get_rate(money.currency, to)
+            yield money._from_decimal(money.amount * rate, to)
+
+
+async def _aiter(values: Iterable[M]) -> AsyncIterator[M]:
+    for value in values:
+        yield value
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import threading
+from functools import wraps
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+from . import classes, l10n
+from .classes import Currency, MinorUnitMoney, Money
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    Timings = dict[str, dict[str, int]]
+
+
+class Collector:
+    """
+    Accumulates the counts and times reported by instrumented functions. Subclass
+    it and override ``increment()`` and ``observe()`` to forward measurements to
+    another metrics system as they are taken.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._timers: dict[str, list[int]] = {}
+
+    def increment(self, name: str) -> None:
+        """
+        Adds one to the named counter.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def observe(self, name: str, elapsed_ns: int) -> None:
+        """
+        Records one call of the named function, which took the given number of
+        nanoseconds.
+        """
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, elapsed_ns]
+            else:
+                timer[0] += 1
+                timer[1] += elapsed_ns
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns a copy of the measurements so far, as a dictionary with plain values
+        that can be exported as is::
+
+            {
+                "counters": {"currency_lookup.hit": 2, ...},
+                "timers": {"Money.__init__": {"count": 2, "total_ns": 1300}, ...},
+            }
+        """
+        with self._lock:
+            timers: Timings = {
+                name: {"count": count, "total_ns": total_ns}
+                for name, (count, total_ns) in self._timers.items()
+            }
+            return {"counters": dict(self._counters), "timers": timers}
+
+    def reset(self) -> None:
+        """
+        Forgets all measurements.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+# The originals of the patched attributes, as (owner, name, original) triples.
+_patched: list[tuple[object, str, object]] = []
+_collector: Collector | None = None
+# Nesting depth of instrumented operators, so that an error raised by an operator
+# delegating to another one is only counted once.
+_state = threading.local()
+
+
+def _timed(name: str, func: Callable[..., Any], collector: Collector) -> Any:
+    observe = collector.observe
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            observe(name, perf_counter_ns() - start)
+
+    return wrapper
+
+
+def _init(name: str, func: Callable[..., None], collector: Collector) -> Any:
+    observe = collector.observe
+    increment = collector.increment
+    lookup = classes._currency_lookup
+
+    @wraps(func)
+    def __init__(self: Money, *args: Any, **kwargs: Any) -> None:
+        start = perf_counter_ns()
+        currency = args[1] if len(args) > 1 else kwargs.get("currency")
+        if currency is not None and not isinstance(currency, Currency):
+            try:
+                found = currency in lookup
+            except TypeError:
+                found = False
+            increment("currency_lookup.hit" if found else "currency_lookup.miss")
+        try:
+            func(self, *args, **kwargs)
+        finally:
+            observe(name, perf_counter_ns() - start)
+
+    return __init__
+
+
+def _operator(
+    name: str, func: Callable[..., Any], collector: Collector, float_deprecated: bool
+) -> Any:
+    observe = collector.observe
+    increment = collector.increment
+
+    @wraps(func)
+    def wrapper(self: Money, other: object) -> Any:
+        start = perf_counter_ns()
+        depth = getattr(_state, "depth", 0)
+        if float_deprecated and depth == 0 and isinstance(other, float):
+            increment("float_deprecated")
+        _state.depth = depth + 1
+        try:
+            return func(self, other)
+        except TypeError:
+            if (
+                depth == 0
+                and isinstance(other, Money)
+                and other.currency != self.currency
+            ):
+                increment("currency_mismatch")
+            raise
+        finally:
+            _state.depth = depth
+            observe(name, perf_counter_ns() - start)
+
+    return wrapper
+
+
+def _get_formatter(func: Any, collector: Collector) -> Any:
+    increment = collector.increment
+    cache_info = func.cache_info
+
+    @wraps(func)
+    def get_formatter(*args: Any, **kwargs: Any) -> l10n.MoneyFormatter:
+        misses = cache_info().misses
+        formatter: l10n.MoneyFormatter = func(*args, **kwargs)
+        if cache_info().misses == misses:
+            increment("formatter_cache.hit")
+        else:
+            increment("formatter_cache.miss")
+        return formatter
+
+    get_formatter.cache_info = cache_info  # type: ignore[attr-defined]
+    get_formatter.cache_clear = func.cache_clear  # type: ignore[attr-defined]
+    return get_formatter
+
+
+_OPERATORS = (
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__truediv__",
+    "__rmod__",
+    "__lt__",
+    "__gt__",
+    "__le__",
+    "__ge__",
+)
+# Operators that warn when given a float.
+_FLOAT_DEPRECATED = ("__mul__", "__rmul__", "__truediv__", "__rmod__")
+
+
+def _patch(owner: object, name: str, replacement: object) -> None:
+    _patched.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _patch_function(name: str, replacement: object) -> None:
+    import moneyed
+
+    original = getattr(classes, name, None) or getattr(l10n, name)
+    for module in (moneyed, classes, l10n):
+        if getattr(module, name, None) is original:
+            _patch(module, name, replacement)
+
+
+def enable(collector: Collector | None = None) -> Collector:
+    """
+    Swaps instrumented versions of the Money constructors and operators,
+    ``get_currency()`` and ``format_money()`` into their classes and modules, which
+    report to the given collector, or a new one, and returns the collector. If
+    instrumentation is enabled already, the previous collector is replaced.
+
+    Functions are timed under their qualified name, such as ``Money.__add__``, and
+    the counters listed in the documentation are incremented. Functions imported by
+    name before instrumentation is enabled keep calling the originals.
+    """
+    global _collector
+    disable()
+    if collector is None:
+        collector = Collector()
+    for cls in (Money, MinorUnitMoney):
+        methods = vars(cls)
+        if "__init__" in methods:
+            qualname = f"{cls.__name__}.__init__"
+            _patch(cls, "__init__", _init(qualname, methods["__init__"], collector))
+        for name in _OPERATORS:
+            if name in methods:
+                qualname = f"{cls.__name__}.{name}"
+                operator = _operator(
+                    qualname, methods[name], collector, name in _FLOAT_DEPRECATED
+                )
+                _patch(cls, name, operator)
+    _patch_function(
+        "get_currency", _timed("get_currency", classes.get_currency, collector)
+    )
+    _patch_function(
+        "format_money", _timed("format_money", l10n.format_money, collector)
+    )
+    _patch(l10n, "get_formatter", _get_formatter(l10n.get_formatter, collector))
+    _collector = collector
+    return collector
+
+
+def disable() -> None:
+    """
+    Restores the uninstrumented functions. Does nothing if instrumentation isn't
+    enabled.
+    """
+    global _collector
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+    _collector = None
+
+
+def snapshot() -> dict[str, Any]:
+    """
+    Returns the measurements of the enabled collector, see ``Collector.snapshot()``.
+    Returns empty measurements if instrumentation isn't enabled.
+    """
+    if _collector is None:
+        return {"counters": {}, "timers": {}}
+    return _collector.snapshot()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import csv
+from array import array
+from decimal import Decimal, InvalidOperation
+from typing import IO, TYPE_CHECKING, overload
+
+from .arrays import INDEX_TYPECODE, UNITS_TYPECODE, MoneyArray
+from .classes import (
+    CurrencyDoesNotExist,
+    Money,
+    _minor_units_from_decimal,
+    _to_currency,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import PathLike
+
+    from .classes import Currency
+
+
+def _mapped_lines(path: str | PathLike[str], encoding: str) -> Iterator[str]:
+    """
+    Yields the lines of a memory-mapped file, decoded one at a time.
+    """
+    import mmap
+    import os
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.decode(encoding)
+
+
+def _rows(
+    path_or_file: str | PathLike[str] | IO[str],
+    delimiter: str,
+    encoding: str,
+    mmap: bool,
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yields the line number and fields of every non-empty row of a CSV file, reading
+    files given by path lazily, and closing them once done.
+    """
+    import os
+
+    if not isinstance(path_or_file, (str, os.PathLike)):
+        reader = csv.reader(path_or_file, delimiter=delimiter)
+        yield from ((reader.line_num, row) for row in reader if row)
+    elif mmap:
+        reader = csv.reader(_mapped_lines(path_or_file, encoding), delimiter=delimiter)
+        yield from ((reader.line_num, row) for row in reader if row)
+    else:
+        with open(path_or_file, newline="", encoding=encoding) as file:
+            reader = csv.reader(file, delimiter=delimiter)
+            yield from ((reader.line_num, row) for row in reader if row)
+
+
+def _column_index(header: list[str], column: int | str) -> int:
+    if isinstance(column, int):
+        return column
+    names = [name.strip() for name in header]
+    try:
+        return names.index(column)
+    except ValueError:
+        raise ValueError(f"The CSV file has no column named {column!r}.") from None
+
+
+def _fields(
+    rows: Iterable[tuple[int, list[str]]], amount_col: int, currency_col: int
+) -> Iterator[tuple[int, Decimal, Currency]]:
+    """
+    Parses the amount and currency of every row, and yields them with the line
+    number of the row. Currencies are resolved once per distinct code, and amounts
+    are parsed by Decimal directly.
+    """
+    currencies: dict[str, Currency] = {}
+    for line, row in rows:
+        try:
+            amount_field = row[amount_col]
+            code = row[currency_col]
+        except IndexError:
+            raise ValueError(
+                f"Line {line} has fewer than {max(amount_col, currency_col) + 1} "
+                "columns."
+            ) from None
+        currency = currencies.get(code)
+        if currency is None:
+            try:
+                currency = currencies[code] = _to_currency(code.strip())
+            except CurrencyDoesNotExist as exc:
+                # Keep the type callers catch, and name the line like amounts do.
+                exc.args = (f"{str(exc).rstrip('.')} on line {line}.",)
+                raise
+        try:
+            amount = Decimal(amount_field)
+        except InvalidOperation:
+            amount = None
+        # Decimal also accepts NaN, infinities and underscores between digits.
+        if amount is None or not amount.is_finite() or "_" in amount_field:
+            raise ValueError(f"Invalid amount {amount_field!r} on line {line}.")
+        yield line, amount, currency
+
+
+def _read_fields(
+    rows: Iterator[tuple[int, list[str]]],
+    amount_col: int | str,
+    currency_col: int | str,
+    header: bool,
+) -> Iterator[tuple[int, Decimal, Currency]]:
+    if header:
+        first = next(rows, None)
+        if first is None:
+            return
+        names = first[1]
+        amount_col = _column_index(names, amount_col)
+        currency_col = _column_index(names, currency_col)
+    # Without a header, both columns are indices.
+    yield from _fields(rows, int(amount_col), int(currency_col))
+
+
+def _chunks(
+    fields: Iterable[tuple[int, Decimal, Currency]], chunk_size: int
+) -> Iterator[MoneyArray]:
+    units = array(UNITS_TYPECODE)
+    index = array(INDEX_TYPECODE)
+    currencies: list[Currency] = []
+    positions: dict[Currency, int] = {}
+    for line, amount, currency in fields:
+        position = positions.get(currency)
+        if position is None:
+            position = positions[currency] = len(currencies)
+            currencies.append(currency)
+        try:
+            units.append(_minor_units_from_decimal(amount, currency))
+        except ValueError:
+            raise ValueError(
+                f"Amount {amount} on line {line} cannot be represented in minor units "
+                f"of {currency}."
+            ) from None
+        index.append(position)
+        if len(units) == chunk_size:
+            yield MoneyArray._from_columns(units, index, tuple(currencies))
+            units = array(UNITS_TYPECODE)
+            index = array(INDEX_TYPECODE)
+            currencies = []
+            positions = {}
+    if units:
+        yield MoneyArray._from_columns(units, index, tuple(currencies))
+
+
+@overload
+def read_money_csv(
+    path_or_file: str | PathLike[str] | IO[str],
+    amount_col: int | str,
+    currency_col: int | str,
+    chunk_size: None = None,
+    *,
+    header: bool | None = None,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    mmap: bool = False,
+) -> Iterator[Money]: ...
+
+
+@overload
+def read_money_csv(
+    path_or_file: str | PathLike[str] | IO[str],
+    amount_col: int | str,
+    currency_col: int | str,
+    chunk_size: int,
+    *,
+    header: bool | None = None,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    mmap: bool = False,
+) -> Iterator[MoneyArray]: ...
+
+
+def read_money_csv(
+    path_or_file: str | PathLike[str] | IO[str],
+    amount_col: int | str,
+    currency_col: int | str,
+    chunk_size: int | None = None,
+    *,
+    header: bool | None = None,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    mmap: bool = False,
+) -> Iterator[Money] | Iterator[MoneyArray]:
+    """
+    Reads amounts and currency codes from the given columns of a CSV file, and
+    yields them as Money instances, or as MoneyArrays of up to ``chunk_size``
+    values if it is given. The file is read lazily, one row at a time, so memory
+    use doesn't depend on its size.
+
+    Columns are given by index, or by name if the file has a header row. The first
+    row is read as the header, and skipped, if ``header`` is true, which is the
+    default if any column is given by name.
+
+    Amounts must be finite decimal numbers, like ``-1234.56`` or ``1.5E3``, and
+    currencies ISO 4217 codes in any case. Amounts of MoneyArrays must be whole minor units of
+    their currency. Empty rows are skipped, and ValueError is raised for rows with a
+    missing column or an invalid amount.
+
+    Files given by path are memory-mapped if ``mmap`` is true, which is faster for
+    large files on some systems.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1.")
+    by_name = isinstance(amount_col, str) or isinstance(currency_col, str)
+    if header is None:
+        header = by_name
+    elif by_name and not header:
+        raise ValueError("Columns can only be given by name if there is a header.")
+    fields = _read_fields(
+        _rows(path_or_file, delimiter, encoding, mmap),
+        amount_col,
+        currency_col,
+        header,
+    )
+    if chunk_size is not None:
+        return _chunks(fields, chunk_size)
+    return (Money._from_decimal(amount, currency) for _, amount, currency in fields)
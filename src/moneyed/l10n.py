@@ -1,20 +1,167 @@
 from __future__ import annotations
 
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal, cast
 
-from babel.numbers import LC_NUMERIC
-from babel.numbers import format_currency as babel_format_currency
-
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from babel import Locale
+    from babel.numbers import NumberPattern
+
+    from .classes import Currency, Money
+
+# Babel is imported when it is first needed, rather than when this module is imported,
+# as importing it is the bulk of the time it takes to import moneyed.
+
+
+def _parse_locale(locale: Locale | str | None) -> Locale:
+    """
+    Returns the Locale for the given identifier, or the system default locale for
+    numbers if it is None.
+    """
+    from babel import Locale
+    from babel.numbers import LC_NUMERIC
+
+    return Locale.parse(locale or LC_NUMERIC)
+
+
+# Maximum number of MoneyFormatter instances kept around by format_money(), one per
+# distinct combination of locale and formatting options.
+FORMATTER_CACHE_SIZE = 128
+
+
+class MoneyFormatter:
+    """
+    Formats Money instances for one locale and set of options, like
+    ``format_money()`` does.
+
+    The locale and number pattern are resolved once, when the formatter is
+    created, and the currency symbol and number of digits are resolved once per
+    currency. This makes repeatedly formatting values much cheaper than calling
+    ``babel.numbers.format_currency`` for each of them.
+    """
+
+    def __init__(
+        self,
+        locale: Locale | str | None = None,
+        format: str | None = None,
+        format_type: Literal["name", "standard", "accounting"] = "standard",
+        currency_digits: bool = True,
+        decimal_quantization: bool = True,
+    ) -> None:
+        from babel.numbers import parse_pattern
+
+        self.locale = _parse_locale(locale)
+        self._format = format
+        self.format_type = format_type
+        self.currency_digits = currency_digits
+        self.decimal_quantization = decimal_quantization
+        self._pattern: NumberPattern | None = None
+        if format_type != "name":
+            self._pattern = (
+                parse_pattern(format)
+                if format
+                else self.locale.currency_formats[format_type]
+            )
+        self._patterns: dict[str, NumberPattern | None] = {}
+
+    def _currency_pattern(self, code: str) -> NumberPattern | None:
+        """
+        Returns a copy of the number pattern with the currency symbol and digits of
+        the given currency filled in, or None if the pattern depends on the amount
+        being formatted.
+        """
+        import copy
+
+        from babel.numbers import get_currency_precision, get_currency_symbol
 
-    from .classes import Money
+        pattern = self._pattern
+        if pattern is None or "¤¤¤" in pattern.pattern:
+            # Currency names are pluralized according to the amount.
+            return None
+        symbol = get_currency_symbol(code, self.locale)
+
+        def fill(affix: str) -> str:
+            return affix.replace("¤¤", code).replace("¤", symbol)
+
+        pattern = copy.copy(pattern)
+        pattern.prefix = (fill(pattern.prefix[0]), fill(pattern.prefix[1]))
+        pattern.suffix = (fill(pattern.suffix[0]), fill(pattern.suffix[1]))
+        if self.currency_digits:
+            digits = get_currency_precision(code)
+            pattern.frac_prec = (digits, digits)
+        return pattern
+
+    def format(self, money: Money) -> str:
+        code = money.currency.code
+        try:
+            pattern = self._patterns[code]
+        except KeyError:
+            pattern = self._patterns[code] = self._currency_pattern(code)
+        if pattern is not None:
+            return cast(
+                "str",
+                pattern.apply(
+                    money.amount,
+                    self.locale,
+                    currency_digits=False,
+                    decimal_quantization=self.decimal_quantization,
+                ),
+            )
+        if self._pattern is not None:
+            return cast(
+                "str",
+                self._pattern.apply(
+                    money.amount,
+                    self.locale,
+                    currency=code,
+                    currency_digits=self.currency_digits,
+                    decimal_quantization=self.decimal_quantization,
+                ),
+            )
+        from babel.numbers import format_currency as babel_format_currency
+
+        return cast(
+            "str",
+            babel_format_currency(
+                money.amount,
+                code,
+                format=self._format,
+                locale=self.locale,
+                currency_digits=self.currency_digits,
+                format_type=self.format_type,
+                decimal_quantization=self.decimal_quantization,
+            ),
+        )
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_formatter(
+    locale: Locale | str | None = None,
+    format: str | None = None,
+    format_type: Literal["name", "standard", "accounting"] = "standard",
+    currency_digits: bool = True,
+    decimal_quantization: bool = True,
+) -> MoneyFormatter:
+    """
+    Returns a shared MoneyFormatter for the given locale and options. The most
+    recently used formatters are cached.
+    """
+    return MoneyFormatter(
+        locale=locale,
+        format=format,
+        format_type=format_type,
+        currency_digits=currency_digits,
+        decimal_quantization=decimal_quantization,
+    )
 
 
 def format_money(
     money: Money,
     format: str | None = None,
-    locale: Locale | str | None = LC_NUMERIC,
+    locale: Locale | str | None = None,
     currency_digits: bool = True,
     format_type: Literal["name", "standard", "accounting"] = "standard",
     decimal_quantization: bool = True,
@@ -22,15 +169,209 @@ def format_money(
     """
     See https://babel.pocoo.org/en/latest/api/numbers.html
     """
-    return cast(
-        "str",
-        babel_format_currency(
-            money.amount,
-            money.currency.code,
-            format=format,
-            locale=locale,
-            currency_digits=currency_digits,
-            format_type=format_type,
-            decimal_quantization=decimal_quantization,
-        ),
+    return get_formatter(
+        locale, format, format_type, currency_digits, decimal_quantization
+    ).format(money)
+
+
+def format_many(
+    moneys: Iterable[Money],
+    format: str | None = None,
+    locale: Locale | str | None = None,
+    currency_digits: bool = True,
+    format_type: Literal["name", "standard", "accounting"] = "standard",
+    decimal_quantization: bool = True,
+) -> Iterator[str]:
+    """
+    Formats each of the given Money instances like ``format_money()`` does, and
+    yields the results in the same order. The locale and pattern are resolved once
+    for the whole iterable, and once per currency.
+    """
+    format_one = get_formatter(
+        locale, format, format_type, currency_digits, decimal_quantization
+    ).format
+    for money in moneys:
+        yield format_one(money)
+
+
+class MoneyParseError(ValueError):
+    """
+    Raised by parse_money() when a string can't be parsed as an amount of money.
+    """
+
+
+# Bidirectional text marks, as used in the patterns of right-to-left locales.
+_bidi_marks = dict.fromkeys(map(ord, "\u061c\u200e\u200f"))
+
+
+def _normalize(text: str) -> str:
+    """
+    Removes bidirectional text marks, and collapses all whitespace to plain spaces.
+    """
+    return " ".join(text.translate(_bidi_marks).split())
+
+
+def _alternatives(options: Iterable[str]) -> str:
+    import re
+
+    # Longest first, so that e.g. "US$" is preferred over "$".
+    return "|".join(
+        re.escape(option) for option in sorted(options, key=len, reverse=True)
     )
+
+
+class MoneyParser:
+    """
+    Parses localized money strings, like the ones produced by ``format_money()``,
+    for one locale.
+
+    The currency symbols of the locale and the regular expression used to match
+    numbers are built once, when the parser is created.
+    """
+
+    def __init__(self, locale: Locale | str | None = None) -> None:
+        import re
+
+        from babel.numbers import (
+            get_decimal_symbol,
+            get_group_symbol,
+            get_minus_sign_symbol,
+            get_plus_sign_symbol,
+            get_territory_currencies,
+        )
+
+        from .classes import CURRENCIES
+
+        self.locale = _parse_locale(locale)
+        self._decimal = get_decimal_symbol(self.locale)
+        group = get_group_symbol(self.locale)
+        # Whitespace in the input is normalized to plain spaces before matching.
+        self._groups = {" " if group.isspace() else group}
+        if group == "’":
+            self._groups.add("'")
+        signs = {"-", "\u2212", get_minus_sign_symbol(self.locale)}
+        self._minus = set(signs)
+        signs.update(("+", get_plus_sign_symbol(self.locale)))
+
+        local = (
+            get_territory_currencies(self.locale.territory)
+            if self.locale.territory
+            else []
+        )
+        candidates: dict[str, list[Currency]] = {}
+        for code, symbol in self.locale.currency_symbols.items():
+            currency = CURRENCIES.get(code)
+            if currency is not None and symbol != code:
+                symbol = _normalize(symbol)
+                candidates.setdefault(symbol, []).append(currency)
+        # Symbols shared by several currencies resolve to the currency of the
+        # locale's territory if possible, and are ambiguous otherwise.
+        self._symbols: dict[str, tuple[Currency, ...]] = {}
+        for symbol, currencies in candidates.items():
+            preferred = [currency for currency in currencies if currency.code in local]
+            self._symbols[symbol] = tuple(
+                preferred if len(preferred) == 1 else currencies
+            )
+
+        sign = _alternatives(signs)
+        symbol = _alternatives(self._symbols) + "|[A-Za-z]{3}"
+        decimal = re.escape(self._decimal)
+        # Group separators are only accepted where the locale's patterns put them,
+        # so that e.g. "1,23" isn't read as 123 in a locale grouping by thousands.
+        integer = r"\d+"
+        group = f"(?:{_alternatives(self._groups)})"
+        formats = self.locale.currency_formats
+        for primary, secondary in {
+            formats[format_type].grouping
+            for format_type in ("standard", "accounting")
+            if format_type in formats
+        }:
+            if primary < 1000:
+                integer += (
+                    rf"|\d{{1,{secondary}}}(?:{group}\d{{{secondary}}})*"
+                    rf"{group}\d{{{primary}}}"
+                )
+        number = rf"(?:{integer})(?:{decimal}\d*)?|{decimal}\d+"
+        self._pattern = re.compile(
+            rf"(?P<open>\()? ?(?P<sign>{sign})? ?(?P<prefix>{symbol})? ?"
+            rf"(?P<sign2>{sign})? ?(?P<number>{number}) ?(?P<suffix>{symbol})? ?"
+            rf"(?P<sign3>{sign})? ?(?P<close>\))?"
+        )
+
+    def parse(self, text: str, default_currency: Currency | str | None = None) -> Money:
+        from .classes import Money, _to_currency
+
+        match = self._pattern.fullmatch(_normalize(text))
+        if match is None:
+            raise MoneyParseError(f"Cannot parse {text!r} as money.")
+        opening, sign, prefix, sign2, number, suffix, sign3, closing = match.groups()
+        signs = [s for s in (sign, sign2, sign3) if s is not None]
+        if len(signs) > 1 or bool(opening) != bool(closing) or (opening and signs):
+            raise MoneyParseError(f"Cannot parse {text!r} as money.")
+        if prefix is not None and suffix is not None:
+            raise MoneyParseError(f"{text!r} contains more than one currency.")
+
+        if default_currency is not None:
+            default_currency = _to_currency(default_currency)
+        currency = self._resolve_currency(prefix or suffix, default_currency, text)
+
+        for group in self._groups:
+            number = number.replace(group, "")
+        try:
+            amount = Decimal(number.replace(self._decimal, "."))
+        except InvalidOperation:
+            raise MoneyParseError(f"Cannot parse {text!r} as money.") from None
+        if opening or (signs and signs[0] in self._minus):
+            amount = -amount
+        return Money._from_decimal(amount, currency)
+
+    def _resolve_currency(
+        self, token: str | None, default: Currency | None, text: str
+    ) -> Currency:
+        from .classes import get_currency_or_none
+
+        if token is None:
+            if default is None:
+                raise MoneyParseError(
+                    f"{text!r} has no currency and no default currency was given."
+                )
+            return default
+        candidates = self._symbols.get(token)
+        if candidates is None:
+            currency = get_currency_or_none(token)
+            if currency is None:
+                raise MoneyParseError(f"Unknown currency {token!r} in {text!r}.")
+            return currency
+        if len(candidates) == 1:
+            return candidates[0]
+        if default in candidates:
+            return default
+        raise MoneyParseError(
+            f"Currency symbol {token!r} in {text!r} is ambiguous, it may stand for "
+            + ", ".join(currency.code for currency in candidates)
+            + "."
+        )
+
+
+@lru_cache(maxsize=FORMATTER_CACHE_SIZE)
+def get_parser(locale: Locale | str | None = None) -> MoneyParser:
+    """
+    Returns a shared MoneyParser for the given locale. The most recently used
+    parsers are cached.
+    """
+    return MoneyParser(locale)
+
+
+def parse_money(
+    text: str,
+    locale: Locale | str | None = None,
+    default_currency: Currency | str | None = None,
+) -> Money:
+    """
+    Parses a localized string like ``"1.234,56 €"`` or ``"$1,234.56"`` into a Money
+    instance. The currency may be given as a symbol of the locale or as an ISO
+    code. Strings without a currency use ``default_currency``.
+
+    Raises MoneyParseError if the string can't be parsed.
+    """
+    return get_parser(locale).parse(text, default_currency)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from decimal import Decimal
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from .arrays import MoneyArray
+from .bag import MoneyBag
+from .classes import Currency, Money
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from typing import Union
+
+    Chunk = Union[tuple[list[str], list[Currency]], MoneyArray]
+    Totals = Union[MoneyBag, dict[Currency, int]]
+
+
+# Number of values sent to a worker process at a time.
+CHUNK_SIZE = 50_000
+
+
+def _chunks(values: Iterable[Money] | MoneyArray, chunk_size: int) -> Iterator[Chunk]:
+    if isinstance(values, MoneyArray):
+        # Slices of a MoneyArray are pickled as raw column buffers.
+        for start in range(0, len(values), chunk_size):
+            end = start + chunk_size
+            yield values[start:end]
+        return
+    iterator = iter(values)
+    while True:
+        moneys = list(islice(iterator, chunk_size))
+        if not moneys:
+            return
+        # Pickling amounts as strings is several times faster than pickling Money
+        # or Decimal instances, and every currency is pickled once per chunk.
+        try:
+            amounts = [str(money.amount) for money in moneys]
+            currencies = [money.currency for money in moneys]
+        except AttributeError:
+            value = next(money for money in moneys if not isinstance(money, Money))
+            raise TypeError(
+                f"Cannot add {type(value).__name__} to a MoneyBag."
+            ) from None
+        yield amounts, currencies
+
+
+def _array_totals(values: MoneyArray) -> dict[Currency, int]:
+    currencies = values._currencies
+    if len(currencies) == 1 and values._units:
+        return {currencies[0]: sum(values._units)}
+    units = [0] * len(currencies)
+    for i, amount in zip(values._index, values._units):
+        units[i] += amount
+    # A slice keeps the currency table of the whole array, so skip currencies it
+    # has no values of.
+    return {currencies[i]: units[i] for i in sorted(set(values._index))}
+
+
+def _totals(chunk: Chunk) -> Totals:
+    """
+    Reduces a chunk to per-currency totals: integer minor units for a MoneyArray,
+    and a MoneyBag otherwise.
+    """
+    if isinstance(chunk, MoneyArray):
+        return _array_totals(chunk)
+    bag = MoneyBag()
+    totals = bag._totals
+    get = totals.get
+    for amount, currency in zip(*chunk):
+        totals[currency] = get(currency, 0) + Decimal(amount)
+    return bag
+
+
+class _Reducer:
+    __slots__ = ("bag", "units")
+
+    def __init__(self) -> None:
+        self.bag = MoneyBag()
+        self.units: dict[Currency, int] = {}
+
+    def add(self, totals: Totals) -> None:
+        if isinstance(totals, MoneyBag):
+            self.bag.merge(totals)
+            return
+        units = self.units
+        for currency, amount in totals.items():
+            units[currency] = units.get(currency, 0) + amount
+
+    def result(self) -> MoneyBag:
+        # Minor units are summed as integers, and only converted once per currency.
+        bag = self.bag
+        for currency, amount in self.units.items():
+            bag.add(Money.from_minor_units(amount, currency))
+        return bag
+
+
+def parallel_totals(
+    values: Iterable[Money] | MoneyArray,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> MoneyBag:
+    """
+    Totals the given Money instances by currency, sharding them in chunks of
+    ``chunk_size`` values across a pool of ``workers`` processes, which defaults to
+    the number of processors. Every worker reduces its chunks to per-currency
+    totals, which are merged into the returned MoneyBag. With a single worker,
+    totals are computed in the calling process.
+
+    Chunks are pickled to send them to the workers, which for ``Money`` instances
+    costs about as much as adding them in the calling process. Shard a MoneyArray
+    instead, whose chunks are pickled as raw buffers and totalled in integer minor
+    units, to make use of more processors.
+
+    Iterables are consumed lazily, keeping at most two chunks per worker in memory.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("The number of workers must be at least 1.")
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1.")
+    workers = workers or os.cpu_count() or 1
+    reducer = _Reducer()
+    if workers == 1:
+        if isinstance(values, MoneyArray):
+            reducer.add(_array_totals(values))
+        else:
+            reducer.bag.update(values)
+        return reducer.result()
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending: set[Future[Totals]] = set()
+        for chunk in _chunks(values, chunk_size):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    reducer.add(future.result())
+            pending.add(executor.submit(_totals, chunk))
+        for future in pending:
+            reducer.add(future.result())
+    return reducer.result()
+
+
+def parallel_sum(
+    values: Iterable[Money] | MoneyArray,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Money:
+    """
+    Returns the sum of the given Money instances, which must all have the same
+    currency, computed like ``parallel_totals()``. Raises ValueError if there are no
+    values, and TypeError if their currencies differ.
+    """
+    totals = parallel_totals(values, workers, chunk_size)
+    if not totals:
+        raise ValueError("Cannot sum an empty iterable.")
+    if len(totals) > 1:
+        raise TypeError(
+            "Cannot add or subtract two Money instances with different currencies."
+        )
+    (total,) = totals.to_dict().values()
+    return total
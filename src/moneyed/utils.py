@@ -22,3 +22,24 @@ class cached_property(Generic[A, R]):
     def __get__(self, instance: A, type: type) -> R:
         res = instance.__dict__[self.func.__name__] = self.func(instance)
         return res
+
+
+class cached_slot_property(Generic[A, R]):
+    """
+    Variant of cached_property for classes that use __slots__ and therefore have
+    no instance __dict__. The value is cached in the slot named after the method
+    prefixed with ``_cached_``, which the class must declare in its __slots__.
+    """
+
+    def __init__(self, func: Callable[[A], R]) -> None:
+        self.func = func
+        self.slot = f"_cached_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: A, type: type) -> R:
+        try:
+            return getattr(instance, self.slot)  # type: ignore[no-any-return]
+        except AttributeError:
+            res = self.func(instance)
+            setattr(instance, self.slot, res)
+            return res
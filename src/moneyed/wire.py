@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import struct
+from decimal import MAX_PREC, Context, Decimal
+from typing import TYPE_CHECKING
+
+from .classes import CURRENCIES_BY_ISO, CurrencyDoesNotExist, Money
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .classes import Currency
+
+# Every Money value is encoded as the ISO 4217 numeric code of its currency, as an
+# unsigned big-endian 16 bit integer, followed by the exponent of its amount, as a
+# signed byte, and the coefficient of its amount, as a zigzag encoded variable
+# length integer of seven bits per byte, least significant group first. Keeping
+# the exponent makes values round trip exactly, including trailing zeros, and
+# encoded values are self-delimiting, so pack_many() simply concatenates them.
+
+_header = struct.Struct(">Hb")
+
+# Scaling by a power of ten is exact in this context, whatever the number of digits.
+_exact = Context(prec=MAX_PREC)
+
+
+def _numeric_code(currency: Currency) -> int:
+    """
+    Returns the numeric code of the currency, or raises ValueError if it has none
+    or shares it with another registered currency.
+    """
+    if currency.numeric is None:
+        raise ValueError(f"{currency} has no numeric code and cannot be encoded.")
+    if CURRENCIES_BY_ISO.get(currency.numeric) != currency:
+        raise ValueError(
+            f"The numeric code {currency.numeric} of {currency} is used by another "
+            "currency, so it cannot be encoded."
+        )
+    return int(currency.numeric)
+
+
+def _encode(amount: Decimal, code: int, out: bytearray) -> None:
+    exponent = amount.as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError(f"{amount} cannot be encoded.")
+    if not -128 <= exponent <= 127:
+        raise ValueError(f"The exponent of {amount} is out of range.")
+    coefficient = int(amount.scaleb(-exponent, _exact))
+    out += _header.pack(code, exponent)
+    # Zigzag encoding keeps small negative coefficients short.
+    value = coefficient * 2 if coefficient >= 0 else -coefficient * 2 - 1
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode(data: memoryview, offset: int) -> tuple[int, Decimal, int]:
+    """
+    Decodes the value at the given offset, and returns its numeric currency code,
+    its amount and the offset of the next value.
+    """
+    try:
+        code, exponent = _header.unpack_from(data, offset)
+        offset += _header.size
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+    except (IndexError, struct.error):
+        raise ValueError("Truncated Money data.") from None
+    coefficient = value >> 1 if not value & 1 else -(value >> 1) - 1
+    return code, Decimal(coefficient).scaleb(exponent, _exact), offset
+
+
+def _currency(code: int) -> Currency:
+    currency = CURRENCIES_BY_ISO.get(f"{code:03d}")
+    if currency is None:
+        raise CurrencyDoesNotExist(f"{code:03d}")
+    return currency
+
+
+def _to_bytes(money: Money) -> bytes:
+    out = bytearray()
+    _encode(money.amount, _numeric_code(money.currency), out)
+    return bytes(out)
+
+
+def _from_bytes(data: bytes | bytearray | memoryview) -> tuple[Decimal, Currency]:
+    view = memoryview(data).cast("B")
+    code, amount, offset = _decode(view, 0)
+    if offset != len(view):
+        raise ValueError("Unexpected data after the encoded Money.")
+    return amount, _currency(code)
+
+
+def pack_many(moneys: Iterable[Money]) -> bytes:
+    """
+    Encodes many Money instances into a single bytes object.
+    """
+    out = bytearray()
+    codes: dict[Currency, int] = {}
+    for money in moneys:
+        currency = money.currency
+        code = codes.get(currency)
+        if code is None:
+            code = codes[currency] = _numeric_code(currency)
+        _encode(money.amount, code, out)
+    return bytes(out)
+
+
+def unpack_many(data: bytes | bytearray | memoryview) -> Iterator[Money]:
+    """
+    Decodes the Money instances encoded by ``pack_many()``, and yields them in the
+    same order. Memory views are decoded in place, without copying them.
+    """
+    view = memoryview(data).cast("B")
+    currencies: dict[int, Currency] = {}
+    offset = 0
+    end = len(view)
+    while offset < end:
+        code, amount, offset = _decode(view, offset)
+        currency = currencies.get(code)
+        if currency is None:
+            currency = currencies[code] = _currency(code)
+        yield Money._from_decimal(amount, currency)
@@ -0,0 +1,239 @@
+import operator
+import warnings
+from decimal import Decimal
+from typing import Any, Callable
+
+import pytest
+
+from moneyed.arrays import MoneyArray
+from moneyed.classes import CURRENCIES, Money, MoneyComparisonError
+
+USD = CURRENCIES["USD"]
+EUR = CURRENCIES["EUR"]
+JPY = CURRENCIES["JPY"]
+BHD = CURRENCIES["BHD"]
+
+
+class TestMoneyArray:
+    def setup_method(self, method: object) -> None:
+        self.values = [
+            Money("1.50", USD),
+            Money("-2.25", EUR),
+            Money("300", JPY),
+            Money("0.125", BHD),
+        ]
+        self.array = MoneyArray(self.values)
+
+    def test_round_trip(self) -> None:
+        assert len(self.array) == 4
+        assert self.array.to_list() == self.values
+        assert list(self.array) == self.values
+        assert self.array.currencies == [USD, EUR, JPY, BHD]
+
+    def test_minor_units(self) -> None:
+        assert list(self.array.minor_units) == [150, -225, 300, 125]
+        with pytest.raises(TypeError):
+            self.array.minor_units[0] = 1
+
+    def test_round_trip_uses_currency_exponent(self) -> None:
+        assert repr(self.array[0]) == "Money('1.50', 'USD')"
+        assert repr(self.array[2]) == "Money('300', 'JPY')"
+        assert repr(self.array[3]) == "Money('0.125', 'BHD')"
+
+    def test_from_minor_units(self) -> None:
+        array = MoneyArray.from_minor_units([100, 250], "usd")
+        assert array.to_list() == [Money("1", USD), Money("2.5", USD)]
+
+    def test_too_precise_amount(self) -> None:
+        with pytest.raises(ValueError, match="cannot be represented in minor units"):
+            MoneyArray([Money("0.001", USD)])
+
+    def test_non_money(self) -> None:
+        with pytest.raises(TypeError):
+            MoneyArray([Decimal(1)])  # type: ignore[list-item]
+
+    def test_getitem(self) -> None:
+        assert self.array[1] == Money("-2.25", EUR)
+        assert self.array[-1] == Money("0.125", BHD)
+        assert self.array[1:3].to_list() == self.values[1:3]
+
+    def test_repr(self) -> None:
+        assert repr(MoneyArray([Money(1, USD)])) == "MoneyArray([Money('1.00', 'USD')])"
+
+    def test_eq(self) -> None:
+        assert self.array == MoneyArray(self.values)
+        assert self.array != MoneyArray(self.values[:3])
+        assert self.array != self.values
+
+    def test_add(self) -> None:
+        result = self.array + self.array
+        assert result.to_list() == [money + money for money in self.values]
+
+    def test_add_money(self) -> None:
+        array = MoneyArray([Money(1, USD), Money(2, USD)])
+        assert (array + Money("0.5", USD)).to_list() == [
+            Money("1.5", USD),
+            Money("2.5", USD),
+        ]
+
+    def test_add_mismatched_currencies(self) -> None:
+        other = MoneyArray([Money(1, USD), Money(1, USD), Money(1, JPY), Money(1, BHD)])
+        with pytest.raises(
+            TypeError,
+            match="Cannot add or subtract two Money instances with different currencies.",
+        ):
+            self.array + other
+        with pytest.raises(TypeError):
+            self.array + Money(1, USD)
+
+    def test_add_mismatched_lengths(self) -> None:
+        with pytest.raises(ValueError, match="different lengths"):
+            self.array + self.array[:2]
+
+    def test_add_non_money(self) -> None:
+        with pytest.raises(TypeError):
+            self.array + 1
+
+    def test_builtin_sum(self) -> None:
+        assert sum([self.array, self.array]) == self.array + self.array
+
+    def test_sub(self) -> None:
+        assert (self.array - self.array).to_list() == [
+            money - money for money in self.values
+        ]
+
+    def test_neg_and_abs(self) -> None:
+        assert (-self.array).to_list() == [-money for money in self.values]
+        assert abs(self.array).to_list() == [abs(money) for money in self.values]
+
+    def test_mul(self) -> None:
+        assert (self.array * 3).to_list() == [money * 3 for money in self.values]
+        assert (3 * self.array).to_list() == [3 * money for money in self.values]
+
+    def test_mul_decimal_rounds_to_minor_units(self) -> None:
+        array = MoneyArray([Money("0.05", USD), Money("0.15", USD)])
+        assert (array * Decimal("0.5")).to_list() == [
+            Money("0.02", USD),
+            Money("0.08", USD),
+        ]
+
+    def test_mul_float_warning(self) -> None:
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            self.array * 1.5
+        assert "Multiplying Money instances with floats is deprecated" in [
+            str(w.message) for w in warning_list
+        ]
+
+    def test_mul_bad(self) -> None:
+        with pytest.raises(TypeError):
+            self.array * self.array
+        with pytest.raises(TypeError):
+            self.array * Money(1, USD)
+
+    def test_sum(self) -> None:
+        array = MoneyArray([Money("1.10", USD), Money("2.20", USD)])
+        assert array.sum() == Money("3.30", USD)
+
+    def test_sum_mixed_currencies(self) -> None:
+        with pytest.raises(TypeError):
+            self.array.sum()
+
+    def test_sum_empty(self) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            MoneyArray().sum()
+
+    @pytest.mark.parametrize("op", [operator.lt, operator.le, operator.gt, operator.ge])
+    def test_comparisons(self, op: Callable[[Any, Any], Any]) -> None:
+        values = [Money(1, USD), Money(2, EUR), Money(3, USD)]
+        others = [Money(2, USD), Money(2, EUR), Money(1, USD)]
+        assert op(MoneyArray(values), MoneyArray(others)) == [
+            op(a, b) for a, b in zip(values, others)
+        ]
+
+    def test_compare_money(self) -> None:
+        array = MoneyArray([Money(1, USD), Money(3, USD)])
+        assert (array < Money(2, USD)) == [True, False]
+
+    def test_compare_mismatched_currencies(self) -> None:
+        with pytest.raises(TypeError, match="Cannot compare Money with different"):
+            self.array < MoneyArray([Money(1, USD)] * 4)
+
+    def test_compare_mistyped(self) -> None:
+        with pytest.raises(MoneyComparisonError):
+            self.array < 1
+
+
+class TestInterchange:
+    def setup_method(self, method: object) -> None:
+        self.array = MoneyArray(
+            [Money("1.50", USD), Money("-2.25", EUR), Money("300", JPY), Money(1, USD)]
+        )
+
+    def test_to_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        result = self.array.to_numpy()
+        assert result.dtype.names == ("units", "currency")
+        assert result["units"].dtype == np.int64
+        assert result["units"].tolist() == [150, -225, 300, 100]
+        assert result["currency"].tolist() == ["USD", "EUR", "JPY", "USD"]
+
+    def test_numpy_round_trip(self) -> None:
+        pytest.importorskip("numpy")
+        assert MoneyArray.from_numpy(self.array.to_numpy()) == self.array
+        assert MoneyArray.from_numpy(MoneyArray().to_numpy()) == MoneyArray()
+
+    def test_from_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        values = np.array(
+            [(1, "usd"), (2, "EUR")], dtype=[("units", np.int32), ("currency", "U3")]
+        )
+        assert MoneyArray.from_numpy(values).to_list() == [
+            Money("0.01", USD),
+            Money("0.02", EUR),
+        ]
+
+    def test_to_arrow(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        batch = self.array.to_arrow()
+        assert batch.schema.names == ["units", "currency"]
+        assert batch.column("units").type == pa.int64()
+        assert pa.types.is_dictionary(batch.column("currency").type)
+        assert batch.column("units").to_pylist() == [150, -225, 300, 100]
+        assert batch.column("currency").to_pylist() == ["USD", "EUR", "JPY", "USD"]
+
+    def test_to_arrow_shares_memory(self) -> None:
+        pytest.importorskip("pyarrow")
+        batch = self.array.to_arrow()
+        address, _ = self.array._units.buffer_info()
+        assert batch.column("units").buffers()[1].address == address
+
+    def test_arrow_round_trip(self) -> None:
+        pytest.importorskip("pyarrow")
+        assert MoneyArray.from_arrow(self.array.to_arrow()) == self.array
+        assert MoneyArray.from_arrow(MoneyArray().to_arrow()) == MoneyArray()
+
+    def test_from_arrow_table(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        batch = self.array.to_arrow()
+        table = pa.Table.from_batches([batch, batch]).slice(3, 2)
+        assert MoneyArray.from_arrow(table).to_list() == [
+            Money(1, USD),
+            Money("1.50", USD),
+        ]
+
+    def test_from_arrow_plain_columns(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table(
+            {"units": pa.array([1, 2], pa.int32()), "currency": ["usd", "EUR"]}
+        )
+        assert MoneyArray.from_arrow(table).to_list() == [
+            Money("0.01", USD),
+            Money("0.02", EUR),
+        ]
+
+    def test_from_arrow_nulls(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"units": [1, None], "currency": ["USD", "USD"]})
+        with pytest.raises(ValueError, match="must not contain nulls"):
+            MoneyArray.from_arrow(table)
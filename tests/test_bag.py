@@ -0,0 +1,119 @@
+from decimal import Decimal
+
+import pytest
+
+from moneyed.bag import MoneyBag
+from moneyed.classes import CURRENCIES, MinorUnitMoney, Money
+
+USD = CURRENCIES["USD"]
+EUR = CURRENCIES["EUR"]
+JPY = CURRENCIES["JPY"]
+
+
+class TestMoneyBag:
+    def setup_method(self, method: object) -> None:
+        self.values = [
+            Money("1.50", USD),
+            Money("2", EUR),
+            Money("-0.25", USD),
+            MinorUnitMoney("100", JPY),
+        ]
+        self.bag = MoneyBag(self.values)
+
+    def test_totals(self) -> None:
+        assert self.bag.to_dict() == {
+            USD: Money("1.25", USD),
+            EUR: Money("2", EUR),
+            JPY: Money("100", JPY),
+        }
+        assert self.bag.currencies == [USD, EUR, JPY]
+        assert len(self.bag) == 3
+        assert list(self.bag) == [USD, EUR, JPY]
+
+    def test_to_dict_returns_money(self) -> None:
+        assert all(type(money) is Money for money in self.bag.to_dict().values())
+
+    def test_getitem(self) -> None:
+        assert self.bag[USD] == Money("1.25", USD)
+        assert self.bag["usd"] == Money("1.25", USD)
+        assert self.bag["GBP"] == Money(0, "GBP")
+
+    def test_contains(self) -> None:
+        assert USD in self.bag
+        assert "EUR" in self.bag
+        assert "GBP" not in self.bag
+        assert "XYZ" not in self.bag
+        assert 1 not in self.bag
+
+    def test_iadd_money(self) -> None:
+        bag = self.bag
+        bag += Money("0.75", USD)
+        assert bag is self.bag
+        assert bag[USD] == Money(2, USD)
+
+    def test_iadd_bag(self) -> None:
+        other = MoneyBag([Money(1, USD), Money(1, "GBP")])
+        self.bag += other
+        assert self.bag.to_dict() == {
+            USD: Money("2.25", USD),
+            EUR: Money("2", EUR),
+            JPY: Money("100", JPY),
+            CURRENCIES["GBP"]: Money(1, "GBP"),
+        }
+        assert other.to_dict() == {
+            USD: Money(1, USD),
+            CURRENCIES["GBP"]: Money(1, "GBP"),
+        }
+
+    def test_iadd_unsupported(self) -> None:
+        bag = self.bag
+        with pytest.raises(TypeError):
+            bag += Decimal(1)
+
+    def test_add_returns_new_bag(self) -> None:
+        total = self.bag + Money(1, EUR)
+        assert total[EUR] == Money(3, EUR)
+        assert self.bag[EUR] == Money(2, EUR)
+
+    def test_sum(self) -> None:
+        total = sum([self.bag, self.bag])
+        assert isinstance(total, MoneyBag)
+        assert total[USD] == Money("2.5", USD)
+        assert self.bag[USD] == Money("1.25", USD)
+
+    def test_merge(self) -> None:
+        first = MoneyBag(self.values[:2])
+        second = MoneyBag(self.values[2:])
+        first.merge(second)
+        assert first == self.bag
+
+    def test_update_with_bags(self) -> None:
+        bag = MoneyBag([MoneyBag(self.values[:2]), *self.values[2:]])
+        assert bag == self.bag
+
+    @pytest.mark.parametrize("value", [1, Decimal(1), "1 USD", None])
+    def test_init_rejects_non_money(self, value: object) -> None:
+        with pytest.raises(TypeError, match="Cannot add"):
+            MoneyBag([value])  # type: ignore[list-item]
+        with pytest.raises(TypeError, match="Cannot add"):
+            MoneyBag().add(value)  # type: ignore[arg-type]
+
+    def test_copy(self) -> None:
+        copy = self.bag.copy()
+        copy += Money(1, USD)
+        assert self.bag[USD] == Money("1.25", USD)
+
+    def test_not_hashable(self) -> None:
+        with pytest.raises(TypeError):
+            hash(self.bag)
+
+    def test_repr(self) -> None:
+        assert repr(MoneyBag([Money("1.5", USD), Money(2, EUR)])) == (
+            "MoneyBag([Money('1.5', 'USD'), Money('2', 'EUR')])"
+        )
+
+    def test_empty(self) -> None:
+        bag = MoneyBag()
+        assert len(bag) == 0
+        assert bag.to_dict() == {}
+        assert bag == MoneyBag()
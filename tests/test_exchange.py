@@ -0,0 +1,397 @@
+import asyncio
+import io
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from moneyed.arrays import MoneyArray
+from moneyed.classes import CURRENCIES, Currency, MinorUnitMoney, Money
+from moneyed.exchange import (
+    AsyncExchangeRates,
+    CSVRateSource,
+    DictRateSource,
+    ExchangeRateNotFound,
+    ExchangeRates,
+    LocalRateSource,
+    RateHistory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+USD = CURRENCIES["USD"]
+EUR = CURRENCIES["EUR"]
+GBP = CURRENCIES["GBP"]
+JPY = CURRENCIES["JPY"]
+CHF = CURRENCIES["CHF"]
+
+RATES: Dict[Tuple[Union[Currency, str], Union[Currency, str]], object] = {
+    ("EUR", "USD"): "1.10",
+    ("EUR", "GBP"): "0.85",
+    ("EUR", "JPY"): "160",
+}
+
+
+class CountingSource(DictRateSource):
+    def __init__(self) -> None:
+        super().__init__(RATES)
+        self.calls: List[Tuple[Currency, Currency]] = []
+
+    def get_rate(self, base: Currency, target: Currency) -> Optional[Decimal]:
+        self.calls.append((base, target))
+        return super().get_rate(base, target)
+
+
+class TestDictRateSource:
+    def test_get_rate(self) -> None:
+        source = DictRateSource(RATES)
+        assert source.get_rate(EUR, USD) == Decimal("1.10")
+        assert source.get_rate(USD, EUR) is None
+
+    def test_accepts_currencies(self) -> None:
+        source = DictRateSource({(EUR, USD): Decimal("1.1")})
+        assert source.get_rate(EUR, USD) == Decimal("1.1")
+
+
+class TestCSVRateSource:
+    CSV = "base,target,rate\nEUR,USD,1.10\nEUR, GBP ,0.85\n"
+
+    def test_file(self) -> None:
+        source = CSVRateSource(io.StringIO(self.CSV))
+        assert source.get_rate(EUR, USD) == Decimal("1.10")
+        assert source.get_rate(EUR, GBP) == Decimal("0.85")
+
+    def test_path(self, tmp_path: "Path") -> None:
+        path = tmp_path / "rates.csv"
+        path.write_text(self.CSV)
+        assert CSVRateSource(path).get_rate(EUR, USD) == Decimal("1.10")
+        assert CSVRateSource(str(path)).get_rate(EUR, USD) == Decimal("1.10")
+
+    def test_without_header(self) -> None:
+        source = CSVRateSource(io.StringIO("EUR;USD;1.10\n"), delimiter=";")
+        assert source.get_rate(EUR, USD) == Decimal("1.10")
+
+
+class TestExchangeRates:
+    def setup_method(self, method: object) -> None:
+        self.source = CountingSource()
+        self.rates = ExchangeRates(self.source, base="EUR")
+
+    def test_direct_rate(self) -> None:
+        assert self.rates.get_rate(EUR, USD) == Decimal("1.10")
+        assert self.rates.get_rate("eur", "usd") == Decimal("1.10")
+
+    def test_same_currency(self) -> None:
+        assert self.rates.get_rate(CHF, CHF) == 1
+        assert self.source.calls == []
+
+    def test_inverse_rate(self) -> None:
+        assert self.rates.get_rate(USD, EUR) == 1 / Decimal("1.10")
+
+    def test_triangulation(self) -> None:
+        assert self.rates.get_rate(USD, GBP) == (1 / Decimal("1.10")) * Decimal("0.85")
+        assert self.rates.get_rate(GBP, JPY) == (1 / Decimal("0.85")) * 160
+
+    def test_no_triangulation_without_base(self) -> None:
+        rates = ExchangeRates(DictRateSource(RATES))
+        with pytest.raises(ExchangeRateNotFound) as exc_info:
+            rates.get_rate(USD, GBP)
+        assert exc_info.value.base == USD
+        assert exc_info.value.target == GBP
+        assert str(exc_info.value) == "No exchange rate from USD to GBP is available."
+
+    def test_not_found(self) -> None:
+        with pytest.raises(ExchangeRateNotFound):
+            self.rates.get_rate(USD, CHF)
+        with pytest.raises(ExchangeRateNotFound):
+            self.rates.get_rate(CHF, EUR)
+
+    def test_cache(self) -> None:
+        self.rates.get_rate(USD, GBP)
+        calls = len(self.source.calls)
+        assert self.rates.get_rate(USD, GBP) == self.rates.get_rate(USD, GBP)
+        assert len(self.source.calls) == calls
+        self.rates.clear_cache()
+        self.rates.get_rate(USD, GBP)
+        assert len(self.source.calls) == 2 * calls
+
+    def test_cache_eviction(self) -> None:
+        rates = ExchangeRates(self.source, base="EUR", cache_size=1)
+        rates.get_rate(EUR, USD)
+        rates.get_rate(EUR, GBP)
+        rates.get_rate(EUR, USD)
+        assert self.source.calls == [(EUR, USD), (EUR, GBP), (EUR, USD)]
+
+    def test_convert(self) -> None:
+        assert self.rates.convert(Money(10, EUR), USD) == Money(11, USD)
+        assert self.rates.convert(Money(10, "EUR"), "gbp") == Money("8.5", GBP)
+        assert self.rates.convert(Money(5, USD), USD) == Money(5, USD)
+
+    def test_convert_keeps_type(self) -> None:
+        converted = self.rates.convert(MinorUnitMoney("1.00", USD), JPY)
+        assert type(converted) is MinorUnitMoney
+        assert converted == Money(145, JPY)
+
+    def test_convert_not_found(self) -> None:
+        with pytest.raises(ExchangeRateNotFound):
+            self.rates.convert(Money(1, CHF), USD)
+
+    def test_convert_many(self) -> None:
+        values = [Money(10, EUR), Money(1, GBP), Money(2, EUR)]
+        converted = self.rates.convert_many(values, USD)
+        assert list(converted) == [self.rates.convert(value, USD) for value in values]
+
+    def test_convert_many_is_lazy(self) -> None:
+        converted = self.rates.convert_many([Money(1, CHF)], USD)
+        with pytest.raises(ExchangeRateNotFound):
+            next(converted)
+
+    def test_convert_many_array(self) -> None:
+        array = MoneyArray([Money("10.00", EUR), Money("1.00", GBP), Money(3, USD)])
+        converted = self.rates.convert_many(array, JPY)
+        assert isinstance(converted, MoneyArray)
+        assert converted.to_list() == [
+            Money(1600, JPY),
+            Money(188, JPY),
+            Money(436, JPY),
+        ]
+
+    def test_convert_many_array_slice(self) -> None:
+        array = MoneyArray([Money("10.00", EUR), Money(1, CHF), Money(3, USD)])
+        converted = self.rates.convert_many(array[:1], USD)
+        assert converted.to_list() == [Money(11, USD)]
+        assert self.rates.convert_many(array[3:], USD).to_list() == []
+
+
+class TestRateHistory:
+    CSV = (
+        "timestamp,base,target,rate\n"
+        "2024-01-02,EUR,USD,1.09\n"
+        "2024-01-01,EUR,USD,1.10\n"
+        "2024-01-03T12:00:00,EUR,USD,1.08\n"
+        "2024-01-01,EUR,GBP,0.86\n"
+    )
+
+    def setup_method(self, method: object) -> None:
+        self.history = RateHistory.from_csv(io.StringIO(self.CSV))
+
+    def test_get_rate(self) -> None:
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 1)) == Decimal("1.10")
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 2, 23)) == Decimal(
+            "1.09"
+        )
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 3, 12)) == Decimal(
+            "1.08"
+        )
+        assert self.history.get_rate(EUR, USD, datetime(2030, 1, 1)) == Decimal("1.08")
+
+    def test_get_latest_rate(self) -> None:
+        assert self.history.get_rate(EUR, USD) == Decimal("1.08")
+
+    def test_before_first_rate(self) -> None:
+        assert self.history.get_rate(EUR, USD, datetime(2023, 12, 31)) is None
+
+    def test_unknown_pair(self) -> None:
+        assert self.history.get_rate(USD, EUR, datetime(2024, 1, 1)) is None
+
+    def test_add_rate(self) -> None:
+        self.history.add_rate("EUR", "USD", datetime(2024, 1, 2, 12), "1.095")
+        self.history.add_rate(EUR, USD, datetime(2024, 1, 1), "1.11")
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 1, 1)) == Decimal(
+            "1.11"
+        )
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 2, 13)) == Decimal(
+            "1.095"
+        )
+        assert self.history.get_rate(EUR, USD, datetime(2024, 1, 2, 11)) == Decimal(
+            "1.09"
+        )
+
+    def test_from_csv_path(self, tmp_path: "Path") -> None:
+        path = tmp_path / "rates.csv"
+        path.write_text(self.CSV)
+        history = RateHistory.from_csv(path)
+        assert history.get_rate(EUR, GBP, datetime(2024, 6, 1)) == Decimal("0.86")
+
+    def test_from_empty_csv_path(self, tmp_path: "Path") -> None:
+        path = tmp_path / "rates.csv"
+        path.write_text("")
+        assert RateHistory.from_csv(path).get_rate(EUR, USD) is None
+
+    def test_convert_at(self) -> None:
+        rates = ExchangeRates(self.history, base=EUR)
+        money = Money(100, EUR)
+        assert rates.convert(money, USD, at=datetime(2024, 1, 1)) == Money(110, USD)
+        assert rates.convert(money, USD, at=datetime(2024, 1, 2)) == Money(109, USD)
+        assert rates.convert(money, USD) == Money(108, USD)
+        assert rates.convert(Money(109, USD), EUR, at=datetime(2024, 1, 2)) == money
+        converted = rates.convert(Money(109, USD), GBP, at=datetime(2024, 1, 2))
+        assert converted.round(2) == Money(86, GBP)
+
+    def test_convert_at_not_found(self) -> None:
+        rates = ExchangeRates(self.history)
+        with pytest.raises(ExchangeRateNotFound):
+            rates.convert(Money(1, EUR), USD, at=datetime(2023, 1, 1))
+
+    def test_convert_many_at(self) -> None:
+        rates = ExchangeRates(self.history)
+        values = [Money(100, EUR), Money(10, EUR)]
+        at = datetime(2024, 1, 2)
+        assert list(rates.convert_many(values, USD, at=at)) == [
+            Money(109, USD),
+            Money("10.9", USD),
+        ]
+        array = rates.convert_many(MoneyArray(values), USD, at=at)
+        assert array.to_list() == [Money(109, USD), Money("10.9", USD)]
+
+
+class AsyncCountingSource:
+    """
+    An asynchronous source that lets every fetch wait for the event loop to run
+    other tasks, so that concurrent requests overlap.
+    """
+
+    def __init__(self) -> None:
+        self.source = DictRateSource(RATES)
+        self.calls: List[Tuple[Currency, Currency]] = []
+        self.error: Optional[Exception] = None
+
+    async def get_rate(self, base: Currency, target: Currency) -> Optional[Decimal]:
+        self.calls.append((base, target))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return self.source.get_rate(base, target)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAsyncExchangeRates:
+    def setup_method(self, method: object) -> None:
+        self.source = AsyncCountingSource()
+        self.clock = Clock()
+        self.rates = AsyncExchangeRates(
+            self.source, base="EUR", ttl=10, clock=self.clock
+        )
+
+    def test_get_rate(self) -> None:
+        assert asyncio.run(self.rates.get_rate("EUR", "USD")) == Decimal("1.10")
+        assert asyncio.run(self.rates.get_rate(CHF, CHF)) == 1
+        assert asyncio.run(self.rates.get_rate(USD, EUR)) == 1 / Decimal("1.10")
+        assert asyncio.run(self.rates.get_rate(USD, GBP)) == (
+            1 / Decimal("1.10")
+        ) * Decimal("0.85")
+
+    def test_not_found(self) -> None:
+        with pytest.raises(ExchangeRateNotFound) as exc_info:
+            asyncio.run(self.rates.get_rate(USD, CHF))
+        assert exc_info.value.base == USD
+        assert exc_info.value.target == CHF
+
+    def test_convert(self) -> None:
+        converted = asyncio.run(self.rates.convert(Money(10, "EUR"), "usd"))
+        assert converted == Money(11, USD)
+        assert type(converted) is Money
+        assert converted.currency is USD
+
+    def test_convert_keeps_type(self) -> None:
+        converted = asyncio.run(self.rates.convert(MinorUnitMoney("1.00", USD), JPY))
+        assert type(converted) is MinorUnitMoney
+        assert converted == Money(145, JPY)
+
+    def test_coalesces_concurrent_fetches(self) -> None:
+        async def convert_all() -> List[Money]:
+            return await asyncio.gather(
+                *(self.rates.convert(Money(i, EUR), USD) for i in range(10))
+            )
+
+        assert asyncio.run(convert_all()) == [
+            Money(i * Decimal("1.10"), USD) for i in range(10)
+        ]
+        assert self.source.calls == [(EUR, USD)]
+
+    def test_ttl(self) -> None:
+        asyncio.run(self.rates.get_rate(EUR, USD))
+        self.clock.now = 9.9
+        asyncio.run(self.rates.get_rate(EUR, USD))
+        assert self.source.calls == [(EUR, USD)]
+        self.clock.now = 10
+        asyncio.run(self.rates.get_rate(EUR, USD))
+        assert self.source.calls == [(EUR, USD), (EUR, USD)]
+
+    def test_caches_missing_rates(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ExchangeRateNotFound):
+                asyncio.run(self.rates.get_rate(CHF, EUR))
+        assert self.source.calls == [(CHF, EUR), (EUR, CHF)]
+
+    def test_clear_cache(self) -> None:
+        asyncio.run(self.rates.get_rate(EUR, USD))
+        self.rates.clear_cache()
+        asyncio.run(self.rates.get_rate(EUR, USD))
+        assert self.source.calls == [(EUR, USD), (EUR, USD)]
+
+    def test_cache_size(self) -> None:
+        rates = AsyncExchangeRates(self.source, cache_size=1)
+        for target in [USD, GBP, USD]:
+            asyncio.run(rates.get_rate(EUR, target))
+        assert self.source.calls == [(EUR, USD), (EUR, GBP), (EUR, USD)]
+
+    def test_errors_are_not_cached(self) -> None:
+        async def convert_twice() -> Tuple[object, object]:
+            return await asyncio.gather(
+                self.rates.get_rate(EUR, USD),
+                self.rates.get_rate(EUR, USD),
+                return_exceptions=True,
+            )
+
+        self.source.error = ConnectionError("unavailable")
+        results = asyncio.run(convert_twice())
+        assert [type(result) for result in results] == [ConnectionError] * 2
+        assert len(self.source.calls) == 1
+        self.source.error = None
+        assert asyncio.run(self.rates.get_rate(EUR, USD)) == Decimal("1.10")
+
+    def test_cancelled_caller(self) -> None:
+        async def cancel_one() -> Decimal:
+            first = asyncio.ensure_future(self.rates.get_rate(EUR, USD))
+            second = asyncio.ensure_future(self.rates.get_rate(EUR, USD))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(cancel_one()) == Decimal("1.10")
+        assert self.source.calls == [(EUR, USD)]
+
+    def test_convert_many(self) -> None:
+        values = [Money(10, EUR), Money(1, GBP), Money(2, EUR)]
+        expected = list(
+            ExchangeRates(DictRateSource(RATES), "EUR").convert_many(values, USD)
+        )
+
+        async def collect() -> List[Money]:
+            return [money async for money in self.rates.convert_many(values, USD)]
+
+        async def collect_async() -> List[Money]:
+            async def stream() -> "AsyncIterator[Money]":
+                for value in values:
+                    yield value
+
+            return [money async for money in self.rates.convert_many(stream(), USD)]
+
+        assert asyncio.run(collect()) == expected
+        assert asyncio.run(collect_async()) == expected
+        assert len(self.source.calls) == len(set(self.source.calls))
+
+    def test_local_rate_source(self) -> None:
+        rates = AsyncExchangeRates(LocalRateSource(DictRateSource(RATES)))
+        assert asyncio.run(rates.convert(Money(10, EUR), USD)) == Money(11, USD)
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from typing import Set
+
+
+def imported_modules(code: str) -> Set[str]:
+    """
+    Runs code in a fresh interpreter and returns the names of the modules it
+    imported, as reported by -X importtime.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_does_not_import_babel() -> None:
+    modules = imported_modules("import moneyed; moneyed.Money(1, moneyed.USD) + 1 * 0")
+    assert "moneyed.classes" in modules
+    assert not {module for module in modules if module.startswith("babel")}
+
+
+def test_babel_is_imported_when_needed() -> None:
+    modules = imported_modules("import moneyed; moneyed.USD.name")
+    assert "babel.numbers" in modules
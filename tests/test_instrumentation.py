@@ -0,0 +1,177 @@
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+import pytest
+
+import moneyed
+from moneyed import instrumentation
+from moneyed.classes import MinorUnitMoney, Money, MoneyComparisonError, get_currency
+from moneyed.instrumentation import Collector
+from moneyed.l10n import format_money, get_formatter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+USD = get_currency("USD")
+
+
+@pytest.fixture
+def collector() -> "Iterator[Collector]":
+    collector = instrumentation.enable()
+    try:
+        yield collector
+    finally:
+        instrumentation.disable()
+
+
+def counters(collector: Collector) -> Dict[str, int]:
+    result: Dict[str, int] = collector.snapshot()["counters"]
+    return result
+
+
+def timer_count(collector: Collector, name: str) -> int:
+    timer = collector.snapshot()["timers"].get(name)
+    return 0 if timer is None else int(timer["count"])
+
+
+class TestInstrumentation:
+    def test_disable_restores_originals(self) -> None:
+        init = Money.__init__
+        add = MinorUnitMoney.__add__
+        instrumentation.enable()
+        assert Money.__init__ is not init
+        assert moneyed.get_currency is not get_currency
+        instrumentation.disable()
+        assert Money.__init__ is init
+        assert MinorUnitMoney.__add__ is add
+        assert moneyed.get_currency is get_currency
+        assert moneyed.format_money is format_money
+
+    def test_disabled_snapshot(self) -> None:
+        assert instrumentation.snapshot() == {"counters": {}, "timers": {}}
+
+    def test_construction(self, collector: Collector) -> None:
+        Money(1, "USD")
+        Money("1", currency="usd")
+        Money(1, currency=get_currency("USD"))
+        MinorUnitMoney(1, "Usd")
+        assert timer_count(collector, "Money.__init__") == 3
+        assert timer_count(collector, "MinorUnitMoney.__init__") == 1
+        assert counters(collector) == {
+            "currency_lookup.hit": 2,
+            "currency_lookup.miss": 1,
+        }
+
+    def test_unknown_currency(self, collector: Collector) -> None:
+        with pytest.raises(moneyed.CurrencyDoesNotExist):
+            Money(1, "XYZ")
+        assert counters(collector) == {"currency_lookup.miss": 1}
+        assert timer_count(collector, "Money.__init__") == 1
+        assert timer_count(collector, "get_currency") == 1
+
+    def test_get_currency(self, collector: Collector) -> None:
+        assert moneyed.get_currency("EUR") == get_currency("EUR")
+        assert timer_count(collector, "get_currency") == 1
+
+    def test_arithmetic(self, collector: Collector) -> None:
+        a = Money(1, "USD")
+        assert a + a - a == a
+        assert sum([a, a]) == Money(2, "USD")
+        assert a * 2 / 2 == a
+        assert timer_count(collector, "Money.__add__") == 3
+        assert timer_count(collector, "Money.__radd__") == 1
+        assert timer_count(collector, "Money.__sub__") == 1
+        assert timer_count(collector, "Money.__mul__") == 1
+        assert timer_count(collector, "Money.__truediv__") == 1
+
+    @pytest.mark.parametrize(
+        ("left", "right"),
+        [
+            (Money(1, "USD"), Money(1, "EUR")),
+            (MinorUnitMoney(1, "USD"), MinorUnitMoney(1, "EUR")),
+            (MinorUnitMoney(1, "USD"), Money(1, "EUR")),
+        ],
+    )
+    def test_currency_mismatch(
+        self, collector: Collector, left: Money, right: Money
+    ) -> None:
+        operations: List[Callable[[], object]] = [
+            lambda: left + right,
+            lambda: left - right,
+            lambda: left < right,
+            lambda: left <= right,
+        ]
+        for operation in operations:
+            with pytest.raises(TypeError):
+                operation()
+        assert counters(collector) == {"currency_mismatch": 4}
+
+    def test_other_type_errors(self, collector: Collector) -> None:
+        with pytest.raises(TypeError):
+            Money(1, USD) * Money(1, USD)
+        assert counters(collector) == {}
+
+    def test_float_deprecated(self, collector: Collector) -> None:
+        money = Money(1, USD)
+        operations: List[Tuple[str, Callable[[], object]]] = [
+            ("Money.__mul__", lambda: money * 1.5),
+            ("Money.__rmul__", lambda: 1.5 * money),
+            ("Money.__truediv__", lambda: money / 1.5),
+            ("Money.__rmod__", lambda: 1.5 % money),
+        ]
+        for name, operation in operations:
+            with pytest.warns(DeprecationWarning, match="floats is deprecated"):
+                operation()
+            assert timer_count(collector, name) == 1
+        assert counters(collector) == {"float_deprecated": 4}
+
+    def test_float_not_deprecated(self, collector: Collector) -> None:
+        money = Money(1, USD)
+        with pytest.raises(TypeError):
+            money + 1.5
+        assert money + 0.0 is money
+        with pytest.raises(MoneyComparisonError):
+            money < 1.5
+        assert timer_count(collector, "Money.__add__") == 2
+        assert counters(collector) == {}
+
+    def test_formatting(self, collector: Collector) -> None:
+        get_formatter.cache_clear()
+        money = Money(1, USD)
+        format_money(money, locale="en_US")
+        moneyed.format_money(money, locale="en_US")
+        assert str(money)
+        assert timer_count(collector, "format_money") == 2
+        assert counters(collector) == {
+            "formatter_cache.hit": 1,
+            "formatter_cache.miss": 2,
+        }
+
+    def test_enable_replaces_collector(self, collector: Collector) -> None:
+        other = Collector()
+        assert instrumentation.enable(other) is other
+        Money(1, "USD")
+        assert timer_count(other, "Money.__init__") == 1
+        assert timer_count(collector, "Money.__init__") == 0
+        assert instrumentation.snapshot() == other.snapshot()
+
+    def test_reset(self, collector: Collector) -> None:
+        Money(1, "USD")
+        collector.reset()
+        assert collector.snapshot() == {"counters": {}, "timers": {}}
+
+    def test_subclassed_collector(self) -> None:
+        class Forwarding(Collector):
+            def __init__(self) -> None:
+                super().__init__()
+                self.observed: List[str] = []
+
+            def observe(self, name: str, elapsed_ns: int) -> None:
+                self.observed.append(name)
+
+        collector = Forwarding()
+        instrumentation.enable(collector)
+        try:
+            Money(1, "USD")
+        finally:
+            instrumentation.disable()
+        assert collector.observed == ["Money.__init__"]
@@ -0,0 +1,126 @@
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from moneyed.arrays import MoneyArray
+from moneyed.classes import CurrencyDoesNotExist, Money
+from moneyed.io import read_money_csv
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CSV = (
+    "date,amount,currency,memo\n"
+    "2024-01-01,1.50,usd,coffee\n"
+    "\n"
+    "2024-01-02, -2 ,EUR,refund\n"
+    '2024-01-03,3.25,USD,"multi\nline"\n'
+)
+
+VALUES = [Money("1.50", "USD"), Money("-2", "EUR"), Money("3.25", "USD")]
+
+
+class TestReadMoneyCSV:
+    def test_by_name(self) -> None:
+        values = read_money_csv(io.StringIO(CSV), "amount", "currency")
+        assert list(values) == VALUES
+
+    def test_by_index(self) -> None:
+        values = read_money_csv(io.StringIO(CSV), 1, 2, header=True)
+        assert list(values) == VALUES
+
+    def test_without_header(self) -> None:
+        data = "1.50;usd\n-2;EUR\n"
+        values = read_money_csv(io.StringIO(data), 0, 1, delimiter=";")
+        assert list(values) == VALUES[:2]
+
+    def test_is_lazy(self) -> None:
+        values = read_money_csv(
+            io.StringIO(CSV + "2024-01-04,oops,USD,\n"), "amount", "currency"
+        )
+        assert [next(values) for _ in VALUES] == VALUES
+        with pytest.raises(ValueError, match="Invalid amount 'oops' on line 7"):
+            next(values)
+
+    @pytest.mark.parametrize(
+        "amount", ["NaN", "-Infinity", "sNaN", "1_000", "1.5.0", "", "1,50"]
+    )
+    def test_invalid_amount(self, amount: str) -> None:
+        data = f'1.50,USD\n"{amount}",USD\n'
+        with pytest.raises(ValueError, match=r"Invalid amount .* on line 2\."):
+            list(read_money_csv(io.StringIO(data), 0, 1))
+
+    def test_exponent(self) -> None:
+        values = read_money_csv(io.StringIO("1.5E3,USD\n"), 0, 1)
+        assert list(values) == [Money(1500, "USD")]
+
+    def test_unknown_currency(self) -> None:
+        with pytest.raises(CurrencyDoesNotExist, match="code XYZ .* on line 2"):
+            list(read_money_csv(io.StringIO("1.50,USD\n1.50,XYZ\n"), 0, 1))
+        with pytest.raises(CurrencyDoesNotExist, match="on line 1"):
+            list(read_money_csv(io.StringIO("1.50,\n"), 0, 1))
+
+    def test_missing_column(self) -> None:
+        with pytest.raises(ValueError, match="no column named 'total'"):
+            list(read_money_csv(io.StringIO(CSV), "total", "currency"))
+
+    def test_short_row(self) -> None:
+        with pytest.raises(ValueError, match="Line 2 has fewer than 3 columns"):
+            list(read_money_csv(io.StringIO("1.50,x,USD\n2\n"), 0, 2))
+
+    def test_name_without_header(self) -> None:
+        with pytest.raises(ValueError, match="only be given by name"):
+            read_money_csv(io.StringIO(CSV), "amount", 2, header=False)
+
+    def test_empty(self) -> None:
+        assert list(read_money_csv(io.StringIO(""), "amount", "currency")) == []
+        assert list(read_money_csv(io.StringIO(""), 0, 1, chunk_size=10)) == []
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_path(self, tmp_path: "Path", mmap: bool) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text(CSV, encoding="utf-8")
+        values = read_money_csv(path, "amount", "currency", mmap=mmap)
+        assert list(values) == VALUES
+        values = read_money_csv(str(path), "amount", "currency", mmap=mmap)
+        assert list(values) == VALUES
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_empty_path(self, tmp_path: "Path", mmap: bool) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text("")
+        assert list(read_money_csv(path, 0, 1, mmap=mmap)) == []
+
+    def test_encoding(self, tmp_path: "Path") -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text("montant;devise;libellé\n1.50;EUR;café\n", encoding="latin-1")
+        values = read_money_csv(
+            path, "montant", "devise", delimiter=";", encoding="latin-1", mmap=True
+        )
+        assert list(values) == [Money("1.50", "EUR")]
+
+
+class TestReadMoneyCSVChunks:
+    def test_chunks(self) -> None:
+        chunks = list(read_money_csv(io.StringIO(CSV), 1, 2, 2, header=True))
+        assert all(isinstance(chunk, MoneyArray) for chunk in chunks)
+        assert [chunk.to_list() for chunk in chunks] == [VALUES[:2], VALUES[2:]]
+
+    def test_chunk_currencies(self) -> None:
+        chunks = read_money_csv(io.StringIO(CSV), "amount", "currency", chunk_size=1)
+        assert [chunk.currencies for chunk in chunks] == [
+            [value.currency] for value in VALUES
+        ]
+
+    def test_fractional_minor_units(self) -> None:
+        chunks = read_money_csv(io.StringIO("1,USD\n1.005,USD\n"), 0, 1, chunk_size=10)
+        with pytest.raises(
+            ValueError,
+            match=r"1\.005 on line 2 cannot be represented in minor units of USD\.",
+        ):
+            next(chunks)
+
+    def test_invalid_chunk_size(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            read_money_csv(io.StringIO(CSV), 1, 2, 0)
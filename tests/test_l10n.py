@@ -1,5 +1,17 @@
+import pytest
+from babel.numbers import format_currency as babel_format_currency
+
 from moneyed import Money
-from moneyed.l10n import format_money
+from moneyed.l10n import (
+    FORMATTER_CACHE_SIZE,
+    MoneyFormatter,
+    MoneyParseError,
+    format_many,
+    format_money,
+    get_formatter,
+    get_parser,
+    parse_money,
+)
 
 one_million_bucks = Money("1000000", "USD")
 one_million_eur = Money("1000000", "EUR")
@@ -18,3 +30,152 @@ def test_format_money_decimal_quantization():
         format_money(Money("2.0123", "USD"), locale="en_US", decimal_quantization=False)
         == "$2.0123"
     )
+
+
+@pytest.mark.parametrize(
+    "locale", ["en_US", "de_DE", "de_CH", "fr_FR", "ja_JP", "ar_EG"]
+)
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"format_type": "accounting"},
+        {"format_type": "name"},
+        {"currency_digits": False},
+        {"decimal_quantization": False},
+        {"format": "¤¤ #,##0.00"},
+        {"format": "#,##0.00 ¤¤¤"},
+    ],
+)
+def test_money_formatter_matches_babel(locale, options):
+    formatter = MoneyFormatter(locale, **options)
+    for amount, currency in [
+        ("1234567.891", "USD"),
+        ("-1234.5", "EUR"),
+        ("1", "JPY"),
+        ("-0.125", "BHD"),
+        ("10.05", "CHF"),
+    ]:
+        money = Money(amount, currency)
+        expected = babel_format_currency(
+            money.amount, currency, locale=locale, **options
+        )
+        assert formatter.format(money) == expected
+
+
+def test_money_formatter_caches_per_currency():
+    formatter = MoneyFormatter("en_US")
+    formatter.format(one_million_bucks)
+    formatter.format(Money(1, "USD"))
+    formatter.format(one_million_eur)
+    assert set(formatter._patterns) == {"USD", "EUR"}
+
+
+def test_format_money_reuses_formatters():
+    get_formatter.cache_clear()
+    format_money(one_million_bucks, locale="en_US")
+    format_money(one_million_eur, locale="en_US")
+    format_money(one_million_eur, locale="de_DE")
+    info = get_formatter.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.maxsize == FORMATTER_CACHE_SIZE
+
+
+def test_format_many():
+    moneys = [one_million_bucks, one_million_eur, Money("-3.5", "USD")]
+    result = format_many(iter(moneys), locale="en_US")
+    assert not isinstance(result, list)
+    assert list(result) == [format_money(m, locale="en_US") for m in moneys]
+
+
+def test_format_many_options():
+    moneys = [Money("2.0123", "USD"), Money("-1", "JPY")]
+    assert list(format_many(moneys, locale="en_US", decimal_quantization=False)) == [
+        "$2.0123",
+        "-¥1",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("text", "locale", "expected"),
+    [
+        ("$1,234.56", "en_US", Money("1234.56", "USD")),
+        ("1.234,56 €", "de_DE", Money("1234.56", "EUR")),
+        ("-1 234,50 €", "fr_FR", Money("-1234.50", "EUR")),
+        ("CHF 1’234.50", "de_CH", Money("1234.50", "CHF")),
+        ("CHF 1'234.50", "de_CH", Money("1234.50", "CHF")),
+        ("−12,00 kr", "sv_SE", Money("-12", "SEK")),
+        ("($1,234.56)", "en_US", Money("-1234.56", "USD")),
+        ("US$5", "en_GB", Money("5", "USD")),
+        ("eur 5.5", "en_US", Money("5.5", "EUR")),
+        ("  +3 EUR ", "en_US", Money("3", "EUR")),
+        (".5 USD", "en_US", Money("0.5", "USD")),
+    ],
+)
+def test_parse_money(text, locale, expected):
+    result = parse_money(text, locale)
+    assert result == expected
+    assert result.currency is expected.currency
+
+
+@pytest.mark.parametrize("locale", ["en_US", "de_DE", "fr_FR", "he_IL", "ar_EG"])
+@pytest.mark.parametrize("format_type", ["standard", "accounting"])
+def test_parse_money_round_trips_format_money(locale, format_type):
+    for money in [
+        one_million_bucks,
+        -one_million_eur,
+        Money("-0.125", "BHD"),
+        Money("5", "JPY"),
+    ]:
+        text = format_money(money, locale=locale, format_type=format_type)
+        assert parse_money(text, locale) == money
+
+
+def test_parse_money_grouping():
+    assert parse_money("1,234,567 USD", "en_US") == Money("1234567", "USD")
+    assert parse_money("1234567 USD", "en_US") == Money("1234567", "USD")
+    assert parse_money("₹12,34,567.50", "hi_IN") == Money("1234567.50", "INR")
+    with pytest.raises(MoneyParseError):
+        parse_money("1,2,3", "en_US", default_currency="USD")
+    with pytest.raises(MoneyParseError):
+        parse_money("₹1,234,567", "hi_IN")
+    with pytest.raises(MoneyParseError):
+        parse_money("1.23 €", "de_DE")
+
+
+def test_parse_money_default_currency():
+    assert parse_money("1,234.5", "en_US", default_currency="usd") == Money(
+        "1234.5", "USD"
+    )
+    assert parse_money("€5", "en_US", default_currency="USD") == Money(5, "EUR")
+    with pytest.raises(MoneyParseError, match="no currency"):
+        parse_money("1,234.5", "en_US")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "USD",
+        "1,2,3.4.5 USD",
+        "$5 EUR",
+        "--5 USD",
+        "(-5 USD)",
+        "(5 USD",
+        "5 XYZ",
+        "1,23 USD",
+        "1,2345 USD",
+        "12,34,567 USD",
+    ],
+)
+def test_parse_money_errors(text):
+    with pytest.raises(MoneyParseError):
+        parse_money(text, "en_US")
+
+
+def test_parse_money_reuses_parsers():
+    get_parser.cache_clear()
+    parse_money("$1", "en_US")
+    parse_money("$2", "en_US")
+    assert get_parser.cache_info().misses == 1
@@ -1,22 +1,62 @@
+import copy
+import decimal
+import pickle
 import warnings
-from copy import deepcopy
 from decimal import Decimal
+from fractions import Fraction
+from typing import TYPE_CHECKING, Callable, List, Union
 
 import pytest  # Works with less code, more consistency than unittest.
 from babel.core import get_global
 
+from moneyed import classes
 from moneyed.classes import (
     CURRENCIES,
+    CURRENCIES_BY_ISO,
     USD,
     Currency,
+    CurrencyDoesNotExist,
+    MinorUnitMoney,
     Money,
     MoneyComparisonError,
+    add_currency,
+    allocate_many,
     force_decimal,
+    get_currencies_by_country,
     get_currencies_of_country,
     get_currency,
+    get_currency_or_none,
     list_all_currencies,
+    money_sort_key,
+    round_many,
 )
 
+if TYPE_CHECKING:
+    from moneyed.classes import Ratio
+
+
+# [Money('1.50', 'USD'), USD] as pickled by version 3.0, with protocols 0 and 2,
+# from before Money and Currency declared __slots__.
+PICKLES_3_0 = [
+    b"(lp0\nccopy_reg\n_reconstructor\np1\n(cmoneyed.classes\nMoney\np2\n"
+    b"c__builtin__\nobject\np3\nNtp4\nRp5\n(dp6\nVamount\np7\ncdecimal\n"
+    b"Decimal\np8\n(V1.50\np9\ntp10\nRp11\nsVcurrency\np12\ng1\n"
+    b"(cmoneyed.classes\nCurrency\np13\ng3\nNtp14\nRp15\n(dp16\nVcode\np17\n"
+    b"VUSD\np18\nsVnumeric\np19\nV840\np20\nsVsub_unit\np21\nI100\nsV_name\n"
+    b"p22\nNsV_countries\np23\nNsVname\np24\nVUS Dollar\np25\nsVzero\np26\ng1\n"
+    b"(g2\ng3\nNtp27\nRp28\n(dp29\ng7\ng8\n(V0\np30\ntp31\nRp32\nsg12\ng15\n"
+    b"sbsbsbag15\na.",
+    b"\x80\x02]q\x00(cmoneyed.classes\nMoney\nq\x01)\x81q\x02}q\x03(X\x06\x00"
+    b"\x00\x00amountq\x04cdecimal\nDecimal\nq\x05X\x04\x00\x00\x001.50q\x06\x85"
+    b"q\x07Rq\x08X\x08\x00\x00\x00currencyq\tcmoneyed.classes\nCurrency\nq\n)"
+    b"\x81q\x0b}q\x0c(X\x04\x00\x00\x00codeq\rX\x03\x00\x00\x00USDq\x0eX\x07"
+    b"\x00\x00\x00numericq\x0fX\x03\x00\x00\x00840q\x10X\x08\x00\x00\x00"
+    b"sub_unitq\x11KdX\x05\x00\x00\x00_nameq\x12NX\n\x00\x00\x00_countriesq"
+    b"\x13NX\x04\x00\x00\x00nameq\x14X\t\x00\x00\x00US Dollarq\x15X\x04\x00"
+    b"\x00\x00zeroq\x16h\x01)\x81q\x17}q\x18(h\x04h\x05X\x01\x00\x00\x000q"
+    b"\x19\x85q\x1aRq\x1bh\th\x0bubububh\x0be.",
+]
+
 
 class CustomDecimal(Decimal):
     """Test class to ensure Decimal.__str__ is not
@@ -72,9 +112,10 @@ class TestCurrency:
 
     def test_hash(self) -> None:
         assert self.instance in {self.instance}
+        assert hash(self.instance) == hash(Currency("CHF")) == hash("CHF")
 
     def test_compare(self) -> None:
-        other = deepcopy(self.instance)
+        other = Currency(code="CHF", numeric="756", sub_unit=100)
         # equality
         assert self.instance == CURRENCIES["CHF"]
         assert self.instance == other
@@ -88,12 +129,104 @@ class TestCurrency:
         assert get_currency(iso="840") == USD
         assert get_currency(iso=840) == USD
 
+    @pytest.mark.parametrize("code", ["USD", "usd", "Usd", "840"])
+    def test_get_currency_or_none(self, code: str) -> None:
+        assert get_currency_or_none(code) is USD
+
+    @pytest.mark.parametrize("code", ["XYZ", "xyz", "000", ""])
+    def test_get_currency_or_none_unknown(self, code: str) -> None:
+        assert get_currency_or_none(code) is None
+
+    def test_get_currency_or_none_numeric_int(self) -> None:
+        assert get_currency_or_none(840) is USD
+
+    def test_add_currency_updates_lookup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(classes, "CURRENCIES", dict(CURRENCIES))
+        monkeypatch.setattr(classes, "CURRENCIES_BY_ISO", dict(CURRENCIES_BY_ISO))
+        monkeypatch.setattr(classes, "_currency_lookup", dict(classes._currency_lookup))
+        monkeypatch.setattr(classes, "_ordinals", dict(classes._ordinals))
+        currency = add_currency("XYZ", "000")
+        assert get_currency_or_none("xyz") is currency
+        assert get_currency_or_none("000") is currency
+        assert Money(1, "xyz").currency is currency
+
+    def test_ordinal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(classes, "CURRENCIES", dict(CURRENCIES))
+        monkeypatch.setattr(classes, "CURRENCIES_BY_ISO", dict(CURRENCIES_BY_ISO))
+        monkeypatch.setattr(classes, "_currency_lookup", dict(classes._currency_lookup))
+        monkeypatch.setattr(classes, "_ordinals", dict(classes._ordinals))
+        ordinals = [currency.ordinal for currency in CURRENCIES.values()]
+        assert sorted(ordinals) == list(range(len(ordinals)))  # type: ignore[type-var]
+        assert Currency("EUR").ordinal == get_currency("EUR").ordinal
+        assert Currency("XYZ").ordinal is None
+        currency = add_currency("XYZ", None)
+        assert currency.ordinal == len(ordinals)
+        assert add_currency("XYZ", None).ordinal == currency.ordinal
+        eur = get_currency("EUR")
+        assert add_currency("EUR", "978", 100, eur.name).ordinal == eur.ordinal
+
     def test_get_currencies_of_country(self) -> None:
         assert get_currencies_of_country("IN")[0] == Currency("INR")
         assert get_currencies_of_country("iN")[0] == Currency("INR")
         assert get_currencies_of_country("BT") == [Currency("BTN"), Currency("INR")]
         assert get_currencies_of_country("XX") == []
 
+    def test_get_currencies_by_country(self) -> None:
+        index = get_currencies_by_country()
+        assert index["BT"] == (Currency("BTN"), Currency("INR"))
+        assert index["SE"] == (CURRENCIES["SEK"],)
+        assert index["SE"][0] is CURRENCIES["SEK"]
+        assert "XX" not in index
+        assert get_currencies_by_country() is index
+        with pytest.raises(TypeError):
+            index["XX"] = ()  # type: ignore[index]
+
+    def test_get_currencies_by_country_after_add_currency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Register the currency in a copy of the registry, and restore the index
+        # built from the real registry afterwards.
+        registry = dict(CURRENCIES)
+        del registry["SEK"]
+        monkeypatch.setattr(classes, "CURRENCIES", registry)
+        monkeypatch.setattr(classes, "_currency_lookup", {})
+        monkeypatch.setattr(classes, "_currencies_by_country", None)
+        assert "SE" not in get_currencies_by_country()
+        sek = add_currency("SEK", None, 100)
+        assert get_currencies_by_country()["SE"] == (sek,)
+
+    def test_has_no_instance_dict(self) -> None:
+        currency = Currency("SEK")
+        assert not hasattr(currency, "__dict__")
+        assert currency.name == "Swedish Krona"
+        assert currency.name is currency.name
+        assert currency.country_codes == ["SE"]
+        assert currency.countries == ["SWEDEN"]
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_registered(self, protocol: int) -> None:
+        chf = self.instance
+        chf.name
+        data = pickle.dumps(chf, protocol=protocol)
+        assert pickle.loads(data) is chf
+        assert b"Swiss" not in data
+
+    def test_pickle_unregistered(self) -> None:
+        currency = Currency("XYZ", "000", 1000, name="Test", countries=["NOWHERE"])
+        currency.name
+        unpickled = pickle.loads(pickle.dumps(currency))
+        assert unpickled is not currency
+        assert unpickled == currency
+        assert (unpickled.numeric, unpickled.sub_unit) == ("000", 1000)
+        assert (unpickled.name, unpickled.countries) == ("Test", ["NOWHERE"])
+
+    def test_copy_returns_self(self) -> None:
+        currency = Currency("XYZ")
+        assert copy.copy(self.instance) is self.instance
+        assert copy.deepcopy(self.instance) is self.instance
+        assert copy.copy(currency) is currency
+        assert copy.deepcopy([currency])[0] is currency
+
     def test_zero_property(self) -> None:
         assert USD.zero == Money(0, "USD")
         assert USD.zero is USD.zero
@@ -118,6 +251,24 @@ class TestMoney:
         assert one_million_dollars.amount == self.one_million_decimal
         assert one_million_dollars.currency == self.USD
 
+    @pytest.mark.parametrize("code", ["USD", "usd", "uSd", "840"])
+    def test_init_currency_spellings(self, code: str) -> None:
+        assert Money(1, code).currency is self.USD
+
+    def test_init_unknown_currency(self) -> None:
+        with pytest.raises(CurrencyDoesNotExist):
+            Money(1, "xyz")
+
+    def test_init_numeric_currency_int(self) -> None:
+        assert Money(1, 840).currency is self.USD  # type: ignore[call-overload]
+        assert Money.intern(1, 840).currency is self.USD  # type: ignore[arg-type]
+
+    def test_init_unhashable_currency(self) -> None:
+        with pytest.raises(CurrencyDoesNotExist):
+            Money(1, ["x"])  # type: ignore[call-overload]
+        with pytest.raises(CurrencyDoesNotExist):
+            Money.intern(1, ["x"])  # type: ignore[arg-type]
+
     def test_init_omit_currency(self) -> None:
         with pytest.raises(
             TypeError,
@@ -125,6 +276,48 @@ class TestMoney:
         ):
             Money(amount=self.one_million_decimal)  # type: ignore
 
+    def test_intern(self) -> None:
+        price = Money.intern("9.99", "USD")
+        assert price == Money("9.99", "USD")
+        assert Money.intern("9.99", "usd") is price
+        assert Money.intern("9.99", self.USD) is price
+        assert Money.intern(Decimal("9.99"), "USD") == price
+        assert Money.intern(Decimal("9.99"), "USD") is Money.intern(
+            Decimal("9.99"), "USD"
+        )
+        assert Money.intern(9.99, "USD") is Money.intern(Decimal("9.99"), "USD")
+        assert Money.intern("9.99", "EUR") is not Money.intern("9.99", "USD")
+
+    @pytest.mark.parametrize(
+        ("amount", "other"),
+        [
+            (Decimal("1.5"), Decimal("1.50")),
+            (Decimal("0"), Decimal("-0")),
+            ("1.5", "1.50"),
+            (Decimal("10"), Decimal("1E+1")),
+        ],
+    )
+    def test_intern_keeps_representation(self, amount: object, other: object) -> None:
+        assert Money.intern(amount, "USD") is not Money.intern(other, "USD")
+        assert repr(Money.intern(other, "USD")) == repr(Money(other, "USD"))
+
+    def test_intern_subclass(self) -> None:
+        minor = MinorUnitMoney.intern("9.99", "USD")
+        assert type(minor) is MinorUnitMoney
+        assert minor is MinorUnitMoney.intern("9.99", "USD")
+        assert minor is not Money.intern("9.99", "USD")
+
+    def test_intern_is_bounded(self) -> None:
+        first = Money.intern(-1, "USD")
+        for amount in range(classes.INTERN_CACHE_SIZE):
+            Money.intern(amount, "USD")
+        assert classes._interned.cache_info().currsize == classes.INTERN_CACHE_SIZE
+        assert Money.intern(-1, "USD") is not first
+
+    def test_intern_unknown_currency(self) -> None:
+        with pytest.raises(CurrencyDoesNotExist):
+            Money.intern(1, "xyz")
+
     def test_init_float(self) -> None:
         one_million_dollars = Money(amount=1000000.0, currency="PEN")
         assert one_million_dollars.amount == self.one_million_decimal
@@ -140,6 +333,11 @@ class TestMoney:
         m = Money("1000", "USD")
         assert m == eval(repr(m))
 
+    def test_has_no_instance_dict(self) -> None:
+        assert not hasattr(self.one_million_bucks, "__dict__")
+        with pytest.raises(AttributeError):
+            self.one_million_bucks.foo = "bar"  # type: ignore[attr-defined]
+
     def test_str(self) -> None:
         # Conversion to text use default locale, so results vary
         # depending on system setup. Just assert that we don't crash.
@@ -147,6 +345,17 @@ class TestMoney:
 
     def test_hash(self) -> None:
         assert self.one_million_bucks in {self.one_million_bucks}
+        assert hash(self.one_million_bucks) == hash(self.one_million_bucks)
+        assert hash(self.one_million_bucks) == hash(
+            Money("1000000.00", Currency("USD"))
+        )
+        assert len({Money(1, "USD"), Money("1.0", "USD"), Money(1, "EUR")}) == 2
+
+    def test_hash_is_not_pickled(self) -> None:
+        money = Money(1, "USD")
+        hash(money)
+        assert pickle.loads(pickle.dumps(money)) == money
+        assert "_hash" not in money.__reduce__()[2][1]
 
     def test_add(self) -> None:
         assert self.one_million_bucks + self.one_million_bucks == Money(
@@ -292,6 +501,46 @@ class TestMoney:
         with pytest.raises(MoneyComparisonError):
             assert self.one_million_bucks > x
 
+    def test_le_ge(self) -> None:
+        x = Money(amount=1, currency=self.USD)
+        assert x <= self.one_million_bucks
+        assert x <= Money(amount="1.00", currency=self.USD)
+        assert not self.one_million_bucks <= x
+        assert self.one_million_bucks >= x
+        assert x >= Money(amount="1.00", currency=self.USD)
+        assert not x >= self.one_million_bucks
+
+    @pytest.mark.parametrize("cls", [Money, MinorUnitMoney])
+    def test_compare_different_currencies(self, cls: "type[Money]") -> None:
+        x = cls(amount=1, currency=self.USD)
+        y = cls(amount=1, currency="EUR")
+        for operation in ("__lt__", "__le__", "__gt__", "__ge__"):
+            with pytest.raises(TypeError, match="different currencies"):
+                getattr(x, operation)(y)
+            with pytest.raises(MoneyComparisonError):
+                getattr(x, operation)(1)
+
+    def test_sort_key(self) -> None:
+        eur = get_currency("EUR")
+        moneys = [
+            Money(2, self.USD),
+            MinorUnitMoney(3, eur),
+            Money(-1, self.USD),
+            Money(1, eur),
+        ]
+        expected = [moneys[3], moneys[1], moneys[2], moneys[0]]
+        if eur.ordinal > self.USD.ordinal:  # type: ignore[operator]
+            expected = expected[2:] + expected[:2]
+        assert sorted(moneys, key=money_sort_key) == expected
+
+    def test_sort_key_unregistered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(classes, "_ordinals", dict(classes._ordinals))
+        ordinal = len(classes._ordinals)
+        currency = Currency("XYZ")
+        assert money_sort_key(Money(1, currency)) == (ordinal, Decimal(1))
+        assert currency.ordinal == ordinal
+        assert Currency("XYZ").ordinal == currency.ordinal
+
     def test_abs(self) -> None:
         abs_money = Money(amount=1, currency=self.USD)
         x = Money(amount=-1, currency=self.USD)
@@ -386,6 +635,79 @@ class TestMoney:
         assert force_decimal("53.55") == Decimal("53.55")
         assert force_decimal(53) == Decimal("53")
         assert force_decimal(Decimal("53.55")) == Decimal("53.55")
+        assert force_decimal(10**30 + 1) == Decimal("1000000000000000000000000000001")
+        assert force_decimal(1.1) == Decimal("1.1")
+
+    def test_from_decimal(self) -> None:
+        money = Money._from_decimal(Decimal("1.50"), self.USD)
+        assert type(money) is Money
+        assert money == Money("1.50", self.USD)
+        assert repr(money) == "Money('1.50', 'USD')"
+
+    def test_from_decimal_calls_overridden_init(self) -> None:
+        money = TaggedMoney._from_decimal(Decimal(1), self.USD)
+        assert money.tag == "default"
+        assert (-money).tag == "default"
+
+    @pytest.mark.parametrize("cls", [Money, MinorUnitMoney])
+    def test_pickle(self, cls: "type[Money]") -> None:
+        money = cls("12.50", "USD")
+        unpickled = pickle.loads(pickle.dumps(money))
+        assert type(unpickled) is cls
+        assert unpickled == money
+        assert unpickled.currency is money.currency
+        assert str(unpickled.amount) == "12.50"
+
+    def test_pickle_many_shares_currency(self) -> None:
+        moneys = [Money(i, "USD") for i in range(100)]
+        unpickled = pickle.loads(pickle.dumps(moneys))
+        assert unpickled == moneys
+        assert all(money.currency is USD for money in unpickled)
+        assert len(pickle.dumps(moneys)) < 100 * len(pickle.dumps(moneys[1]))
+
+    def test_pickle_subclass_state(self) -> None:
+        money = TaggedMoney("1", "USD", tag="fee")
+        unpickled = pickle.loads(pickle.dumps(money))
+        assert type(unpickled) is TaggedMoney
+        assert unpickled == money
+        assert unpickled.tag == "fee"
+
+    @pytest.mark.parametrize("data", PICKLES_3_0)
+    def test_unpickle_3_0(self, data: bytes) -> None:
+        money, currency = pickle.loads(data)
+        assert money == Money("1.50", "USD")
+        assert str(money.amount) == "1.50"
+        assert currency == USD
+        assert money.currency is currency
+        assert (currency.numeric, currency.sub_unit) == ("840", 100)
+        assert currency.name == "US Dollar"
+        assert currency.ordinal == USD.ordinal
+        assert hash(currency) == hash(USD)
+
+    def test_unpickle_3_0_subclass_state(self) -> None:
+        money = TaggedMoney.__new__(TaggedMoney)
+        money.__setstate__({"amount": Decimal(1), "currency": USD, "tag": "fee"})
+        assert money == Money(1, "USD")
+        assert money.tag == "fee"
+
+    def test_copy_returns_self(self) -> None:
+        money = Money("1.50", "USD")
+        assert copy.copy(money) is money
+        assert copy.deepcopy(money) is money
+        minor = MinorUnitMoney("1.50", "USD")
+        assert copy.copy(minor) is minor
+
+    def test_copy_subclass_state(self) -> None:
+        money = TaggedMoney("1", "USD", tag="fee")
+        money.tags = ["a"]  # type: ignore[attr-defined]
+        copied = copy.copy(money)
+        assert copied is not money
+        assert (copied, copied.tag) == (money, "fee")
+        assert copied.tags is money.tags  # type: ignore[attr-defined]
+        deep = copy.deepcopy(money)
+        assert (deep, deep.tag) == (money, "fee")
+        assert deep.tags == ["a"]  # type: ignore[attr-defined]
+        assert deep.tags is not money.tags  # type: ignore[attr-defined]
 
     def test_decimal_doesnt_use_str_when_multiplying(self) -> None:
         m = Money("531", "GBP")
@@ -400,11 +722,285 @@ class TestMoney:
         assert result == Money("4.875", "GBP")
 
 
+class TestRoundToCurrency:
+    @pytest.mark.parametrize(
+        ("amount", "currency", "expected"),
+        [
+            ("1.125", "USD", "1.12"),
+            ("1.135", "USD", "1.14"),
+            ("-1.125", "USD", "-1.12"),
+            ("1", "USD", "1.00"),
+            ("12.5", "JPY", "12"),
+            ("1.2345", "BHD", "1.234"),
+            ("0.00005", "CLF", "0.0000"),
+        ],
+    )
+    def test_round_to_currency(self, amount: str, currency: str, expected: str) -> None:
+        rounded = Money(amount, currency).round_to_currency()
+        assert rounded == Money(expected, currency)
+        assert str(rounded.amount) == expected
+
+    @pytest.mark.parametrize(
+        ("rounding", "expected"),
+        [
+            (decimal.ROUND_HALF_UP, "1.13"),
+            (decimal.ROUND_HALF_EVEN, "1.12"),
+            (decimal.ROUND_DOWN, "1.12"),
+            (decimal.ROUND_UP, "1.13"),
+            (decimal.ROUND_FLOOR, "1.12"),
+            (decimal.ROUND_CEILING, "1.13"),
+        ],
+    )
+    def test_rounding_modes(self, rounding: str, expected: str) -> None:
+        assert Money("1.125", "EUR").round_to_currency(rounding) == Money(
+            expected, "EUR"
+        )
+
+    def test_uses_context_rounding(self) -> None:
+        with decimal.localcontext() as ctx:
+            ctx.rounding = decimal.ROUND_HALF_UP
+            assert Money("1.125", "EUR").round_to_currency() == Money("1.13", "EUR")
+
+    @pytest.mark.parametrize(
+        ("amount", "currency", "expected"),
+        [
+            ("1.12", "CHF", "1.10"),
+            ("1.13", "CHF", "1.15"),
+            ("-1.13", "CHF", "-1.15"),
+            ("1.26", "DKK", "1.50"),
+            ("1.5", "SEK", "2"),
+            ("1.123", "USD", "1.12"),
+            ("12.5", "JPY", "12"),
+        ],
+    )
+    def test_cash(self, amount: str, currency: str, expected: str) -> None:
+        rounded = Money(amount, currency).round_to_currency(cash=True)
+        assert rounded == Money(expected, currency)
+        assert str(rounded.amount) == expected
+
+    def test_cash_rounding_mode(self) -> None:
+        money = Money("1.125", "CHF")
+        assert money.round_to_currency(decimal.ROUND_UP, cash=True) == Money(
+            "1.15", "CHF"
+        )
+        assert money.round_to_currency(decimal.ROUND_DOWN, cash=True) == Money(
+            "1.10", "CHF"
+        )
+
+    def test_quantizers_are_cached(self) -> None:
+        chf = CURRENCIES["CHF"]
+        assert chf.quantizer == Decimal("0.01")
+        assert chf.quantizer is chf.quantizer
+        assert chf.cash_increment == Decimal("0.05")
+        assert chf.cash_increment is chf.cash_increment
+        assert CURRENCIES["JPY"].quantizer == 1
+        assert CURRENCIES["USD"].cash_increment == Decimal("0.01")
+
+    def test_keeps_type(self) -> None:
+        rounded = MinorUnitMoney("1.13", "CHF").round_to_currency(cash=True)
+        assert type(rounded) is MinorUnitMoney
+        assert rounded == Money("1.15", "CHF")
+
+    def test_round_many(self) -> None:
+        moneys = [Money("1.125", "USD"), Money("1.13", "CHF"), Money("0.5", "JPY")]
+        assert list(round_many(moneys, decimal.ROUND_HALF_UP)) == [
+            Money("1.13", "USD"),
+            Money("1.13", "CHF"),
+            Money("1", "JPY"),
+        ]
+        assert list(round_many(moneys, cash=True)) == [
+            money.round_to_currency(cash=True) for money in moneys
+        ]
+
+
+class TestAllocate:
+    @pytest.mark.parametrize(
+        ("amount", "ratios", "expected"),
+        [
+            ("10.00", [1, 1, 1], ["3.34", "3.33", "3.33"]),
+            ("0.05", [70, 30], ["0.04", "0.01"]),
+            ("100", [1], ["100"]),
+            ("0.01", [1, 1, 1], ["0.01", "0", "0"]),
+            ("1.00", [0, 1, 0, 1], ["0", "0.50", "0", "0.50"]),
+            ("-10.00", [1, 1, 1], ["-3.34", "-3.33", "-3.33"]),
+            ("10.00", [Decimal("0.5"), Fraction(1, 3), "1/6"], ["5", "3.33", "1.67"]),
+            ("1.00", [0.2, 0.8], ["0.20", "0.80"]),
+        ],
+    )
+    def test_allocate(
+        self, amount: str, ratios: List["Ratio"], expected: List[str]
+    ) -> None:
+        shares = Money(amount, "USD").allocate(ratios)
+        assert shares == [Money(share, "USD") for share in expected]
+        assert sum(shares) == Money(amount, "USD")
+
+    def test_largest_remainder(self) -> None:
+        # 100 split 3:3:4 is 30, 30, 40 exactly; 101 leaves one cent for the
+        # share with the largest remainder, the last one.
+        assert Money("1.01", "EUR").allocate([3, 3, 4]) == [
+            Money("0.30", "EUR"),
+            Money("0.30", "EUR"),
+            Money("0.41", "EUR"),
+        ]
+
+    def test_uses_currency_sub_unit(self) -> None:
+        assert Money(10, "JPY").allocate([1, 2]) == [Money(3, "JPY"), Money(7, "JPY")]
+        assert Money("1.000", "BHD").allocate([1, 2]) == [
+            Money("0.333", "BHD"),
+            Money("0.667", "BHD"),
+        ]
+
+    def test_keeps_type(self) -> None:
+        shares = MinorUnitMoney("1.00", "USD").allocate([1, 1])
+        assert [type(share) for share in shares] == [MinorUnitMoney, MinorUnitMoney]
+        assert shares == [Money("0.50", "USD"), Money("0.50", "USD")]
+
+    def test_not_representable(self) -> None:
+        with pytest.raises(ValueError, match="cannot be represented in minor units"):
+            Money("0.001", "USD").allocate([1, 1])
+
+    @pytest.mark.parametrize(
+        ("ratios", "message"),
+        [
+            ([], "sum to zero"),
+            ([0, 0], "sum to zero"),
+            ([1, -1], "negative ratios"),
+            (["abc"], "Invalid literal"),
+        ],
+    )
+    def test_invalid_ratios(self, ratios: List["Ratio"], message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            Money(1, "USD").allocate(ratios)
+
+    def test_allocate_many(self) -> None:
+        moneys = [Money("10.00", "USD"), Money(5, "JPY"), MinorUnitMoney("1", "EUR")]
+        result = list(allocate_many(moneys, [1, 1, 1]))
+        assert result == [money.allocate([1, 1, 1]) for money in moneys]
+        assert type(result[2][0]) is MinorUnitMoney
+
+    def test_allocate_many_accepts_iterator_ratios(self) -> None:
+        result = allocate_many([Money(1, "USD"), Money(2, "USD")], iter([1, 3]))
+        assert list(result) == [
+            [Money("0.25", "USD"), Money("0.75", "USD")],
+            [Money("0.50", "USD"), Money("1.50", "USD")],
+        ]
+
+
+PARITY_AMOUNTS = [
+    ("0", "USD"),
+    ("1234.56", "USD"),
+    ("-0.01", "USD"),
+    ("300", "JPY"),
+    ("-12.345", "BHD"),
+    ("0.0001", "CLF"),
+]
+
+
+class TestMinorUnitMoney:
+    """
+    MinorUnitMoney must behave like the Decimal based Money for amounts that are
+    whole minor units.
+    """
+
+    @pytest.mark.parametrize(("amount", "currency"), PARITY_AMOUNTS)
+    def test_parity(self, amount: str, currency: str) -> None:
+        money = Money(amount, currency)
+        minor = MinorUnitMoney(amount, currency)
+        other = Money("7", currency)
+        minor_other = MinorUnitMoney("7", currency)
+
+        assert minor == money
+        assert money == minor
+        assert hash(minor) == hash(money)
+        assert minor.amount == money.amount
+        assert minor.get_amount_in_sub_unit() == money.get_amount_in_sub_unit()
+        assert bool(minor) == bool(money)
+        assert +minor == +money
+        assert -minor == -money
+        assert abs(minor) == abs(money)
+        assert minor + minor_other == money + other
+        assert minor - minor_other == money - other
+        assert minor + other == money + other
+        assert sum([minor, minor_other]) == sum([money, other])
+        assert minor * 3 == money * 3
+        assert 3 * minor == 3 * money
+        assert minor / minor_other == money / other
+        assert (minor < minor_other) == (money < other)
+        assert (minor <= minor_other) == (money <= other)
+        assert (minor > minor_other) == (money > other)
+        assert (minor >= minor_other) == (money >= other)
+        assert minor.round(0) == money.round(0)
+
+    @pytest.mark.parametrize(("amount", "currency"), PARITY_AMOUNTS)
+    def test_arithmetic_keeps_type(self, amount: str, currency: str) -> None:
+        minor = MinorUnitMoney(amount, currency)
+        for result in (-minor, abs(minor), minor + minor, minor - minor, minor * 2):
+            assert isinstance(result, MinorUnitMoney)
+
+    def test_from_minor_units(self) -> None:
+        minor = MinorUnitMoney.from_minor_units(1950, "usd")
+        assert minor.units == 1950
+        assert repr(minor) == "Money('19.50', 'USD')"
+        assert Money.from_minor_units(1950, USD) == minor
+        assert type(Money.from_minor_units(1950, USD)) is Money
+        assert repr(Money.from_minor_units(5, "JPY")) == "Money('5', 'JPY')"
+
+    def test_init_requires_minor_unit_precision(self) -> None:
+        with pytest.raises(ValueError, match="cannot be represented in minor units"):
+            MinorUnitMoney("0.001", "USD")
+
+    def test_init_omit_currency(self) -> None:
+        with pytest.raises(TypeError):
+            MinorUnitMoney(amount=1)  # type: ignore
+
+    def test_fractions_are_rounded_to_minor_units(self) -> None:
+        minor = MinorUnitMoney("0.05", "USD")
+        assert minor * Decimal("0.5") == MinorUnitMoney("0.02", "USD")
+        assert minor / 3 == MinorUnitMoney("0.02", "USD")
+
+    def test_mixed_with_money(self) -> None:
+        a = Money("0.01", "USD")
+        b = MinorUnitMoney("1.50", "USD")
+        assert a + b == b + a == Money("1.51", "USD")
+        assert a - b == -(b - a) == Money("-1.49", "USD")
+        for result in (a + b, b + a, b - a, a - b):
+            assert type(result) is MinorUnitMoney
+
+    def test_mixed_fractions_of_minor_units(self) -> None:
+        a = Money("0.005", "USD")
+        b = MinorUnitMoney("1.50", "USD")
+        operations: List[Callable[[], object]] = [
+            lambda: a + b,
+            lambda: b + a,
+            lambda: a - b,
+            lambda: b - a,
+        ]
+        for operation in operations:
+            with pytest.raises(
+                ValueError, match="cannot be represented in minor units of USD"
+            ):
+                operation()
+
+    def test_mismatched_currencies(self) -> None:
+        with pytest.raises(TypeError):
+            MinorUnitMoney(1, "USD") + MinorUnitMoney(1, "EUR")
+        with pytest.raises(TypeError):
+            MinorUnitMoney(1, "USD") < MinorUnitMoney(1, "EUR")
+
+
 class ExtendedMoney(Money):
     def do_my_behaviour(self) -> None:
         pass
 
 
+class TaggedMoney(Money):
+    def __init__(
+        self, amount: object, currency: Union[str, Currency], tag: str = "default"
+    ) -> None:
+        super().__init__(amount, currency)
+        self.tag = tag
+
+
 def test_all_babel_currencies() -> None:
     missing = sorted(set(get_global("all_currencies").keys()) - set(CURRENCIES.keys()))
     assert (
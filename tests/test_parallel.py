@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import pytest
+
+from moneyed.arrays import MoneyArray
+from moneyed.bag import MoneyBag
+from moneyed.classes import CURRENCIES, MinorUnitMoney, Money
+from moneyed.parallel import parallel_sum, parallel_totals
+
+USD = CURRENCIES["USD"]
+EUR = CURRENCIES["EUR"]
+JPY = CURRENCIES["JPY"]
+
+VALUES = [
+    Money("1.50", USD),
+    Money("2", EUR),
+    Money("-0.25", USD),
+    MinorUnitMoney("100", JPY),
+    Money("0.001", USD),
+    Money("3.10", EUR),
+    Money("7", USD),
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+class TestParallelTotals:
+    def test_money(self, workers: int) -> None:
+        totals = parallel_totals(VALUES, workers=workers, chunk_size=2)
+        assert totals == MoneyBag(VALUES)
+
+    def test_generator(self, workers: int) -> None:
+        totals = parallel_totals(
+            (money for money in VALUES), workers=workers, chunk_size=3
+        )
+        assert totals == MoneyBag(VALUES)
+
+    def test_array(self, workers: int) -> None:
+        values = [money for money in VALUES if money.amount != Decimal("0.001")]
+        totals = parallel_totals(MoneyArray(values), workers=workers, chunk_size=2)
+        assert totals.to_dict() == MoneyBag(values).to_dict()
+
+    def test_array_chunk_without_currency(self, workers: int) -> None:
+        values = MoneyArray([Money(1, USD), Money(2, USD), Money(3, EUR)])
+        totals = parallel_totals(values, workers=workers, chunk_size=2)
+        assert totals.to_dict() == {USD: Money(3, USD), EUR: Money(3, EUR)}
+
+    def test_empty(self, workers: int) -> None:
+        assert parallel_totals([], workers=workers) == MoneyBag()
+        assert parallel_totals(MoneyArray(), workers=workers) == MoneyBag()
+
+    def test_rejects_non_money(self, workers: int) -> None:
+        with pytest.raises(TypeError, match="Cannot add int"):
+            parallel_totals([Money(1, USD), 1], workers=workers)  # type: ignore[list-item]
+
+
+class TestParallelSum:
+    def test_sum(self) -> None:
+        values = [Money("1.10", USD)] * 10
+        assert parallel_sum(values, workers=2, chunk_size=3) == sum(values)
+
+    def test_array(self) -> None:
+        values = MoneyArray.from_minor_units(range(100), JPY)
+        assert parallel_sum(values, workers=2, chunk_size=30) == Money(4950, JPY)
+
+    def test_different_currencies(self) -> None:
+        with pytest.raises(TypeError, match="different currencies"):
+            parallel_sum(VALUES, workers=1)
+
+    def test_empty(self) -> None:
+        with pytest.raises(ValueError, match="empty"):
+            parallel_sum([], workers=1)
+        with pytest.raises(ValueError, match="empty"):
+            parallel_sum(MoneyArray.from_minor_units([], USD), workers=1)
+
+    @pytest.mark.parametrize(("workers", "chunk_size"), [(0, 10), (1, 0)])
+    def test_invalid_arguments(self, workers: int, chunk_size: int) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            parallel_sum([Money(1, USD)], workers=workers, chunk_size=chunk_size)
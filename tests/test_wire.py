@@ -0,0 +1,101 @@
+from array import array
+from decimal import Decimal
+
+import pytest
+
+from moneyed.classes import CURRENCIES, CurrencyDoesNotExist, MinorUnitMoney, Money
+from moneyed.wire import pack_many, unpack_many
+
+AMOUNTS = [
+    Money("1.50", "USD"),
+    Money("-0.01", "EUR"),
+    Money("0", "JPY"),
+    Money("300", "JPY"),
+    Money("1E+5", "GBP"),
+    Money("-12.345", "BHD"),
+    Money("1234567890123456789012345678901234567890.123456789", "USD"),
+]
+
+
+class TestToBytes:
+    @pytest.mark.parametrize("money", AMOUNTS, ids=repr)
+    def test_round_trip(self, money: Money) -> None:
+        decoded = Money.from_bytes(money.to_bytes())
+        assert decoded == money
+        # The exponent is kept, including trailing zeros.
+        assert str(decoded.amount) == str(money.amount)
+
+    def test_layout(self) -> None:
+        # Numeric code 840, exponent -2, zigzag encoded 150.
+        assert Money("1.50", "USD").to_bytes() == bytes([0x03, 0x48, 0xFE, 0xAC, 0x02])
+        assert Money("-1", "USD").to_bytes() == bytes([0x03, 0x48, 0x00, 0x01])
+
+    def test_from_bytes_keeps_type(self) -> None:
+        data = Money("1.50", "USD").to_bytes()
+        decoded = MinorUnitMoney.from_bytes(data)
+        assert type(decoded) is MinorUnitMoney
+        assert decoded == Money("1.50", "USD")
+
+    def test_from_memoryview(self) -> None:
+        data = bytearray(b"xx" + Money("1.50", "USD").to_bytes())
+        assert Money.from_bytes(memoryview(data)[2:]) == Money("1.50", "USD")
+
+    def test_no_numeric_code(self) -> None:
+        with pytest.raises(ValueError, match="has no numeric code"):
+            Money(1, "CNH").to_bytes()
+
+    def test_shared_numeric_code(self) -> None:
+        alk = CURRENCIES["ALK"]
+        assert CURRENCIES["ALL"].numeric == alk.numeric
+        with pytest.raises(ValueError, match="is used by another currency"):
+            Money(1, alk).to_bytes()
+
+    @pytest.mark.parametrize("amount", ["NaN", "Infinity", "1E+200", "1E-200"])
+    def test_amount_not_encodable(self, amount: str) -> None:
+        with pytest.raises(ValueError, match="cannot be encoded|out of range"):
+            Money(Decimal(amount), "USD").to_bytes()
+
+    def test_truncated(self) -> None:
+        data = Money("1234.56", "USD").to_bytes()
+        for end in range(len(data)):
+            with pytest.raises(ValueError, match="Truncated"):
+                Money.from_bytes(data[:end])
+
+    def test_trailing_data(self) -> None:
+        with pytest.raises(ValueError, match="Unexpected data"):
+            Money.from_bytes(Money(1, "USD").to_bytes() + b"\x00")
+
+    def test_unknown_numeric_code(self) -> None:
+        with pytest.raises(CurrencyDoesNotExist):
+            Money.from_bytes(bytes([0x00, 0x01, 0x00, 0x02]))
+
+
+class TestPackMany:
+    def test_round_trip(self) -> None:
+        data = pack_many(AMOUNTS)
+        assert data == b"".join(money.to_bytes() for money in AMOUNTS)
+        assert list(unpack_many(data)) == AMOUNTS
+
+    def test_empty(self) -> None:
+        assert pack_many([]) == b""
+        assert list(unpack_many(b"")) == []
+
+    def test_unpack_memoryview(self) -> None:
+        data = bytearray(pack_many(AMOUNTS))
+        assert list(unpack_many(memoryview(data))) == AMOUNTS
+        assert list(unpack_many(memoryview(data)[: len(AMOUNTS[0].to_bytes())])) == [
+            AMOUNTS[0]
+        ]
+
+    def test_unpack_buffer(self) -> None:
+        data = array("B", pack_many(AMOUNTS[:2]))
+        assert list(unpack_many(memoryview(data))) == AMOUNTS[:2]
+
+    def test_unpack_truncated(self) -> None:
+        data = pack_many(AMOUNTS[:2])
+        with pytest.raises(ValueError, match="Truncated"):
+            list(unpack_many(data[:-1]))
+
+    def test_pack_rejects_shared_numeric_code(self) -> None:
+        with pytest.raises(ValueError, match="is used by another currency"):
+            pack_many([Money(1, "USD"), Money(1, "ALK")])